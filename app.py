@@ -1,35 +1,77 @@
 # --- Standard library ---
+import itertools
+import json
 import logging
 import os
+import threading
 import uuid
 from decimal import Decimal, InvalidOperation
 from datetime import date, datetime
+from typing import Optional
 
 # --- Third-party libraries ---
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+import click
+from flask import Flask, Response, render_template, request, redirect, url_for, jsonify
 from werkzeug.utils import secure_filename
+from dateutil.relativedelta import relativedelta
 from dotenv import load_dotenv
 
 # --- Local modules ---
+from db import get_pool_stats
 from models.transaction import Transaction
+from models.beverage_report import BeverageReport
 from models.member import Member, Title
 from models.transaction_type import TransactionType
+from models.validators import normalize_email
+from services.bank_import import (
+    MemberMatcher,
+    build_import_preview,
+    credit_description,
+    parse_bank_statement
+)
+from services.balances_db import MEMBER_SORT_COLUMNS, load_debt_report, load_member_overview
 from services.beverage_db import save_beverage_report
+from services.bulk_import_db import (
+    import_members,
+    import_transactions,
+    iter_member_rows,
+    iter_transaction_import_rows
+)
+from services.job_queue import JobQueue, current_job_id
+from services.ledger_export import EXPORT_FORMATS
+from services.jobs_db import load_job, load_job_deliveries, record_job_delivery
+from services.ledger_db import rebuild_monthly_balances, verify_monthly_balances
 from services.logging_db import log_transaction_change, log_title_change, log_residency_change
-from services.members_db import load_member_by_email, load_all_members
-from services.reimbursements_db import save_reimbursement_items, update_bank_details
-from services.report_sender import send_report_email
+from services.members_db import (
+    load_member_by_email,
+    load_all_members,
+    load_members_with_debt,
+    normalize_member_emails
+)
+from services.reimbursements_db import load_bank_accounts, save_reimbursement_items, update_bank_details
+from services.report_sender import send_report_email, send_bulk_report_emails
+from services.fee_schedule_db import save_fee_rate
 from services.settings_loader import (
     get_admin_email,
     get_monthly_payment_for_residents,
-    get_monthly_payment_for_non_residents
+    get_monthly_payment_for_non_residents,
+    init_settings,
+    reload_settings
+)
+from services.monthly_payments import get_monthly_payment_overview
+from services.statistics import (
+    calculate_debt_trend,
+    calculate_debt_trend_breakdown,
+    calculate_monthly_debt_trend,
+    chart_data_hash,
+    get_debt_chart,
+    warm_up_charts
 )
-from services.monthly_payments import get_missing_monthly_payment_transactions
-from services.statistics import calculate_monthly_debt_trend, build_debt_chart
 from services.transactions_db import (
-    load_transactions_by_email,
+    iter_ledger_rows,
+    iter_transaction_rows,
     load_transaction_by_id,
-    load_transactions_by_type
+    load_transaction_keys
 )
 from services.beverage_loader import load_beverage_assortment
 
@@ -38,16 +80,38 @@ load_dotenv()
 EMAIL_SENDER = os.getenv("EMAIL_ADDRESS")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
 PHONE_NUMBER = os.getenv("PHONE_NUMBER")
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+SMTP_MAX_PER_MINUTE = int(os.getenv("SMTP_MAX_PER_MINUTE", "0"))
+SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "true").lower() != "false"
+
+# Background jobs (report emails) run on a local thread pool and are tracked in the jobs table
+job_queue = JobQueue(
+    max_workers=int(os.getenv("JOB_WORKERS", "2")),
+    max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+)
 TEMPLATE_PATH = "config/emails/balance_report.html"
 
+# Admin member list paging
+MEMBERS_PER_PAGE = 50
+MAX_MEMBERS_PER_PAGE = 200
+
 # Initialize the Flask application
 app = Flask(__name__)
 
+# Validate the settings (default monthly fees) at startup instead of on the first request using them
+init_settings()
+
 # Configure the uploads folder for saving receipts
 UPLOAD_FOLDER = "uploads"
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
+# Matplotlib is loaded lazily on the first chart request; CHART_WARMUP=true loads it
+# in the background right after startup instead
+if os.getenv("CHART_WARMUP", "false").lower() == "true":
+    threading.Thread(target=warm_up_charts, name="chart-warmup", daemon=True).start()
+
 
 @app.route('/', methods=['GET'])
 def home():
@@ -71,7 +135,7 @@ def dashboard():
     email = request.form.get("email") if request.method == "POST" else request.args.get("email")
     if not email:
         return "[!] No email provided.", 400
-    email = email.strip().lower()
+    email = normalize_email(email)
 
     # Redirect admin user to "admin panel"
     if email == get_admin_email():
@@ -83,9 +147,9 @@ def dashboard():
     except ValueError:
         return f"[!] No member found with this email: {email}", 404
 
-    # Calculate balance and fetch transactions
-    member.balance = member.get_balance()
+    # Fetch transactions once and calculate the balance from the cached ledger
     member.transactions = member.get_transactions()
+    member.balance = member.get_balance()
 
     # Render the member dashboard
     return render_template("dashboard.html", member=member)
@@ -99,7 +163,7 @@ def reimbursement_form(email):
     GET: Load member data by email and render a form pre-filled with name and date.
     """
     # Load the member from the database
-    member = load_member_by_email(email)
+    member = load_member_by_email(normalize_email(email))
     if not member:
         return "Mitglied nicht gefunden", 404
 
@@ -125,7 +189,7 @@ def submit_reimbursement():
     - Redirect to the member's dashboard
     """
     # Retrieve basic form fields
-    email = request.form.get("email")
+    email = normalize_email(request.form.get("email"))
     refund_type = request.form.get("refund_type")
     bank_name = request.form.get("bank_name")
     iban = request.form.get("iban")
@@ -177,36 +241,48 @@ def submit_reimbursement():
 @app.route("/admin", methods=["GET"])
 def admin_panel():
     """
-    Display the admin dashboard with a table of all members.
+    Display the admin dashboard with one page of the member table.
 
-    GET: Render a sorted list of all members.
+    GET: Sort (sort_by = balance, name, email or created_at; order = asc or desc),
+         filter (title; resident = 1 or 0; min_debt in €) and page (page, per_page)
+         the member list in a single database query.
     """
+    sort_by = request.args.get("sort_by", "balance")
+    if sort_by not in MEMBER_SORT_COLUMNS:
+        sort_by = "balance"
+    order = "desc" if request.args.get("order") == "desc" else "asc"
+
+    # Filters and page size are carried over into the sort and page links
+    filters = {key: request.args[key] for key in ("title", "resident", "min_debt", "per_page") if request.args.get(key)}
+    try:
+        page = max(int(request.args.get("page", 1)), 1)
+        per_page = min(max(int(filters.get("per_page", MEMBERS_PER_PAGE)), 1), MAX_MEMBERS_PER_PAGE)
+        min_debt = Decimal(filters["min_debt"].replace(",", ".")) if "min_debt" in filters else None
+    except (ValueError, InvalidOperation):
+        return "[!] Invalid filter or page parameter.", 400
+
     try:
-        members = load_all_members()
+        members, total = load_member_overview(
+            sort_by=sort_by,
+            descending=(order == "desc"),
+            title=filters.get("title"),
+            is_resident={"1": True, "0": False}.get(filters.get("resident")),
+            max_balance=-min_debt if min_debt is not None else None,
+            page=page,
+            per_page=per_page
+        )
     except Exception as e:
         return f"[!] Error loading members: {e}", 500
 
-    # Sort members by: balance (default), name, email or created_at
-    sort_by = request.args.get("sort_by", "balance")  # default: balance
-    order = request.args.get("order", "asc")
-
-    reverse = (order == "desc")
-
-    def sort_key(m):
-        if sort_by == "name":
-            return m.last_name.lower()
-        elif sort_by == "email":
-            return m.email.lower()
-        elif sort_by == "created_at":
-            return m.created_at
-        elif sort_by == "balance":
-            return m.get_balance()
-        return m.get_balance()  # fallback
-
-    sorted_members = sorted(members, key=sort_key, reverse=reverse)
+    # A page past the end (e.g. after filtering or deleting) is sent to the last page
+    pages = max(-(-total // per_page), 1)
+    if page > pages:
+        return redirect(url_for("admin_panel", sort_by=sort_by, order=order, page=pages, **filters))
 
     # Render the admin member list
-    return render_template("admin_members.html", members=sorted_members, sort_by=sort_by, order=order)
+    return render_template("admin_members.html", members=members, sort_by=sort_by, order=order,
+                           filters=filters, titles=[t.value for t in Title], total=total,
+                           page=page, pages=pages)
 
 
 @app.route("/admin/statistics", methods=["GET"])
@@ -214,8 +290,8 @@ def admin_statistics():
     """
     Display the admin statistics page showing members with significant debts.
 
-    GET: Load all members, compute balances and last credit date,
-         and display those with debts greater than 100€.
+    GET: Load current balance, balance on the selected date and last credit date
+         of all members with debts greater than 100€ in a single query.
     """
     # Parse the selected date from the query string (default = today)
     date_str = request.args.get("date", date.today().strftime("%d.%m.%Y"))
@@ -225,47 +301,102 @@ def admin_statistics():
         logging.warning(f"[!] Invalid date format received: {date_str}, falling back to today")
         reference_date = date.today()
 
-    # Attempt to load all members
+    # Aggregate balances and last top-ups of all members with debts above 100 € in one query
     try:
-        members = load_all_members()
+        debtors = load_debt_report(reference_date, threshold=Decimal("-100.00"))
     except Exception as e:
-        logging.error(f"[!] Error loading members for statistics: {e}")
-        members = []
+        logging.error(f"[!] Error loading debt report for statistics: {e}")
+        debtors = []
+
+    report_rows = [
+        {
+            "name": f"{row['title']} {row['last_name']}",
+            "current_debt": round(row["current_balance"], 2),
+            "debt_on_date": round(row["balance_on_date"], 2),
+            "last_topup": row["last_credit_date"].strftime("%d.%m.%Y") if row["last_credit_date"] else "–"
+        }
+        for row in debtors
+    ]
 
-    report_rows = []
+    return render_template(
+        "admin_statistics.html",
+        rows=report_rows,
+        selected_date=reference_date
+    )
 
-    for member in members:
-        current_balance = member.get_balance()
-        if current_balance >= -100:
-            continue
 
-        balance_on_date = member.get_balance_at(reference_date)
-        last_credit_date = member.get_last_credit_date()
-        last_credit_str = last_credit_date.strftime("%d.%m.%Y") if last_credit_date else "–"
+@app.route("/admin/statistics/debt_trend.json")
+def debt_trend_data():
+    """
+    Return the community debt trend as JSON for client-side charts.
 
-        report_rows.append({
-            "name": f"{member.get_title()} {member.last_name}",
-            "current_debt": round(current_balance, 2),
-            "debt_on_date": round(balance_on_date, 2),
-            "last_topup": last_credit_str
-        })
+    GET: Optional query parameters:
+         - start, end: range as "dd.mm.yyyy" (default: the last two years up to this month)
+         - granularity: "month" (default), "quarter" or "semester"
+         - breakdown: "title" or "residency" to add one series per member group
+         The response carries an ETag, so unchanged data is answered with 304.
+    """
+    today = date.today().replace(day=1)
+    try:
+        end = datetime.strptime(request.args["end"], "%d.%m.%Y").date() if request.args.get("end") else today
+        start = (datetime.strptime(request.args["start"], "%d.%m.%Y").date() if request.args.get("start")
+                 else end.replace(day=1) - relativedelta(years=2))
+    except ValueError:
+        return jsonify({"error": "Ungültiges Datum, erwartet TT.MM.JJJJ"}), 400
 
-    report_rows.sort(key=lambda r: r["current_debt"])
+    granularity = request.args.get("granularity", "month")
+    breakdown = request.args.get("breakdown")
 
-    # Build the debt chart (safely)
+    try:
+        labels, totals, deltas = calculate_debt_trend(start, end, granularity)
+        data = {"granularity": granularity, "labels": labels, "totals": totals, "deltas": deltas}
+
+        if breakdown:
+            _, series = calculate_debt_trend_breakdown(start, end, granularity, breakdown)
+            if breakdown == "residency":
+                series = {("resident" if group else "non_resident"): values for group, values in series.items()}
+            data["breakdown"] = {
+                str(group): {"totals": group_totals, "deltas": group_deltas}
+                for group, (group_totals, group_deltas) in sorted(series.items(), key=lambda item: str(item[0]))
+            }
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logging.error(f"[!] Error calculating debt trend: {e}")
+        return jsonify({"error": "Daten konnten nicht geladen werden"}), 500
+
+    response = jsonify(data)
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@app.route("/admin/statistics/debt_chart.png")
+def debt_chart():
+    """
+    Serve the debt trend chart as PNG image.
+
+    GET: The chart is rendered once per distinct data set and cached. The data
+         hash is sent as ETag, so browsers revalidate with If-None-Match and get
+         a 304 without any rendering while the ledger is unchanged.
+    """
     try:
         labels, totals, deltas = calculate_monthly_debt_trend()
-        chart_base64 = build_debt_chart(labels, totals, deltas)
+        etag = chart_data_hash(labels, totals, deltas)
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+        else:
+            etag, png = get_debt_chart(labels, totals, deltas)
+            response = app.response_class(png, mimetype="image/png")
     except Exception as e:
         logging.error(f"[!] Error generating debt chart: {e}")
-        chart_base64 = None
+        return jsonify({"error": "Diagramm konnte nicht erstellt werden"}), 500
 
-    return render_template(
-        "admin_statistics.html",
-        rows=report_rows,
-        selected_date=reference_date,
-        chart_base64=chart_base64
-    )
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 
 @app.route('/admin/add_member', methods=['GET', 'POST'])
@@ -277,7 +408,7 @@ def admin_add_member():
     POST: Validate and save the new member to the database.
     """
     if request.method == 'POST':
-        email = request.form.get("email", "").strip().lower()
+        email = normalize_email(request.form.get("email", ""))
         last_name = request.form.get("last_name", "").strip()
         first_name = request.form.get("first_name", "").strip()
         title = request.form.get("title", "F").strip()
@@ -331,26 +462,7 @@ def check_all_missing_monthly_payments():
     GET: For each member (except AH), load both existing and missing monthly payments
          and render an editable table grouped by member.
     """
-    members = load_all_members()
-
-    result = []
-
-    for member in members:
-        if member.title == "AH":
-            continue
-
-        existing = load_transactions_by_type(member.email, TransactionType.MONTHLY_FEE.value)
-
-        missing = get_missing_monthly_payment_transactions(member.email)
-
-        existing_sorted = sorted(existing, key=lambda t: t.date)
-        missing_sorted = sorted(missing, key=lambda t: t.date)
-
-        result.append({
-            "member": member,
-            "existing": existing_sorted,
-            "missing": missing_sorted
-        })
+    result = get_monthly_payment_overview()
 
     return render_template(
         "admin_missing_payments.html",
@@ -371,33 +483,116 @@ def save_missing_payments():
     data = request.get_json()
     transactions = data.get("transactions", [])
 
-    saved_count = 0
+    to_save = []
 
     for entry in transactions:
         try:
-            email = entry["email"]
+            email = normalize_email(entry["email"])
             date_str = entry["date"]
             amount = Decimal(entry["amount"])
 
             transaction_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             description = f"Aktivenbeitrag ({transaction_date.strftime('%B %Y')})"
 
-            tx = Transaction(
+            to_save.append(Transaction(
                 transaction_date=transaction_date,
                 description=description,
                 amount=-amount,
                 member_email=email,
                 transaction_type=TransactionType.MONTHLY_FEE
-            )
-
-            tx.save(changed_by=get_admin_email())
-            saved_count += 1
+            ))
 
         except Exception as e:
             print(f"[!] Fehler beim Speichern der Transaktion: {e}")
             continue
 
-    return jsonify({"success": True, "saved": saved_count})
+    # Save all valid transactions in one database transaction
+    try:
+        Transaction.save_many(to_save, changed_by=get_admin_email())
+    except Exception as e:
+        logging.error(f"[!] Fehler beim Speichern der Transaktionen: {e}")
+        return jsonify({"success": False, "saved": 0}), 500
+
+    return jsonify({"success": True, "saved": len(to_save)})
+
+
+@app.route("/admin/bank_import", methods=["GET", "POST"])
+def bank_import():
+    """
+    Import incoming payments from a bank statement.
+
+    GET: Show the upload form.
+    POST: Parse the uploaded CSV or CAMT (XML) statement, match each credit to a member
+          (by IBAN, email in the purpose, or payer name) and show the matches for review.
+          Credits that look already booked are marked and not preselected.
+    """
+    upload = request.files.get("statement")
+    if request.method == "GET" or not upload or not upload.filename:
+        return render_template("admin_bank_import.html", preview=None)
+
+    members = load_all_members()
+    matcher = MemberMatcher(members, load_bank_accounts())
+    try:
+        preview, skipped = build_import_preview(
+            parse_bank_statement(upload.filename, upload.stream),
+            matcher,
+            lambda start, end: load_transaction_keys(TransactionType.CREDIT.value, start, end)
+        )
+    except ValueError as e:
+        return render_template("admin_bank_import.html", preview=None, error=str(e)), 400
+
+    return render_template(
+        "admin_bank_import.html",
+        preview=preview,
+        skipped=skipped,
+        matched=sum(1 for entry in preview if entry["email"]),
+        members=sorted(members, key=lambda m: (m.last_name, m.first_name or "")),
+        credit_description=credit_description
+    )
+
+
+@app.route("/admin/bank_import/save", methods=["POST"])
+def save_bank_import():
+    """
+    Book the reviewed credits of a bank statement import.
+
+    POST: Accept a list of transactions (email, date, amount, description) and create them
+          as CREDIT transactions with one bulk insert. Nothing is saved if any entry is
+          invalid or names an unknown member.
+    Returns JSON response with success status and number of saved transactions.
+    """
+    data = request.get_json(silent=True) or {}
+    known_emails = {normalize_email(member.email) for member in load_all_members()}
+
+    to_save = []
+    for number, entry in enumerate(data.get("transactions", []), 1):
+        try:
+            email = normalize_email(entry["email"])
+            amount = Decimal(str(entry["amount"]))
+            transaction_date = datetime.strptime(entry["date"], "%Y-%m-%d").date()
+            description = str(entry.get("description") or "Überweisung").strip()[:200]
+        except (KeyError, TypeError, ValueError, InvalidOperation):
+            return jsonify({"success": False, "error": f"Eintrag {number} ist ungültig."}), 400
+        if email not in known_emails:
+            return jsonify({"success": False, "error": f"Unbekanntes Mitglied: {email}"}), 400
+        if not amount.is_finite() or amount <= 0:
+            return jsonify({"success": False, "error": f"Eintrag {number}: Betrag muss positiv sein."}), 400
+
+        to_save.append(Transaction(
+            transaction_date=transaction_date,
+            description=description,
+            amount=amount,
+            member_email=email,
+            transaction_type=TransactionType.CREDIT
+        ))
+
+    try:
+        Transaction.save_many(to_save, changed_by=get_admin_email())
+    except Exception as e:
+        logging.error(f"[!] Fehler beim Speichern der Gutschriften: {e}")
+        return jsonify({"success": False, "saved": 0}), 500
+
+    return jsonify({"success": True, "saved": len(to_save)})
 
 
 @app.route("/admin/beverage-report", methods=["GET", "POST"])
@@ -412,7 +607,12 @@ def beverage_report():
     """
     members = load_all_members()
     beverages = load_beverage_assortment()
-    return render_template("beverage_report.html", members=members, beverages=beverages)
+    return render_template(
+        "beverage_report.html",
+        members=members,
+        beverages=beverages,
+        beverage_prices=[beverage.to_dict() for beverage in beverages]
+    )
 
 
 @app.route("/submit-beverage-report", methods=["POST"])
@@ -421,10 +621,9 @@ def submit_beverage_report():
     Handle the submission of a beverage consumption report and create transactions.
 
     POST:
-    - Parse form data with member drink consumption
-    - Save the report and beverage prices to the database
-    - Calculate total cost per member
-    - Create and save a DRINKS transaction for each member
+    - Parse form data with member and event drink consumption into a BeverageReport
+    - Save the report, beverage prices and one DRINKS transaction per member
+      in a single database transaction
     - Redirect back to the beverage report page
     """
     form = request.form
@@ -442,47 +641,9 @@ def submit_beverage_report():
         logging.error("Invalid report date format")
         return redirect(url_for("beverage_report"))
 
-    # Load beverage assortment and build a price map
-    beverages = load_beverage_assortment()
-    beverage_map = {b["name"]: Decimal(str(b["price"])) for b in beverages}
-
-    # Save report and detailed consumption entries
-    save_beverage_report(form, beverages, report_date)
-
-    # Calculate the total amount per member
-    member_totals = {}
-
-    for key, values in form.items():
-        if "_" not in key or key.startswith("event_"):
-            continue
-
-        email, bev = key.split("_", 1)
-        if bev not in beverage_map:
-            continue
-
-        value_str = values.strip()
-        if not value_str.isdigit():
-            continue
-
-        count = int(value_str)
-        if count == 0:
-            continue
-
-        total = beverage_map[bev] * count
-        member_totals[email] = member_totals.get(email, Decimal("0.00")) + total
-
-    # Create one DRINKS transaction for each member
-    changed_by = get_admin_email()
-
-    for email, total in member_totals.items():
-        tx = Transaction(
-            transaction_date=report_date,
-            description=f"Getränkeabrechnung vom {report_date.strftime('%d.%m.%Y')}",
-            amount=-total,
-            member_email=email,
-            transaction_type=TransactionType.DRINKS
-        )
-        tx.save(changed_by=changed_by)
+    # Parse the form once; the same report is persisted and billed
+    report = BeverageReport.from_form(form, load_beverage_assortment(), report_date)
+    save_beverage_report(report, changed_by=get_admin_email())
 
     return redirect(url_for("beverage_report"))
 
@@ -538,7 +699,7 @@ def submit_fines():
     index = 0
 
     while f"fines[{index}][email]" in fines:
-        email = fines[f"fines[{index}][email]"][0].strip()
+        email = normalize_email(fines[f"fines[{index}][email]"][0])
         amount_str = fines[f"fines[{index}][amount]"][0].strip()
         reason = fines[f"fines[{index}][description]"][0].strip()
 
@@ -567,8 +728,7 @@ def submit_fines():
 
         index += 1
 
-    for fine in fines_list:
-        fine.save(changed_by=get_admin_email())
+    Transaction.save_many(fines_list, changed_by=get_admin_email())
 
     return redirect(url_for("admin_fines", success=1))
 
@@ -583,7 +743,7 @@ def admin_add_transaction():
     """
     if request.method == "POST":
         try:
-            email = request.form.get("email")
+            email = normalize_email(request.form.get("email"))
             date_str = request.form.get("date")
             description = request.form.get("description").strip()
             amount_str = request.form.get("amount", "0.00").strip().replace(",", ".")
@@ -626,7 +786,7 @@ def admin_add_transaction():
 
     # GET Request: Load data for the form
     members = load_all_members()
-    selected_email = request.args.get("email")
+    selected_email = normalize_email(request.args.get("email")) or None
     selected_member = None
 
     if selected_email:
@@ -668,7 +828,7 @@ def delete_transaction(email, transaction_id):
         transaction = load_transaction_by_id(transaction_id)
 
         # Ensure the transaction belongs to the member requesting the deletion
-        if transaction.member_email != email:
+        if transaction.member_email != normalize_email(email):
             return "[!] Email mismatch for transaction", 400
 
         # Delete transaction
@@ -725,7 +885,7 @@ def update_member_status():
     Returns a success message or an error message if any field is missing or invalid.
     """
     data = request.get_json()
-    email = data.get('email')
+    email = normalize_email(data.get('email'))
     new_title = data.get('title')
     new_resident = data.get('is_resident')
     changed_by = get_admin_email()
@@ -751,16 +911,111 @@ def update_member_status():
         return jsonify({'error': str(e)}), 500
 
 
+def send_report_job(payload: dict) -> dict:
+    """
+    Job handler: send the balance report to a single member.
+
+    Args:
+        payload (dict): {"email": member email}.
+
+    Returns:
+        dict: {"email": member email}.
+    """
+    member = load_member_by_email(payload["email"])
+    send_report_email(
+        member,
+        sender_email=EMAIL_SENDER,
+        sender_password=EMAIL_PASSWORD,
+        phone_number=PHONE_NUMBER,
+        template_path=TEMPLATE_PATH,
+        smtp_server=SMTP_SERVER,
+        smtp_port=SMTP_PORT,
+        use_ssl=SMTP_USE_SSL
+    )
+    return {"email": member.email}
+
+
+def send_reports_to_debtors(dry_run: bool = False, job_id: Optional[int] = None) -> dict:
+    """
+    Send the balance report to every member with a negative balance over one SMTP session.
+
+    Args:
+        dry_run (bool): If True, render the reports without sending them.
+        job_id (int, optional): Job sending the reports; each delivery is recorded for it,
+            and members it already reached in an earlier attempt are skipped.
+
+    Returns:
+        dict: {"sent": [email, ...], "failed": [(email, error), ...]}.
+    """
+    members = load_members_with_debt()
+    already_sent = []
+    on_sent = None
+    if job_id is not None:
+        delivered = load_job_deliveries(job_id)
+        already_sent = [member.email for member in members if member.email in delivered]
+        members = [member for member in members if member.email not in delivered]
+
+        def on_sent(email: str) -> None:
+            record_job_delivery(job_id, email)
+
+    result = send_bulk_report_emails(
+        members,
+        sender_email=EMAIL_SENDER,
+        sender_password=EMAIL_PASSWORD,
+        phone_number=PHONE_NUMBER,
+        template_path=TEMPLATE_PATH,
+        smtp_server=SMTP_SERVER,
+        smtp_port=SMTP_PORT,
+        max_per_minute=SMTP_MAX_PER_MINUTE,
+        dry_run=dry_run,
+        use_ssl=SMTP_USE_SSL,
+        on_sent=on_sent
+    )
+    result["sent"] = already_sent + result["sent"]
+    return result
+
+
+def send_reports_job(payload: dict) -> dict:
+    """
+    Job handler: send the balance report to all members with debt.
+
+    A retried job does not email the members it already reached.
+
+    Args:
+        payload (dict): Unused.
+
+    Returns:
+        dict: {"sent": [email, ...], "failed": [{"email": ..., "error": ...}, ...]}.
+    """
+    result = send_reports_to_debtors(job_id=current_job_id())
+    return {
+        "sent": result["sent"],
+        "failed": [{"email": email, "error": error} for email, error in result["failed"]]
+    }
+
+
+job_queue.register("send_report", send_report_job)
+job_queue.register("send_reports", send_reports_job)
+
+
+@app.before_request
+def start_job_queue():
+    """Start the job queue in servers that import the app instead of running it, e.g. WSGI workers."""
+    if not app.testing:
+        job_queue.start()
+
+
 @app.route("/send_report", methods=["POST"])
 def send_report():
     """
-    Send a transaction report email to a specific member.
+    Queue a transaction report email to a specific member.
 
-    POST: Accepts a JSON body with member email, generates a personalized report,
-          and sends it via email using the configured SMTP credentials.
+    POST: Accepts a JSON body with member email and queues a background job that
+          generates the personalized report and sends it via email.
+          Returns the job ID for polling /admin/jobs/<job_id>.
     """
     data = request.get_json()
-    email = data.get("email", "").strip().lower()
+    email = normalize_email(data.get("email", ""))
 
     # Validate that the email is provided
     if not email:
@@ -768,57 +1023,386 @@ def send_report():
 
     # Try to load the member from the database
     try:
-        member = load_member_by_email(email)
+        load_member_by_email(email)
     except ValueError:
         return jsonify({"error": "Mitglied nicht gefunden"}), 404
 
-    # Generate and send the email report
     try:
-        send_report_email(
-            member,
-            sender_email=EMAIL_SENDER,
-            sender_password=EMAIL_PASSWORD,
-            phone_number=PHONE_NUMBER,
-            template_path=TEMPLATE_PATH
-        )
-        return jsonify({"success": True}), 200
+        job_id = job_queue.submit("send_report", {"email": email})
+    except Exception as e:
+        logging.error(f"[!] Fehler beim Einplanen des Berichts an {email}: {e}")
+        return jsonify({"error": "Senden fehlgeschlagen"}), 500
+
+    return jsonify({"success": True, "job_id": job_id}), 202
+
+
+@app.route("/admin/send_reports", methods=["POST"])
+def send_reports():
+    """
+    Queue the balance report to all members with debt.
+
+    POST: Queues a background job that sends all reports over a single SMTP session.
+          Returns the job ID; the job result lists the sent and failed recipients.
+    """
+    try:
+        job_id = job_queue.submit("send_reports")
     except Exception as e:
-        logging.error(f"[!] Fehler beim Senden an {email}: {e}")
+        logging.error(f"[!] Fehler beim Einplanen des Massenversands: {e}")
         return jsonify({"error": "Senden fehlgeschlagen"}), 500
 
+    return jsonify({"success": True, "job_id": job_id}), 202
+
+
+@app.route("/admin/jobs/<int:job_id>")
+def job_status(job_id):
+    """
+    Return the status of a background job in JSON format.
+
+    GET: Provide status ("queued", "running", "done" or "failed"), result and error.
+    """
+    job = load_job(job_id)
+    if job is None:
+        return jsonify({"error": "Job nicht gefunden"}), 404
+
+    for key in ("created_at", "started_at", "finished_at"):
+        if job[key] is not None:
+            job[key] = job[key].isoformat()
+    return jsonify(job), 200
+
+
+@app.route("/admin/reload_settings", methods=["POST"])
+def reload_settings_route():
+    """
+    Re-read the settings (admin email, default monthly fees) from the environment.
+
+    POST: Replace the cached settings if they are valid and return them in JSON format.
+    """
+    try:
+        settings = reload_settings()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "admin_email": settings.admin_email,
+        "monthly_payment_residents": str(settings.monthly_payment_residents),
+        "monthly_payment_non_residents": str(settings.monthly_payment_non_residents)
+    }), 200
+
+
+TRANSACTION_FIELDS = ("id", "date", "amount", "description", "type")
+DEFAULT_TRANSACTION_FIELDS = ("id", "date", "amount", "description")
+MAX_TRANSACTION_PAGE = 1000
+STREAM_BATCH_ROWS = 500
+
+
+def format_transaction_row(row: tuple, fields) -> dict:
+    """
+    Convert a (id, date, description, amount, transaction_type) row into its JSON form.
+
+    Args:
+        row (tuple): Row from iter_transaction_rows().
+        fields (Iterable[str]): Names of the fields to include.
+
+    Returns:
+        dict: The selected fields.
+    """
+    values = {
+        "id": row[0],
+        "date": row[1].strftime("%d.%m.%Y"),
+        "amount": str(row[3]),
+        "description": row[2],
+        "type": row[4]
+    }
+    return {field: values[field] for field in fields}
+
+
+def parse_transaction_filters(args) -> dict:
+    """
+    Parse the date range (start, end) and type filters of the transaction endpoints.
+
+    Args:
+        args (MultiDict): The request query parameters.
+
+    Returns:
+        dict: start, end and types keyword arguments (only those that were given).
+
+    Raises:
+        ValueError: If a parameter is invalid.
+    """
+    filters = {}
+    for key in ("start", "end"):
+        if args.get(key):
+            try:
+                filters[key] = datetime.strptime(args[key], "%d.%m.%Y").date()
+            except ValueError:
+                raise ValueError(f"Ungültiges Datum für {key}, erwartet TT.MM.JJJJ")
+
+    types = []
+    for value in args.getlist("type"):
+        try:
+            types.append(int(value) if value.isdigit() else TransactionType[value.upper()].value)
+        except KeyError:
+            raise ValueError(f"Unbekannter Transaktionstyp: {value}")
+    if types:
+        filters["types"] = types
+
+    return filters
+
+
+def parse_transaction_query(args) -> dict:
+    """
+    Parse the filter, order and cursor parameters of /admin/get_transactions.
+
+    Args:
+        args (MultiDict): The request query parameters.
+
+    Returns:
+        dict: Keyword arguments for iter_transaction_rows().
+
+    Raises:
+        ValueError: If a parameter is invalid.
+    """
+    query = {"descending": args.get("order", "asc") == "desc"}
+    query.update(parse_transaction_filters(args))
+
+    if args.get("cursor"):
+        try:
+            cursor_date, cursor_id = args["cursor"].split("_")
+            query["after"] = (date.fromisoformat(cursor_date), int(cursor_id))
+        except ValueError:
+            raise ValueError("Ungültiger Cursor")
+
+    return query
+
+
+def stream_transaction_rows(first: tuple, rows, fields):
+    """
+    Yield a JSON array of transactions in chunks of STREAM_BATCH_ROWS rows.
+
+    Args:
+        first (tuple | None): The first row (already fetched), or None if there are no rows.
+        rows (Iterator[tuple]): The remaining rows.
+        fields (Iterable[str]): Names of the fields to include.
+    """
+    if first is None:
+        yield "[]"
+        return
+
+    batch = ["[" + json.dumps(format_transaction_row(first, fields))]
+    for row in rows:
+        batch.append(json.dumps(format_transaction_row(row, fields)))
+        if len(batch) >= STREAM_BATCH_ROWS:
+            yield ",".join(batch) + ","
+            batch = []
+    yield ",".join(batch) + "]" if batch else "]"
+
 
 @app.route("/admin/get_transactions")
 def get_transactions():
     """
-    Return all transactions for a specific member in JSON format.
-
-    GET: Provide a list of transactions for dynamic table loading.
+    Return the transactions of a member in JSON format, ordered by date.
+
+    GET: Query parameters:
+         - email: The member (required).
+         - start / end: Only transactions in this date range (TT.MM.JJJJ).
+         - type: Only these transaction types, as number or name (repeatable).
+         - fields: Comma-separated subset of id, date, amount, description, type.
+         - order: "asc" (default) or "desc".
+         - limit: Return one page as {"transactions": [...], "next_cursor": ...};
+           pass next_cursor as "cursor" to fetch the following page.
+         Without a limit, all matching transactions are streamed as a JSON array.
     """
-    email = request.args.get("email", "").strip().lower()
+    email = normalize_email(request.args.get("email", ""))
 
     if not email:
         return jsonify({"error": "Missing email parameter."}), 400
 
+    fields = DEFAULT_TRANSACTION_FIELDS
+    if request.args.get("fields"):
+        fields = [field.strip() for field in request.args["fields"].split(",") if field.strip()]
+        unknown = set(fields) - set(TRANSACTION_FIELDS)
+        if unknown or not fields:
+            return jsonify({"error": f"Unbekannte Felder: {', '.join(sorted(unknown))}"}), 400
+
     try:
-        transaction_list = load_transactions_by_email(email)
-
-        transactions = [
-            {
-                "id": t.id,
-                "date": t.date.strftime("%d.%m.%Y"),
-                "amount": str(t.amount),
-                "description": t.description
-            }
-            for t in transaction_list
-        ]
+        query = parse_transaction_query(request.args)
+        limit = int(request.args["limit"]) if request.args.get("limit") else None
+        if limit is not None and not 1 <= limit <= MAX_TRANSACTION_PAGE:
+            raise ValueError(f"limit muss zwischen 1 und {MAX_TRANSACTION_PAGE} liegen")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        return jsonify(transactions)
+    try:
+        if limit is None:
+            rows = iter_transaction_rows(email, **query)
+            # Fetch the first row here, so database errors still produce an error response
+            first = next(rows, None)
+            return Response(stream_transaction_rows(first, rows, fields), mimetype="application/json")
+
+        # One extra row tells whether there is a next page
+        rows = list(iter_transaction_rows(email, limit=limit + 1, **query))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f"{rows[-1][1].isoformat()}_{rows[-1][0]}"
+
+        return jsonify({
+            "transactions": [format_transaction_row(row, fields) for row in rows],
+            "next_cursor": next_cursor
+        })
 
     except Exception as e:
         logging.error(f"[!] Error fetching transactions: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/admin/export/transactions.<export_format>")
+def export_transactions(export_format):
+    """
+    Download the ledger with running balances as CSV or XLSX file.
+
+    GET: Optional query parameters email (one member instead of all), start / end
+         (TT.MM.JJJJ) and type (repeatable). The file is streamed while it is read
+         from the database, so large exports use constant memory.
+    """
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unbekanntes Format: {export_format}"}), 404
+
+    email = normalize_email(request.args.get("email", "")) or None
+    try:
+        filters = parse_transaction_filters(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    write_chunks, mimetype = EXPORT_FORMATS[export_format]
+    try:
+        rows = iter_ledger_rows(email, **filters)
+        # Fetch the first row here, so database errors still produce an error response
+        first = next(rows, None)
+    except Exception as e:
+        logging.error(f"[!] Error exporting transactions: {e}")
+        return jsonify({"error": str(e)}), 500
+
+    if first is not None:
+        rows = itertools.chain([first], rows)
+    subject = email.split('@')[0] if email else 'alle'
+    filename = secure_filename(f"buchungen_{subject}_{date.today():%Y-%m-%d}.{export_format}")
+    return Response(write_chunks(rows), mimetype=mimetype,
+                    headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
+@app.route("/admin/db_pool_stats")
+def db_pool_stats():
+    """
+    Return the metrics of the database connection pool in JSON format.
+
+    GET: Provide checkouts, wait times and saturation for monitoring.
+    """
+    return jsonify(get_pool_stats())
+
+
+@app.cli.command("rebuild-balances")
+@click.option("--verify-only", is_flag=True, help="Only report mismatches, do not rebuild.")
+def rebuild_balances_command(verify_only):
+    """
+    Rebuild (or verify) the monthly balance snapshots from the transactions table.
+    """
+    mismatches = verify_monthly_balances()
+    for email, month, stored, actual in mismatches:
+        click.echo(f"[!] {email} {month:%Y-%m}: stored {stored}, actual {actual}")
+
+    if verify_only:
+        click.echo(f"{len(mismatches)} mismatching month(s) found.")
+        if mismatches:
+            raise SystemExit(1)
+        return
+
+    rows = rebuild_monthly_balances()
+    click.echo(f"[✓] Rebuilt {rows} monthly balance row(s).")
+
+
+@app.cli.command("normalize-emails")
+def normalize_emails_command():
+    """
+    Convert all stored member emails to lowercase and create the ledger index.
+    """
+    try:
+        changed = normalize_member_emails()
+    except ValueError as e:
+        click.echo(f"[!] {e}")
+        raise SystemExit(1)
+    click.echo(f"[✓] Normalized {changed} member email(s).")
+
+
+@app.cli.command("set-fee")
+@click.argument("valid_from")
+@click.argument("amount")
+@click.option("--non-resident", is_flag=True, help="Set the fee for non-residents instead of residents.")
+def set_fee_command(valid_from, amount, non_resident):
+    """
+    Set the monthly fee that applies from VALID_FROM (YYYY-MM) on.
+    """
+    try:
+        month = datetime.strptime(valid_from, "%Y-%m").date()
+        fee = Decimal(amount.replace(",", "."))
+        save_fee_rate(month, not non_resident, fee)
+    except (ValueError, InvalidOperation) as e:
+        click.echo(f"[!] Invalid fee: {e}")
+        raise SystemExit(1)
+
+    kind = "non-residents" if non_resident else "residents"
+    click.echo(f"[✓] Monthly fee for {kind} is {fee} from {month:%Y-%m} on.")
+
+
+@app.cli.command("import-members")
+@click.argument("csv_file", type=click.File("r", encoding="utf-8-sig"))
+def import_members_command(csv_file):
+    """
+    Create or update members from CSV_FILE (columns: email, first_name, last_name,
+    title, is_resident, created_at, start_balance).
+    """
+    try:
+        result = import_members(iter_member_rows(csv_file), changed_by=get_admin_email())
+    except ValueError as e:
+        click.echo(f"[!] Import failed: {e}")
+        raise SystemExit(1)
+    click.echo(f"[✓] Imported {result['imported']} member(s), {result['created']} new, "
+               f"{result['title_changes']} title and {result['residency_changes']} residency change(s).")
+
+
+@app.cli.command("import-transactions")
+@click.argument("csv_file", type=click.File("r", encoding="utf-8-sig"))
+@click.option("--skip-existing", is_flag=True, help="Skip rows that are already booked.")
+def import_transactions_command(csv_file, skip_existing):
+    """
+    Import historical transactions from CSV_FILE (columns: email, date, description, amount, type).
+    """
+    try:
+        result = import_transactions(iter_transaction_import_rows(csv_file), changed_by=get_admin_email(),
+                                     skip_existing=skip_existing)
+    except ValueError as e:
+        click.echo(f"[!] Import failed: {e}")
+        raise SystemExit(1)
+    click.echo(f"[✓] Imported {result['imported']} transaction(s), skipped {result['skipped']}.")
+
+
+@app.cli.command("send-reports")
+@click.option("--dry-run", is_flag=True, help="Render the reports without sending them.")
+def send_reports_command(dry_run):
+    """
+    Send the balance report to all members with debt.
+    """
+    result = send_reports_to_debtors(dry_run=dry_run)
+    for email, error in result["failed"]:
+        click.echo(f"[!] {email}: {error}")
+    click.echo(f"[✓] Sent {len(result['sent'])} report(s), {len(result['failed'])} failed.")
+    if result["failed"]:
+        raise SystemExit(1)
+
+
 if __name__ == '__main__':
     """Run the Flask development server when this script is executed directly."""
+    # With the reloader, only the serving child process should run jobs
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        job_queue.start()
     app.run(debug=True)
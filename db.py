@@ -1,7 +1,11 @@
 from dotenv import load_dotenv
 import os
+import threading
+import time
 import psycopg2
+import psycopg2.extensions
 from contextlib import contextmanager
+from typing import Optional
 
 load_dotenv()
 
@@ -13,15 +17,318 @@ DB_CONFIG = {
     "port": os.getenv("DB_PORT")
 }
 
+# Pool sizing and housekeeping (all optional, see .env.example)
+POOL_CONFIG = {
+    "minconn": int(os.getenv("DB_POOL_MIN", "1")),
+    "maxconn": int(os.getenv("DB_POOL_MAX", "10")),
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "idle_timeout": float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),
+    "ping_after": float(os.getenv("DB_POOL_PING_AFTER", "30")),
+}
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections.
+
+    Connections are handed out LIFO so the most recently used (warm) connection
+    is reused first. Idle connections above `minconn` are closed after
+    `idle_timeout` seconds, and connections that sat idle longer than
+    `ping_after` seconds are checked with `SELECT 1` before being handed out.
+    """
+
+    def __init__(self,
+                 minconn: int = 1,
+                 maxconn: int = 10,
+                 timeout: float = 30.0,
+                 idle_timeout: float = 300.0,
+                 ping_after: float = 30.0,
+                 **db_config):
+        if maxconn < 1 or minconn < 0 or minconn > maxconn:
+            raise ValueError(f"Invalid pool size: min={minconn}, max={maxconn}")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self.db_config = db_config
+        self.pid = os.getpid()
+
+        self._idle = []  # list of (connection, last_used) tuples, most recent last
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "peak_in_use": 0,
+        }
+
+    def getconn(self):
+        """
+        Check out a healthy connection, waiting up to `timeout` seconds if the pool is saturated.
+
+        Returns:
+            connection: An open psycopg2 connection.
+
+        Raises:
+            PoolTimeout: If no connection became available in time.
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        while True:
+            conn, last_used, create = None, None, False
+
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                self._reap_idle_locked()
+
+                while not self._idle and self._in_use >= self.maxconn:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(f"No database connection available after {self.timeout}s")
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                else:
+                    create = True
+                self._in_use += 1
+
+            try:
+                if create:
+                    conn = psycopg2.connect(**self.db_config)
+                    self._count("connections_created")
+                elif not self._is_healthy(conn, last_used):
+                    self._count("health_check_failures")
+                    self._discard(conn)
+                    continue
+            except Exception:
+                self._release_slot()
+                raise
+
+            waited = time.monotonic() - started
+            with self._cond:
+                self._stats["checkouts"] += 1
+                self._stats["wait_time_total"] += waited
+                self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+                self._stats["peak_in_use"] = max(self._stats["peak_in_use"], self._in_use)
+            return conn
+
+    def putconn(self, conn, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: The connection previously obtained from getconn().
+            discard (bool): Close the connection instead of keeping it (e.g. after a network error).
+        """
+        if not discard and not conn.closed:
+            try:
+                # Never hand out a connection with a half-open transaction
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        if discard or conn.closed or self._closed:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append((conn, time.monotonic()))
+            self._reap_idle_locked()
+            self._cond.notify()
+
+    def reap_idle(self) -> int:
+        """
+        Close idle connections that exceeded `idle_timeout`, keeping at least `minconn` open.
+
+        Returns:
+            int: Number of connections closed.
+        """
+        with self._cond:
+            return self._reap_idle_locked()
+
+    def close(self) -> None:
+        """Close all idle connections and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of pool metrics for monitoring.
+
+        Returns:
+            dict: Counters (checkouts, timeouts, ...), current usage and saturation (0..1).
+        """
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot.update({
+                "min_size": self.minconn,
+                "max_size": self.maxconn,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "saturation": round(self._in_use / self.maxconn, 3),
+            })
+        checkouts = snapshot["checkouts"]
+        snapshot["wait_time_avg"] = snapshot["wait_time_total"] / checkouts if checkouts else 0.0
+        return snapshot
+
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.ping_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _reap_idle_locked(self) -> int:
+        now = time.monotonic()
+        reaped = 0
+        # Oldest connections sit at the front of the list
+        while (self._idle
+               and len(self._idle) + self._in_use > self.minconn
+               and now - self._idle[0][1] > self.idle_timeout):
+            conn, _ = self._idle.pop(0)
+            self._close_quietly(conn)
+            reaped += 1
+        return reaped
+
+    def _discard(self, conn) -> None:
+        self._close_quietly(conn)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+
+    def _close_quietly(self, conn) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+        self._count("connections_closed")
+
+    def _count(self, key: str) -> None:
+        with self._cond:
+            self._stats[key] += 1
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return the process-wide connection pool, creating it on first use.
+
+    A pool inherited through fork() (e.g. gunicorn with --preload) is replaced,
+    because sockets must not be shared between worker processes.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            _pool = ConnectionPool(**POOL_CONFIG, **DB_CONFIG)
+        return _pool
+
+
+def close_pool() -> None:
+    """Close the process-wide pool (the next get_cursor() creates a fresh one)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.close()
+        _pool = None
+
+
+def get_pool_stats() -> dict:
+    """Return the metrics of the process-wide connection pool."""
+    return get_pool().stats()
+
+
+def _open_cursor(conn, name: Optional[str], itersize: int):
+    if name is None:
+        return conn.cursor()
+    cur = conn.cursor(name=name)
+    cur.itersize = itersize
+    return cur
+
 
 @contextmanager
-def get_cursor():
-    conn = psycopg2.connect(**DB_CONFIG)
-    cur = conn.cursor()
+def get_cursor(name: Optional[str] = None, itersize: int = 1000):
+    """
+    Yield a cursor on a pooled connection and commit on successful exit.
+
+    Nested get_cursor() calls within the same thread reuse the outer connection
+    and take part in its transaction; only the outermost block commits or rolls back.
+
+    Args:
+        name (str, optional): Open a server-side (named) cursor instead. Iterating it
+            fetches `itersize` rows per round trip, so large results are never held
+            in memory at once.
+        itersize (int): Rows fetched per round trip by a named cursor.
+    """
+    outer = getattr(_local, "conn", None)
+    if outer is not None:
+        cur = _open_cursor(outer, name, itersize)
+        try:
+            yield cur
+        finally:
+            cur.close()
+        return
+
+    pool = get_pool()
+    conn = pool.getconn()
+    _local.conn = conn
+    cur = _open_cursor(conn, name, itersize)
+    broken = False
 
     try:
         yield cur
+        if name is not None:
+            # A named cursor only lives until the end of the transaction
+            cur.close()
         conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+        raise
     finally:
-        cur.close()
-        conn.close()
+        _local.conn = None
+        if not conn.closed:
+            cur.close()
+        pool.putconn(conn, discard=broken)
@@ -7,7 +7,9 @@ CREATE TABLE IF NOT EXISTS members
     title         VARCHAR NOT NULL,
     is_resident   BOOLEAN NOT NULL,
     created_at    DATE    NOT NULL,
-    start_balance NUMERIC(10, 2) DEFAULT 0.00
+    start_balance NUMERIC(10, 2) DEFAULT 0.00,
+    -- emails are stored normalized, so lookups can use "=" and the indexes
+    CONSTRAINT members_email_lowercase CHECK (email = LOWER(email))
 );
 
 -- Table: title_changes (logs changes to 'title' field)
@@ -41,6 +43,23 @@ CREATE TABLE IF NOT EXISTS transactions
     transaction_type INTEGER        NOT NULL DEFAULT 1
 );
 
+-- Table: monthly_balances (sum of transaction amounts per member and month, maintained on every write)
+CREATE TABLE IF NOT EXISTS monthly_balances
+(
+    member_email VARCHAR        NOT NULL REFERENCES members (email) ON DELETE CASCADE,
+    month        DATE           NOT NULL,
+    total        NUMERIC(12, 2) NOT NULL DEFAULT 0.00,
+    PRIMARY KEY (member_email, month)
+);
+
+-- Backfill the snapshots once for databases that already had transactions before monthly_balances existed
+INSERT INTO monthly_balances (member_email, month, total)
+SELECT member_email, date_trunc('month', date)::date, SUM(amount)
+FROM transactions
+WHERE NOT EXISTS (SELECT 1 FROM monthly_balances)
+GROUP BY member_email, date_trunc('month', date)
+ON CONFLICT (member_email, month) DO NOTHING;
+
 -- Table: transaction_change_log
 CREATE TABLE IF NOT EXISTS transaction_change_log
 (
@@ -107,12 +126,50 @@ CREATE TABLE IF NOT EXISTS beverage_entries
         )
 );
 
+-- Table: jobs (background jobs such as report emails; survives restarts)
+CREATE TABLE IF NOT EXISTS jobs
+(
+    id          SERIAL PRIMARY KEY,
+    job_type    VARCHAR   NOT NULL,
+    payload     JSONB     NOT NULL DEFAULT '{}',
+    status      VARCHAR   NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    result      JSONB,
+    error       TEXT,
+    attempts    INTEGER   NOT NULL DEFAULT 0,
+    created_at  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at  TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Running jobs refresh heartbeat_at; a job is only requeued when its worker stopped doing so
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP;
+
+-- Table: job_deliveries (recipients a job already emailed, skipped when the job is retried)
+CREATE TABLE IF NOT EXISTS job_deliveries
+(
+    job_id  INTEGER   NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    email   VARCHAR   NOT NULL,
+    sent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (job_id, email)
+);
+
+-- Table: fee_schedule (monthly fees effective from the given month until the next rate)
+CREATE TABLE IF NOT EXISTS fee_schedule
+(
+    valid_from  DATE           NOT NULL CHECK (EXTRACT(DAY FROM valid_from) = 1),
+    is_resident BOOLEAN        NOT NULL,
+    amount      NUMERIC(10, 2) NOT NULL CHECK (amount >= 0),
+    PRIMARY KEY (valid_from, is_resident)
+);
+
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_transactions_email ON transactions (member_email);
+CREATE INDEX IF NOT EXISTS idx_transactions_email_date ON transactions (member_email, date);
 CREATE INDEX IF NOT EXISTS idx_title_changes_email ON title_changes (member_email);
 CREATE INDEX IF NOT EXISTS idx_residency_changes_email ON residency_changes (member_email);
 CREATE INDEX IF NOT EXISTS idx_bank_accounts_email ON bank_details (member_email);
 CREATE INDEX IF NOT EXISTS idx_reimbursement_email ON reimbursement_items (member_email);
 CREATE INDEX IF NOT EXISTS idx_beverage_entries_report ON beverage_entries (report_id);
 CREATE INDEX IF NOT EXISTS idx_beverage_entries_email ON beverage_entries (email);
-CREATE INDEX IF NOT EXISTS idx_beverage_prices_report ON beverage_report_prices (report_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_beverage_prices_report ON beverage_report_prices (report_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_pending ON jobs (id) WHERE status IN ('queued', 'running');
@@ -0,0 +1,13 @@
+from decimal import Decimal
+from typing import NamedTuple
+
+
+class Beverage(NamedTuple):
+    """A beverage of the assortment with its current price (immutable)."""
+
+    name: str
+    price: Decimal
+
+    def to_dict(self) -> dict:
+        """Return the beverage as a JSON-serializable dict for the report form."""
+        return {"name": self.name, "price": float(self.price)}
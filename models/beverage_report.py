@@ -0,0 +1,141 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple
+
+from models.beverage import Beverage
+from models.transaction import Transaction
+from models.transaction_type import TransactionType
+from models.validators import normalize_email
+
+
+def parse_count(value: str) -> int:
+    """
+    Parse a consumption count from a form field.
+
+    Args:
+        value (str): Raw form value.
+
+    Returns:
+        int: The count, or 0 if the value is not a non-negative integer.
+    """
+    value = value.strip()
+    return int(value) if value.isdigit() else 0
+
+
+class BeverageReport:
+    def __init__(self,
+                 report_date: date,
+                 prices: Dict[str, Decimal],
+                 member_counts: Dict[str, Dict[str, int]],
+                 event_counts: List[Tuple[str, Dict[str, int]]]):
+        """
+        Initialize a parsed beverage report.
+
+        Args:
+            report_date (date): Date of the report.
+            prices (Dict[str, Decimal]): Beverage name -> price at the time of the report.
+            member_counts (Dict[str, Dict[str, int]]): Member email -> beverage name -> count.
+            event_counts (List[Tuple[str, Dict[str, int]]]): (event title, beverage name -> count) rows.
+        """
+        self.report_date = report_date
+        self.prices = prices
+        self.member_counts = member_counts
+        self.event_counts = event_counts
+
+    @classmethod
+    def from_form(cls, form, beverages: Iterable[Beverage], report_date: date) -> "BeverageReport":
+        """
+        Parse a submitted beverage report form in a single pass.
+
+        Member fields are named "<email>_<beverage>", event rows are submitted as
+        "event_title[]" plus one "event_<beverage>[]" list per beverage. Unknown
+        beverages, non-numeric values and zero counts are ignored.
+
+        Args:
+            form (ImmutableMultiDict): The submitted form data from the POST request.
+            beverages (Iterable[Beverage]): The current beverage assortment.
+            report_date (date): The selected report date.
+
+        Returns:
+            BeverageReport: The parsed report.
+        """
+        prices = {b.name: b.price for b in beverages}
+
+        member_counts = {}
+        for key, value in form.items():
+            if "_" not in key or key.startswith("event_"):
+                continue
+            email, bev = key.split("_", 1)
+            if bev not in prices:
+                continue
+            count = parse_count(value)
+            if count > 0:
+                counts = member_counts.setdefault(normalize_email(email), {})
+                counts[bev] = counts.get(bev, 0) + count
+
+        event_columns = {bev: form.getlist(f"event_{bev}[]") for bev in prices}
+        event_counts = []
+        for i, title in enumerate(form.getlist("event_title[]")):
+            title = title.strip()
+            if not title:
+                continue
+            counts = {}
+            for bev, values in event_columns.items():
+                count = parse_count(values[i]) if i < len(values) else 0
+                if count > 0:
+                    counts[bev] = count
+            if counts:
+                event_counts.append((title, counts))
+
+        return cls(report_date, prices, member_counts, event_counts)
+
+    def member_totals(self) -> Dict[str, Decimal]:
+        """
+        Calculate the total amount owed by each member.
+
+        Returns:
+            Dict[str, Decimal]: Member email -> total price of the consumed beverages.
+        """
+        return {
+            email: sum((self.prices[bev] * count for bev, count in counts.items()), Decimal("0.00"))
+            for email, counts in self.member_counts.items()
+        }
+
+    def entries(self) -> List[Tuple[bool, str, str, str, int]]:
+        """
+        Flatten the report into beverage_entries rows.
+
+        Returns:
+            List[tuple]: (is_event, email, event_title, beverage_name, count) rows,
+            individual entries first, then event entries.
+        """
+        rows = [
+            (False, email, None, bev, count)
+            for email, counts in self.member_counts.items()
+            for bev, count in counts.items()
+        ]
+        rows += [
+            (True, None, title, bev, count)
+            for title, counts in self.event_counts
+            for bev, count in counts.items()
+        ]
+        return rows
+
+    def build_transactions(self) -> List[Transaction]:
+        """
+        Create one DRINKS transaction per member with consumption in this report.
+
+        Returns:
+            List[Transaction]: Unsaved transactions charging each member's total.
+        """
+        description = f"Getränkeabrechnung vom {self.report_date.strftime('%d.%m.%Y')}"
+        return [
+            Transaction(
+                transaction_date=self.report_date,
+                description=description,
+                amount=-total,
+                member_email=email,
+                transaction_type=TransactionType.DRINKS
+            )
+            for email, total in self.member_totals().items()
+        ]
@@ -0,0 +1,43 @@
+from bisect import bisect_right
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Tuple
+
+
+class FeeSchedule:
+    """
+    Effective-dated monthly fees for residents and non-residents.
+
+    Each rate applies from its valid_from month until the next rate of the same
+    kind. Months before the first rate use the default fee from the settings.
+    """
+
+    def __init__(self, rates: Iterable[Tuple[date, bool, Decimal]],
+                 default_resident: Decimal, default_non_resident: Decimal):
+        """
+        Build the schedule from (valid_from, is_resident, amount) rows.
+
+        Args:
+            rates (Iterable[tuple]): Fee rates in any order.
+            default_resident (Decimal): Resident fee for months without a rate.
+            default_non_resident (Decimal): Non-resident fee for months without a rate.
+        """
+        self._starts = {True: [], False: []}
+        self._amounts = {True: [default_resident], False: [default_non_resident]}
+        for valid_from, is_resident, amount in sorted(rates):
+            self._starts[is_resident].append(date(valid_from.year, valid_from.month, 1))
+            self._amounts[is_resident].append(amount)
+
+    def amount_for(self, month: date, is_resident: bool) -> Decimal:
+        """
+        Return the monthly fee that applied in the given month.
+
+        Args:
+            month (date): Any day of the month.
+            is_resident (bool): Whether the member lived in the house.
+
+        Returns:
+            Decimal: The fee for that month.
+        """
+        index = bisect_right(self._starts[is_resident], date(month.year, month.month, 1))
+        return self._amounts[is_resident][index]
@@ -8,8 +8,9 @@ from typing import List, Optional
 from db import get_cursor
 from models.transaction import Transaction
 from models.transaction_type import TransactionType
-from models.validators import parse_decimal
-from services.transactions_db import load_transactions_by_email
+from models.validators import normalize_email, parse_decimal
+from services.ledger_db import load_balance_at
+from services.transactions_db import load_transactions_by_email, load_transactions_for_members
 
 
 class Title(Enum):
@@ -58,19 +59,73 @@ class Member:
         self.created_at = created_at or datetime.today().date()
         self.start_balance = parse_decimal(start_balance)
 
+        # Cached ledger and the ledger version it was loaded at (see Transaction.ledger_version)
+        self._transactions = None
+        self._transactions_version = None
+
     def get_transactions(self) -> List[Transaction]:
         """
-        Load all transactions linked to this member from the database.
+        Return all transactions linked to this member.
+
+        The ledger is loaded from the database once and cached on the object
+        until a transaction of this member is created, updated or deleted.
 
         Returns:
             list[Transaction]: List of Transaction objects.
         """
-        return load_transactions_by_email(self.email)
+        version = Transaction.ledger_version(self.email)
+        if self._transactions is None or self._transactions_version != version:
+            self._transactions = load_transactions_by_email(self.email)
+            self._transactions_version = version
+        return list(self._transactions)
+
+    def set_transactions(self, transactions: List[Transaction], version: int) -> None:
+        """
+        Seed the ledger cache with transactions that were loaded elsewhere.
+
+        Args:
+            transactions (List[Transaction]): All transactions of this member, ordered by date.
+            version (int): Transaction.ledger_version() of this member, read before the transactions were loaded.
+        """
+        self._transactions = list(transactions)
+        self._transactions_version = version
+
+    @staticmethod
+    def prefetch_transactions(members: List[Member]) -> None:
+        """
+        Load the ledgers of many members with one query and cache them on the objects.
+
+        Afterwards get_transactions() and get_balance() of these members need no database access.
+
+        Args:
+            members (List[Member]): Members whose ledgers are loaded.
+        """
+        if not members:
+            return
+
+        versions = {m.email: Transaction.ledger_version(m.email) for m in members}
+        ledgers = load_transactions_for_members(versions)
+        for member in members:
+            member.set_transactions(ledgers.get(normalize_email(member.email), []), versions[member.email])
+
+    def _has_cached_transactions(self) -> bool:
+        return (self._transactions is not None
+                and self._transactions_version == Transaction.ledger_version(self.email))
+
+    def invalidate_transactions(self) -> None:
+        """
+        Drop the cached ledger so the next access reloads it from the database.
+        """
+        self._transactions = None
+        self._transactions_version = None
 
     def get_balance_at(self, target_date: date) -> Decimal:
         """
         Calculate the member's account balance as of the given date (inclusive).
 
+        Uses the cached ledger if it is already loaded; otherwise the balance
+        is read from the monthly balance snapshots plus the target month's transactions.
+
         Args:
             target_date (date): The date up to which transactions are considered.
 
@@ -78,6 +133,9 @@ class Member:
             Decimal: The account balance on the specified date.
         """
         balance = Decimal(self.start_balance)
+        if not self._has_cached_transactions():
+            return balance + load_balance_at(self.email, target_date)
+
         for tx in self.get_transactions():
             if tx.date <= target_date:
                 balance += tx.amount
@@ -186,6 +244,7 @@ class Member:
             member_email=self.email
         )
         transaction.save(changed_by=changed_by)
+        self.invalidate_transactions()
         return transaction
 
     def save_to_db(self) -> None:
@@ -199,6 +258,8 @@ class Member:
         Additionally, if the member is new, their initial title
         and residency status are recorded in the corresponding history tables.
         """
+        self.email = normalize_email(self.email)
+
         with get_cursor() as cur:
             # Try to insert or update the member
             cur.execute("""
@@ -1,9 +1,13 @@
 import logging
 from decimal import Decimal
 from datetime import date
+from typing import List
+from psycopg2.extras import execute_values
 from db import get_cursor
-from services.logging_db import log_transaction_change
+from services.ledger_db import apply_ledger_deltas
+from services.logging_db import log_transaction_change, log_transaction_changes
 from models.transaction_type import TransactionType
+from models.validators import normalize_email
 
 
 class Transaction:
@@ -11,6 +15,33 @@ class Transaction:
     Represents a single financial transaction, linked to a member.
     """
 
+    # Per-member counter bumped on every write, so cached ledgers can detect that they are stale
+    _ledger_versions = {}
+
+    @classmethod
+    def ledger_version(cls, member_email: str) -> int:
+        """
+        Return the current ledger version of a member.
+
+        Args:
+            member_email (str): Email of the member.
+
+        Returns:
+            int: A counter that changes whenever a transaction of the member is written.
+        """
+        return cls._ledger_versions.get(member_email.lower(), 0)
+
+    @classmethod
+    def mark_ledger_changed(cls, member_email: str) -> None:
+        """
+        Invalidate all cached ledgers of a member.
+
+        Args:
+            member_email (str): Email of the member whose transactions changed.
+        """
+        key = member_email.lower()
+        cls._ledger_versions[key] = cls._ledger_versions.get(key, 0) + 1
+
     def __init__(self,
                  transaction_date: date,
                  description: str,
@@ -32,6 +63,8 @@ class Transaction:
         Args:
             changed_by (str): Email of the user/admin creating the transaction.
         """
+        self.member_email = normalize_email(self.member_email)
+
         with get_cursor() as cur:
             cur.execute("""
                 INSERT INTO transactions (member_email, date, description, amount, transaction_type)
@@ -39,13 +72,63 @@ class Transaction:
                 RETURNING id
             """, (self.member_email, self.date, self.description, self.amount, self.type.value))
             self.id = cur.fetchone()[0]
+            apply_ledger_deltas(cur, [(self.member_email, self.date, self.amount)])
+
+            # Logged on the same connection, so the transaction and its log row are committed together
+            log_transaction_change(
+                self.id,
+                "create",
+                changed_by,
+                f"Created transaction: {self.description}"
+            )
+
+        Transaction.mark_ledger_changed(self.member_email)
+
+    @staticmethod
+    def save_many(transactions: List["Transaction"], changed_by: str) -> List["Transaction"]:
+        """
+        Save several transactions and their creation log entries atomically.
+
+        All rows are inserted with one multi-row INSERT ... RETURNING id, and the
+        monthly balance snapshots and the change log are written in the same
+        database transaction. Either all transactions are saved or none.
 
-        log_transaction_change(
-            self.id,
-            "create",
-            changed_by,
-            f"Created transaction: {self.description}"
-        )
+        Args:
+            transactions (List[Transaction]): Unsaved transactions.
+            changed_by (str): Email of the user/admin creating the transactions.
+
+        Returns:
+            List[Transaction]: The same transactions with their new IDs set.
+        """
+        if not transactions:
+            return []
+
+        for tx in transactions:
+            tx.member_email = normalize_email(tx.member_email)
+
+        with get_cursor() as cur:
+            rows = execute_values(cur, """
+                INSERT INTO transactions (member_email, date, description, amount, transaction_type)
+                VALUES %s
+                RETURNING id
+            """, [
+                (tx.member_email, tx.date, tx.description, tx.amount, tx.type.value)
+                for tx in transactions
+            ], page_size=len(transactions), fetch=True)
+
+            for tx, row in zip(transactions, rows):
+                tx.id = row[0]
+
+            apply_ledger_deltas(cur, [(tx.member_email, tx.date, tx.amount) for tx in transactions])
+            log_transaction_changes([
+                (tx.id, "create", changed_by, f"Created transaction: {tx.description}")
+                for tx in transactions
+            ])
+
+        for email in {tx.member_email for tx in transactions}:
+            Transaction.mark_ledger_changed(email)
+
+        return transactions
 
     def update(
             self,
@@ -77,18 +160,29 @@ class Transaction:
         new_amount = new_amount if new_amount is not None else self.amount
 
         with get_cursor() as cur:
+            # Return the previous date and amount to move them in the monthly totals
             cur.execute("""
-                UPDATE transactions
+                UPDATE transactions t
                 SET date = %s, description = %s, amount = %s
-                WHERE id = %s
+                FROM (SELECT id, date, amount FROM transactions WHERE id = %s FOR UPDATE) old
+                WHERE t.id = old.id
+                RETURNING old.date, old.amount
             """, (new_date, new_description, new_amount, self.id))
-
-        log_transaction_change(
-            self.id,
-            "update",
-            changed_by,
-            note or f"Updated transaction: {new_description}"
-        )
+            row = cur.fetchone()
+            if row:
+                apply_ledger_deltas(cur, [
+                    (self.member_email, row[0], -row[1]),
+                    (self.member_email, new_date, new_amount),
+                ])
+
+            log_transaction_change(
+                self.id,
+                "update",
+                changed_by,
+                note or f"Updated transaction: {new_description}"
+            )
+
+        Transaction.mark_ledger_changed(self.member_email)
 
         self.date = new_date
         self.description = new_description
@@ -113,11 +207,15 @@ class Transaction:
             with get_cursor() as cur:
                 # Execute the DELETE statement to remove the transaction
                 cur.execute(
-                    "DELETE FROM transactions WHERE id = %s AND member_email = %s",
+                    "DELETE FROM transactions WHERE id = %s AND member_email = %s RETURNING date, amount",
                     (self.id, self.member_email)
                 )
                 # If one row was deleted, return True
                 if cur.rowcount == 1:
+                    deleted_date, deleted_amount = cur.fetchone()
+                    apply_ledger_deltas(cur, [(self.member_email, deleted_date, -deleted_amount)])
+                    Transaction.mark_ledger_changed(self.member_email)
+
                     # Log after successful deletion
                     log_transaction_change(
                         transaction_id=self.id,
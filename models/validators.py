@@ -19,6 +19,22 @@ def validate_date(date_str: str) -> None:
         raise ValueError(f"Invalid date format: '{date_str}'. Expected YYYY-MM-DD.")
 
 
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address for storage and lookups (trimmed, lowercase).
+
+    All emails are stored in this form, so queries can compare with `=`
+    and use the indexes on member_email.
+
+    Args:
+        email (str): The email address as entered.
+
+    Returns:
+        str: The normalized email address.
+    """
+    return (email or "").strip().lower()
+
+
 def parse_decimal(value: Union[str, float, Decimal]) -> Decimal:
     """
     Convert a given value into a Decimal rounded to 2 decimal places.
@@ -0,0 +1,164 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Tuple
+from db import get_cursor
+from models.transaction_type import TransactionType
+
+
+def load_debt_report(reference_date: date,
+                     threshold: Decimal = Decimal("-100.00"),
+                     as_of: Optional[date] = None) -> List[dict]:
+    """
+    Load the debt overview of all members below a balance threshold with one query.
+
+    For every member the current balance, the balance on the reference date
+    and the date of the last CREDIT transaction are aggregated in the database.
+
+    Args:
+        reference_date (date): Date of the "balance on date" column (inclusive).
+        threshold (Decimal): Only members whose current balance is below this value are returned.
+        as_of (date, optional): Date of the current balance (default: today).
+
+    Returns:
+        List[dict]: Rows with email, title, last_name, first_name, current_balance,
+        balance_on_date and last_credit_date, ordered by current balance (highest debt first).
+    """
+    as_of = as_of or date.today()
+
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT *
+            FROM (
+                SELECT m.email,
+                       m.title,
+                       m.last_name,
+                       m.first_name,
+                       m.start_balance + COALESCE(SUM(t.amount) FILTER (WHERE t.date <= %(as_of)s), 0)
+                           AS current_balance,
+                       m.start_balance + COALESCE(SUM(t.amount) FILTER (WHERE t.date <= %(reference_date)s), 0)
+                           AS balance_on_date,
+                       MAX(t.date) FILTER (WHERE t.transaction_type = %(credit)s) AS last_credit_date
+                FROM members m
+                LEFT JOIN transactions t ON t.member_email = m.email
+                GROUP BY m.email
+            ) report
+            WHERE current_balance < %(threshold)s
+            ORDER BY current_balance, last_name, first_name
+        """, {
+            "as_of": as_of,
+            "reference_date": reference_date,
+            "credit": TransactionType.CREDIT.value,
+            "threshold": threshold,
+        })
+        rows = cur.fetchall()
+
+    keys = ("email", "title", "last_name", "first_name", "current_balance", "balance_on_date", "last_credit_date")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+# Sort keys of the admin member list -> ORDER BY expressions
+MEMBER_SORT_COLUMNS = {
+    "balance": ("balance",),
+    "name": ("LOWER(last_name)", "LOWER(first_name)"),
+    "email": ("email",),
+    "created_at": ("created_at",),
+}
+
+
+def load_member_overview(sort_by: str = "balance",
+                         descending: bool = False,
+                         title: Optional[str] = None,
+                         is_resident: Optional[bool] = None,
+                         max_balance: Optional[Decimal] = None,
+                         page: int = 1,
+                         per_page: int = 50,
+                         as_of: Optional[date] = None) -> Tuple[List[dict], int]:
+    """
+    Load one page of the admin member list with balances, sorted and filtered in a single query.
+
+    Balances are built from the monthly_balances snapshots of completed months
+    plus the transactions of the current month up to the reference date.
+
+    Args:
+        sort_by (str): One of MEMBER_SORT_COLUMNS ("balance", "name", "email", "created_at").
+        descending (bool): Sort in descending order.
+        title (str, optional): Only members with this title.
+        is_resident (bool, optional): Only residents (True) or non-residents (False).
+        max_balance (Decimal, optional): Only members whose balance is at most this value.
+        page (int): Page number, starting at 1.
+        per_page (int): Members per page.
+        as_of (date, optional): Reference date of the balance (default: today).
+
+    Returns:
+        Tuple[List[dict], int]: Rows with email, title, last_name, first_name, is_resident,
+            created_at, start_balance and balance, and the number of matching members
+            (counted separately if the page is past the end).
+
+    Raises:
+        ValueError: If sort_by is unknown or the page parameters are invalid.
+    """
+    if sort_by not in MEMBER_SORT_COLUMNS:
+        raise ValueError(f"Unknown sort key: {sort_by}")
+    if page < 1 or per_page < 1:
+        raise ValueError("page and per_page must be positive")
+
+    as_of = as_of or date.today()
+    params = {
+        "month": as_of.replace(day=1),
+        "as_of": as_of,
+        "limit": per_page,
+        "offset": (page - 1) * per_page,
+    }
+
+    member_filters = []
+    if title is not None:
+        member_filters.append("m.title = %(title)s")
+        params["title"] = title
+    if is_resident is not None:
+        member_filters.append("m.is_resident = %(is_resident)s")
+        params["is_resident"] = is_resident
+    balance_filter = ""
+    if max_balance is not None:
+        balance_filter = "WHERE balance <= %(max_balance)s"
+        params["max_balance"] = max_balance
+
+    direction = "DESC" if descending else "ASC"
+    order_by = ", ".join(f"{column} {direction}" for column in MEMBER_SORT_COLUMNS[sort_by] + ("email",))
+
+    overview = f"""
+        SELECT email, title, last_name, first_name, is_resident, created_at, start_balance, balance
+        FROM (
+            SELECT m.*,
+                   m.start_balance
+                     + COALESCE((SELECT SUM(mb.total)
+                                 FROM monthly_balances mb
+                                 WHERE mb.member_email = m.email AND mb.month < %(month)s), 0)
+                     + COALESCE((SELECT SUM(t.amount)
+                                 FROM transactions t
+                                 WHERE t.member_email = m.email
+                                   AND t.date >= %(month)s AND t.date <= %(as_of)s), 0) AS balance
+            FROM members m
+            {"WHERE " + " AND ".join(member_filters) if member_filters else ""}
+        ) overview
+        {balance_filter}
+    """
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            SELECT *, COUNT(*) OVER () AS total
+            FROM ({overview}) filtered
+            ORDER BY {order_by}
+            LIMIT %(limit)s OFFSET %(offset)s
+        """, params)
+        rows = cur.fetchall()
+        if rows:
+            total = rows[0][-1]
+        elif page > 1:
+            # A page past the end has no row to carry the count
+            cur.execute(f"SELECT COUNT(*) FROM ({overview}) filtered", params)
+            total = cur.fetchone()[0]
+        else:
+            total = 0
+
+    keys = ("email", "title", "last_name", "first_name", "is_resident", "created_at", "start_balance", "balance")
+    return [dict(zip(keys, row)) for row in rows], total
@@ -0,0 +1,398 @@
+import csv
+import difflib
+import io
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from xml.etree.ElementTree import iterparse
+
+from models.validators import normalize_email
+
+
+class BankLine(NamedTuple):
+    """One booking of a bank statement; credits have a positive amount."""
+
+    line_no: int
+    booking_date: date
+    amount: Decimal
+    payer: str
+    iban: str
+    purpose: str
+
+
+# Accepted CSV header names per field (compared in lowercase), in order of preference
+CSV_COLUMNS = {
+    "date": ("buchungstag", "buchungsdatum", "datum", "booking date", "date", "valutadatum", "wertstellung"),
+    "amount": ("betrag", "betrag (eur)", "betrag (€)", "umsatz", "amount"),
+    "payer": ("beguenstigter/zahlungspflichtiger", "begünstigter/zahlungspflichtiger", "name zahlungsbeteiligter",
+              "zahlungspflichtige*r", "zahlungspflichtiger", "auftraggeber / begünstigter", "auftraggeber",
+              "payer", "counterparty", "name"),
+    "iban": ("kontonummer/iban", "iban zahlungsbeteiligter", "iban", "kontonummer", "account"),
+    "purpose": ("verwendungszweck", "purpose", "reference", "buchungstext"),
+}
+
+DATE_FORMATS = ("%d.%m.%Y", "%d.%m.%y", "%Y-%m-%d")
+
+_EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_TRANSLITERATION = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss", "é": "e", "è": "e"})
+_NAME_STOPWORDS = {"herr", "herrn", "frau", "dr", "und", "u", "familie", "fam"}
+
+
+def parse_amount(value: str) -> Decimal:
+    """
+    Parse a bank amount such as "1.234,56", "-12,50", "+20.00 EUR" or "15".
+
+    Args:
+        value (str): The amount as exported by the bank.
+
+    Returns:
+        Decimal: The amount.
+
+    Raises:
+        ValueError: If the value is not an amount.
+    """
+    text = value.replace("EUR", "").replace("€", "").replace(" ", "").replace("+", "")
+    if "," in text:
+        text = text.replace(".", "").replace(",", ".")
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Ungültiger Betrag: {value!r}")
+    if not amount.is_finite():
+        raise ValueError(f"Ungültiger Betrag: {value!r}")
+    return amount
+
+
+def parse_booking_date(value: str) -> date:
+    """
+    Parse a booking date in one of DATE_FORMATS.
+
+    Args:
+        value (str): The date as exported by the bank.
+
+    Returns:
+        date: The booking date.
+
+    Raises:
+        ValueError: If the value is not a date.
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Ungültiges Datum: {value!r}")
+
+
+def normalize_iban(iban: str) -> str:
+    """Return the IBAN without spaces, in uppercase."""
+    return re.sub(r"\s+", "", iban or "").upper()
+
+
+def name_key(name: str) -> str:
+    """
+    Normalize a person's name for matching: lowercase, umlauts transliterated,
+    salutations and punctuation removed and the words sorted, so that
+    "MUSTERMANN, MAX" and "Herr Max Mustermann" give the same key.
+
+    Args:
+        name (str): The name as written by the bank or stored for the member.
+
+    Returns:
+        str: The normalized name.
+    """
+    words = re.findall(r"[a-z0-9]+", (name or "").lower().translate(_TRANSLITERATION))
+    return " ".join(sorted(word for word in words if word not in _NAME_STOPWORDS))
+
+
+def _find_columns(header: List[str]) -> Optional[Dict[str, int]]:
+    names = [column.strip().strip('"').lower() for column in header]
+    columns = {}
+    for field, aliases in CSV_COLUMNS.items():
+        for alias in aliases:
+            if alias in names:
+                columns[field] = names.index(alias)
+                break
+    if "date" in columns and "amount" in columns:
+        return columns
+    return None
+
+
+def parse_bank_csv(lines: Iterable[str]) -> Iterator[BankLine]:
+    """
+    Parse a bank CSV export line by line.
+
+    Lines before the header row (account information that many banks put on
+    top) are skipped; the delimiter (";", "," or tab) is taken from the header.
+    Rows without a booking date, such as closing balances, are ignored.
+
+    Args:
+        lines (Iterable[str]): Lines of the decoded file.
+
+    Yields:
+        BankLine: One entry per booking.
+
+    Raises:
+        ValueError: If no header row is found or a booking has an invalid date or amount.
+    """
+    lines = iter(lines)
+    for header_no, header_line in enumerate(lines, 1):
+        delimiter = max((";", ",", "\t"), key=header_line.count)
+        header = next(csv.reader([header_line], delimiter=delimiter))
+        columns = _find_columns(header)
+        if columns is not None:
+            break
+    else:
+        raise ValueError("Keine Kopfzeile mit Buchungstag und Betrag gefunden")
+
+    def field(row: List[str], name: str) -> str:
+        index = columns.get(name)
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    for line_no, row in enumerate(csv.reader(lines, delimiter=delimiter), header_no + 1):
+        if not field(row, "date"):
+            continue
+        try:
+            yield BankLine(
+                line_no=line_no,
+                booking_date=parse_booking_date(field(row, "date")),
+                amount=parse_amount(field(row, "amount")),
+                payer=field(row, "payer"),
+                iban=normalize_iban(field(row, "iban")),
+                purpose=field(row, "purpose")
+            )
+        except ValueError as e:
+            raise ValueError(f"Zeile {line_no}: {e}")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(elem, *path: str):
+    for name in path:
+        if elem is None:
+            return None
+        elem = next((child for child in elem if _local(child.tag) == name), None)
+    return elem
+
+
+def _text(elem, *path: str) -> str:
+    found = _child(elem, *path)
+    return (found.text or "").strip() if found is not None else ""
+
+
+def parse_camt(stream: BinaryIO) -> Iterator[BankLine]:
+    """
+    Parse a camt.052 / camt.053 / camt.054 XML statement entry by entry.
+
+    Each processed <Ntry> element is discarded right away, so large
+    statements are parsed with constant memory. Batch bookings yield one
+    line per transaction detail.
+
+    Args:
+        stream (BinaryIO): The XML file.
+
+    Yields:
+        BankLine: One entry per booking; debits have a negative amount.
+
+    Raises:
+        ValueError: If the file is not valid XML or an entry has no date or amount.
+    """
+    entry_no = 0
+    root = None
+    try:
+        for event, elem in iterparse(stream, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or _local(elem.tag) != "Ntry":
+                continue
+
+            entry_no += 1
+            sign = -1 if _text(elem, "CdtDbtInd") == "DBIT" else 1
+            booked = _text(elem, "BookgDt", "Dt") or _text(elem, "BookgDt", "DtTm")[:10] or _text(elem, "ValDt", "Dt")
+            entry_details = _child(elem, "NtryDtls")
+            details = [child for child in (entry_details if entry_details is not None else [])
+                       if _local(child.tag) == "TxDtls"]
+            try:
+                booking_date = parse_booking_date(booked)
+                for detail in details or [None]:
+                    amount = ""
+                    if len(details) > 1:
+                        amount = _text(detail, "Amt") or _text(detail, "AmtDtls", "TxAmt", "Amt")
+                    amount = amount or _text(elem, "Amt")
+                    parties = _child(detail, "RltdPties")
+                    # Payer of a credit, payee of a debit; newer camt versions wrap the name in <Pty>
+                    party = "Dbtr" if sign > 0 else "Cdtr"
+                    remittance = _child(detail, "RmtInf")
+                    yield BankLine(
+                        line_no=entry_no,
+                        booking_date=booking_date,
+                        amount=sign * parse_amount(amount),
+                        payer=_text(parties, party, "Nm") or _text(parties, party, "Pty", "Nm"),
+                        iban=normalize_iban(_text(parties, f"{party}Acct", "Id", "IBAN")),
+                        purpose=" ".join(
+                            (child.text or "").strip() for child in (remittance if remittance is not None else [])
+                            if _local(child.tag) == "Ustrd"
+                        )
+                    )
+            except ValueError as e:
+                raise ValueError(f"Buchung {entry_no}: {e}")
+
+            elem.clear()
+            root.clear()
+    except SyntaxError as e:
+        raise ValueError(f"Ungültige CAMT-Datei: {e}")
+
+
+def parse_bank_statement(filename: str, stream: BinaryIO) -> Iterator[BankLine]:
+    """
+    Parse an uploaded bank statement, choosing the format by file name.
+
+    CSV files are decoded as UTF-8, or as Windows-1252 (common for German
+    bank exports) if the beginning of the file is not valid UTF-8.
+
+    Args:
+        filename (str): Name of the uploaded file (".xml" means CAMT, anything else CSV).
+        stream (BinaryIO): The seekable file contents.
+
+    Returns:
+        Iterator[BankLine]: The bookings of the statement.
+    """
+    if filename.lower().endswith(".xml"):
+        return parse_camt(stream)
+
+    sample = stream.read(65536)
+    stream.seek(0)
+    try:
+        # A multi-byte character may be cut off at the end of the sample
+        sample.decode("utf-8")
+        encoding = "utf-8-sig"
+    except UnicodeDecodeError as e:
+        encoding = "utf-8-sig" if e.start >= len(sample) - 3 else "cp1252"
+    return parse_bank_csv(io.TextIOWrapper(stream, encoding=encoding, newline=""))
+
+
+class MemberMatcher:
+    """
+    Assigns bank bookings to members using in-memory indexes.
+
+    A booking is matched, in this order, by the payer IBAN (from the stored bank
+    details), by a member email in the purpose, by the exact normalized payer
+    name and finally by the closest similar member name. Names shared by several
+    members are never matched. Results are cached per payer, so statements with
+    many bookings from the same people are matched quickly.
+    """
+
+    def __init__(self, members: Iterable, accounts: Iterable[Tuple[str, str]], fuzzy_cutoff: float = 0.88):
+        """
+        Build the indexes.
+
+        Args:
+            members (Iterable[Member]): All members.
+            accounts (Iterable[tuple]): (member email, IBAN) pairs.
+            fuzzy_cutoff (float): Minimum similarity (0..1) of a fuzzy name match.
+        """
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.emails: Set[str] = set()
+        self.by_name: Dict[str, Optional[str]] = {}
+        for member in members:
+            email = normalize_email(member.email)
+            self.emails.add(email)
+            key = name_key(f"{member.first_name or ''} {member.last_name}")
+            # Ambiguous names are kept with None, so they are never matched
+            self.by_name[key] = None if key in self.by_name and self.by_name[key] != email else email
+
+        self.by_iban: Dict[str, Optional[str]] = {}
+        for email, iban in accounts:
+            iban = normalize_iban(iban)
+            email = normalize_email(email)
+            if iban:
+                self.by_iban[iban] = None if iban in self.by_iban and self.by_iban[iban] != email else email
+
+        self._names = list(self.by_name)
+        self._cache: Dict[str, Tuple[Optional[str], str]] = {}
+
+    def match(self, line: BankLine) -> Tuple[Optional[str], str]:
+        """
+        Find the member who made a booking.
+
+        Args:
+            line (BankLine): The booking.
+
+        Returns:
+            tuple: (member email or None, method) with method "iban", "email", "name", "fuzzy" or "none".
+        """
+        if line.iban and self.by_iban.get(line.iban):
+            return self.by_iban[line.iban], "iban"
+
+        for candidate in _EMAIL_PATTERN.findall(line.purpose):
+            if normalize_email(candidate) in self.emails:
+                return normalize_email(candidate), "email"
+
+        key = name_key(line.payer)
+        if not key:
+            return None, "none"
+        if key not in self._cache:
+            self._cache[key] = self._match_name(key)
+        return self._cache[key]
+
+    def _match_name(self, key: str) -> Tuple[Optional[str], str]:
+        if key in self.by_name:
+            email = self.by_name[key]
+            return (email, "name") if email else (None, "none")
+
+        close = difflib.get_close_matches(key, self._names, n=2, cutoff=self.fuzzy_cutoff)
+        if close and self.by_name[close[0]]:
+            # Two equally good candidates are too uncertain
+            ratio = difflib.SequenceMatcher(None, key, close[0]).ratio()
+            if len(close) == 1 or difflib.SequenceMatcher(None, key, close[1]).ratio() < ratio:
+                return self.by_name[close[0]], "fuzzy"
+        return None, "none"
+
+
+def build_import_preview(lines: Iterable[BankLine],
+                         matcher: MemberMatcher,
+                         load_existing: Callable[[date, date], Set[Tuple[str, date, Decimal]]]
+                         ) -> Tuple[List[dict], int]:
+    """
+    Match the credits of a statement to members for review.
+
+    The statement is read in a single pass; only the credits are kept.
+
+    Args:
+        lines (Iterable[BankLine]): The parsed bookings.
+        matcher (MemberMatcher): Matcher built from the current members.
+        load_existing (Callable): Called with the first and last booking date of the credits,
+            returns (email, date, amount) of the CREDIT transactions already booked.
+
+    Returns:
+        Tuple[List[dict], int]: One entry per credit (line, email, method, duplicate) and
+            the number of skipped debits.
+    """
+    preview = []
+    skipped = 0
+    start = end = None
+    for line in lines:
+        if line.amount <= 0:
+            skipped += 1
+            continue
+        email, method = matcher.match(line)
+        preview.append({"line": line, "email": email, "method": method, "duplicate": False})
+        start = line.booking_date if start is None else min(start, line.booking_date)
+        end = line.booking_date if end is None else max(end, line.booking_date)
+
+    if preview:
+        existing = load_existing(start, end)
+        for entry in preview:
+            email, line = entry["email"], entry["line"]
+            entry["duplicate"] = email is not None and (email, line.booking_date, line.amount) in existing
+    return preview, skipped
+
+
+def credit_description(line: BankLine) -> str:
+    """Return the description of the CREDIT transaction for a booking."""
+    text = line.purpose or f"Überweisung von {line.payer}".strip()
+    return text[:200]
+
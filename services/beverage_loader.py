@@ -1,7 +1,74 @@
 import json
 import os
+import threading
+from decimal import Decimal
+from typing import Optional, Tuple
 
-def load_beverage_assortment():
-    path = os.path.join("config", "beverages.json")
+from models.beverage import Beverage
+
+BEVERAGES_PATH = os.path.join("config", "beverages.json")
+
+_cache: Optional[Tuple[str, int, Tuple[Beverage, ...]]] = None
+_lock = threading.Lock()
+
+
+def parse_beverage_assortment(path: str) -> Tuple[Beverage, ...]:
+    """
+    Read and validate a beverage assortment file.
+
+    Prices are parsed directly as Decimal, so they are never rounded through float.
+
+    Args:
+        path (str): Path of the JSON file, a list of {"name": ..., "price": ...} objects.
+
+    Returns:
+        Tuple[Beverage, ...]: The beverages in file order.
+
+    Raises:
+        ValueError: If an entry has no name, a duplicate name or an invalid price.
+    """
     with open(path, encoding="utf-8") as f:
-        return json.load(f)
\ No newline at end of file
+        entries = json.load(f, parse_float=Decimal, parse_int=Decimal)
+
+    beverages = []
+    for entry in entries:
+        name = str(entry.get("name", "")).strip()
+        price = entry.get("price")
+        if not name:
+            raise ValueError(f"Beverage without name in {path}")
+        if any(b.name == name for b in beverages):
+            raise ValueError(f"Duplicate beverage '{name}' in {path}")
+        if not isinstance(price, Decimal):
+            raise ValueError(f"Invalid price for '{name}' in {path}: {price!r}")
+        if not price.is_finite() or price < 0:
+            raise ValueError(f"Invalid price for '{name}' in {path}: {price}")
+        beverages.append(Beverage(name, price.quantize(Decimal("0.01"))))
+    return tuple(beverages)
+
+
+def load_beverage_assortment(path: str = BEVERAGES_PATH) -> Tuple[Beverage, ...]:
+    """
+    Return the current beverage assortment.
+
+    The file is parsed once and only re-read when its modification time
+    changes, so editing the assortment takes effect without a restart.
+
+    Args:
+        path (str): Path of the assortment file (default: config/beverages.json).
+
+    Returns:
+        Tuple[Beverage, ...]: The beverages with their prices.
+    """
+    global _cache
+    mtime = os.stat(path).st_mtime_ns
+
+    cached = _cache
+    if cached is not None and cached[:2] == (path, mtime):
+        return cached[2]
+
+    with _lock:
+        cached = _cache
+        if cached is None or cached[:2] != (path, mtime):
+            cached = (path, mtime, parse_beverage_assortment(path))
+            _cache = cached
+    return cached[2]
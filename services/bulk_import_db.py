@@ -0,0 +1,349 @@
+import csv
+import io
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import psycopg2
+from db import get_cursor
+from models.member import Title
+from models.transaction import Transaction
+from models.transaction_type import TransactionType
+from models.validators import normalize_email
+from services.bank_import import parse_amount, parse_booking_date
+
+MEMBER_COLUMNS = ("email", "first_name", "last_name", "title", "is_resident", "created_at", "start_balance")
+
+_TRUE = {"1", "true", "yes", "ja", "x"}
+_FALSE = {"0", "false", "no", "nein", ""}
+
+
+class _CopyStream(io.RawIOBase):
+    """Read-only stream that formats rows as COPY CSV on demand, for cursor.copy_expert()."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        super().__init__()
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = b""
+        self.count = 0
+        self.error: Optional[Exception] = None
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._pending) < size:
+            try:
+                batch = list(itertools.islice(self._rows, 1000))
+            except Exception as e:
+                # psycopg2 only reports that read() failed; keep the error for _copy()
+                self.error = e
+                raise
+            if not batch:
+                break
+            self._writer.writerows(batch)
+            self.count += len(batch)
+            self._pending += self._buffer.getvalue().encode("utf-8")
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+        if size < 0:
+            size = len(self._pending)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def _copy(cur, sql: str, rows: Iterable[tuple]) -> int:
+    """Run COPY ... FROM STDIN with the rows, re-raising errors of the row iterator unchanged."""
+    stream = _CopyStream(rows)
+    try:
+        cur.copy_expert(sql, stream)
+    except psycopg2.Error:
+        if stream.error is not None:
+            raise stream.error
+        raise
+    return stream.count
+
+
+def _read_csv(lines: Iterable[str], required: Tuple[str, ...]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    lines = iter(lines)
+    header_line = next(lines, "")
+    delimiter = max((";", ",", "\t"), key=header_line.count)
+    header = [name.strip().lower() for name in next(csv.reader([header_line], delimiter=delimiter), [])]
+    missing = [name for name in required if name not in header]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    for line_no, values in enumerate(csv.reader(lines, delimiter=delimiter), 2):
+        if any(value.strip() for value in values):
+            yield line_no, {name: value.strip() for name, value in zip(header, values)}
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() in _TRUE:
+        return True
+    if value.lower() in _FALSE:
+        return False
+    raise ValueError(f"invalid yes/no value {value!r}")
+
+
+def _parse_type(value: str) -> int:
+    if not value:
+        return TransactionType.CUSTOM.value
+    try:
+        return TransactionType(int(value)).value if value.isdigit() else TransactionType[value.upper()].value
+    except (KeyError, ValueError):
+        raise ValueError(f"unknown transaction type {value!r}")
+
+
+def iter_member_rows(lines: Iterable[str]) -> Iterator[tuple]:
+    """
+    Read and validate members from a CSV file.
+
+    The header must contain email and last_name; first_name, title, is_resident
+    (1/0), created_at and start_balance are optional. Missing columns and empty
+    cells are returned as None, so import_members() keeps the stored value of an
+    existing member and uses the default for a new one. The delimiter (";", ","
+    or tab) is taken from the header.
+
+    Args:
+        lines (Iterable[str]): Lines of the file.
+
+    Yields:
+        tuple: Values in MEMBER_COLUMNS order.
+
+    Raises:
+        ValueError: If a column is missing, a value is invalid or an email occurs twice.
+    """
+    seen = set()
+    for line_no, row in _read_csv(lines, ("email", "last_name")):
+        try:
+            email = normalize_email(row["email"])
+            if not email or not row["last_name"]:
+                raise ValueError("email and last_name are required")
+            if email in seen:
+                raise ValueError(f"duplicate email {email}")
+            seen.add(email)
+            title = row.get("title") or None
+            if title is not None:
+                Title(title)
+            yield (
+                email,
+                row.get("first_name") or None,
+                row["last_name"],
+                title,
+                _parse_bool(row["is_resident"]) if row.get("is_resident") else None,
+                parse_booking_date(row["created_at"]) if row.get("created_at") else None,
+                parse_amount(row["start_balance"]) if row.get("start_balance") else None
+            )
+        except ValueError as e:
+            raise ValueError(f"Line {line_no}: {e}")
+
+
+def iter_transaction_import_rows(lines: Iterable[str]) -> Iterator[tuple]:
+    """
+    Read and validate transactions from a CSV file.
+
+    The header must contain email, date and amount; description and type
+    (number or name, default CUSTOM) are optional. Dates may be given as
+    YYYY-MM-DD or DD.MM.YYYY, amounts with decimal point or comma.
+
+    Args:
+        lines (Iterable[str]): Lines of the file.
+
+    Yields:
+        tuple: (member_email, date, description, amount, transaction_type).
+
+    Raises:
+        ValueError: If a column is missing or a value is invalid.
+    """
+    for line_no, row in _read_csv(lines, ("email", "date", "amount")):
+        try:
+            yield (
+                normalize_email(row["email"]),
+                parse_booking_date(row["date"]),
+                row.get("description") or "Import",
+                parse_amount(row["amount"]),
+                _parse_type(row.get("type", ""))
+            )
+        except ValueError as e:
+            raise ValueError(f"Line {line_no}: {e}")
+
+
+def import_members(rows: Iterable[tuple], changed_by: str) -> Dict[str, int]:
+    """
+    Create or update many members with COPY and set-based merges.
+
+    The rows are copied into a temporary staging table and merged into members
+    with one UPDATE for existing and one INSERT for new members. None values keep
+    the stored value of an existing member (created_at is never changed, like in
+    Member.save_to_db()) and use the defaults for new members: no first name,
+    title F, resident, created today, start balance 0. Title and residency history
+    rows are written for new members and for members whose title or residency changed.
+
+    Args:
+        rows (Iterable[tuple]): Values in MEMBER_COLUMNS order (optional values may be None),
+            e.g. from iter_member_rows().
+        changed_by (str): Email of the admin recorded in the history tables.
+
+    Returns:
+        Dict[str, int]: Number of rows "imported", "created", "title_changes" and "residency_changes".
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            CREATE TEMP TABLE member_import (
+                email         VARCHAR PRIMARY KEY,
+                first_name    VARCHAR,
+                last_name     VARCHAR NOT NULL,
+                title         VARCHAR,
+                is_resident   BOOLEAN,
+                created_at    DATE,
+                start_balance NUMERIC(10, 2),
+                old_title     VARCHAR,
+                old_resident  BOOLEAN
+            ) ON COMMIT DROP
+        """)
+        imported = _copy(cur, f"COPY member_import ({', '.join(MEMBER_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", rows)
+
+        # Remember the current values to log only real changes
+        cur.execute("""
+            UPDATE member_import i
+            SET old_title = m.title, old_resident = m.is_resident
+            FROM members m
+            WHERE m.email = i.email
+        """)
+        # Columns missing in the file are NULL and keep the stored values
+        cur.execute("""
+            UPDATE members m
+            SET first_name    = COALESCE(i.first_name, m.first_name),
+                last_name     = i.last_name,
+                title         = COALESCE(i.title, m.title),
+                is_resident   = COALESCE(i.is_resident, m.is_resident),
+                start_balance = COALESCE(i.start_balance, m.start_balance)
+            FROM member_import i
+            WHERE m.email = i.email
+        """)
+        cur.execute("""
+            INSERT INTO members (email, first_name, last_name, title, is_resident, created_at, start_balance)
+            SELECT email, COALESCE(first_name, ''), last_name, COALESCE(title, 'F'), COALESCE(is_resident, TRUE),
+                   COALESCE(created_at, CURRENT_DATE), COALESCE(start_balance, 0)
+            FROM member_import i
+            WHERE NOT EXISTS (SELECT 1 FROM members m WHERE m.email = i.email)
+        """)
+        created = cur.rowcount
+
+        cur.execute("""
+            INSERT INTO title_changes (member_email, changed_at, new_title, changed_by)
+            SELECT m.email, CURRENT_TIMESTAMP, m.title, %s
+            FROM member_import i
+            JOIN members m ON m.email = i.email
+            WHERE i.old_title IS DISTINCT FROM m.title
+               OR NOT EXISTS (SELECT 1 FROM title_changes t WHERE t.member_email = m.email)
+        """, (changed_by,))
+        title_changes = cur.rowcount
+
+        cur.execute("""
+            INSERT INTO residency_changes (member_email, changed_at, new_resident, changed_by)
+            SELECT m.email, CURRENT_TIMESTAMP, m.is_resident, %s
+            FROM member_import i
+            JOIN members m ON m.email = i.email
+            WHERE i.old_resident IS DISTINCT FROM m.is_resident
+               OR NOT EXISTS (SELECT 1 FROM residency_changes r WHERE r.member_email = m.email)
+        """, (changed_by,))
+        residency_changes = cur.rowcount
+
+    return {
+        "imported": imported,
+        "created": created,
+        "title_changes": title_changes,
+        "residency_changes": residency_changes
+    }
+
+
+def import_transactions(rows: Iterable[tuple], changed_by: str, skip_existing: bool = False) -> Dict[str, int]:
+    """
+    Insert many transactions with COPY and one set-based merge.
+
+    The rows are copied into a temporary staging table and inserted into
+    transactions with one statement that also writes the change log entries
+    and adds the amounts to monthly_balances. Either all rows are imported or none.
+
+    Args:
+        rows (Iterable[tuple]): (member_email, date, description, amount, transaction_type) tuples,
+            e.g. from iter_transaction_import_rows().
+        changed_by (str): Email of the admin recorded in the change log.
+        skip_existing (bool): Skip rows that equal an existing transaction in member, date,
+            description, amount and type, so an import can be repeated safely.
+
+    Returns:
+        Dict[str, int]: Number of rows "imported" and "skipped".
+
+    Raises:
+        ValueError: If a row refers to an unknown member.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            CREATE TEMP TABLE transaction_import (
+                member_email     VARCHAR        NOT NULL,
+                date             DATE           NOT NULL,
+                description      TEXT           NOT NULL,
+                amount           NUMERIC(10, 2) NOT NULL,
+                transaction_type INTEGER        NOT NULL
+            ) ON COMMIT DROP
+        """)
+        _copy(cur, """
+            COPY transaction_import (member_email, date, description, amount, transaction_type)
+            FROM STDIN WITH (FORMAT csv)
+        """, rows)
+
+        cur.execute("""
+            SELECT DISTINCT i.member_email
+            FROM transaction_import i
+            WHERE NOT EXISTS (SELECT 1 FROM members m WHERE m.email = i.member_email)
+            ORDER BY 1
+            LIMIT 10
+        """)
+        unknown = [email for (email,) in cur.fetchall()]
+        if unknown:
+            raise ValueError(f"Unknown member(s): {', '.join(unknown)}")
+
+        skipped = 0
+        if skip_existing:
+            cur.execute("""
+                DELETE FROM transaction_import i
+                USING transactions t
+                WHERE t.member_email = i.member_email
+                  AND t.date = i.date
+                  AND t.description = i.description
+                  AND t.amount = i.amount
+                  AND t.transaction_type = i.transaction_type
+            """)
+            skipped = cur.rowcount
+
+        cur.execute("""
+            WITH inserted AS (
+                INSERT INTO transactions (member_email, date, description, amount, transaction_type)
+                SELECT member_email, date, description, amount, transaction_type
+                FROM transaction_import
+                ORDER BY member_email, date
+                RETURNING id, member_email, date, description, amount
+            ), logged AS (
+                INSERT INTO transaction_change_log (transaction_id, action, changed_by, description)
+                SELECT id, 'create', %s, 'Imported transaction: ' || description
+                FROM inserted
+            )
+            INSERT INTO monthly_balances (member_email, month, total)
+            SELECT member_email, date_trunc('month', date)::date, SUM(amount)
+            FROM inserted
+            GROUP BY member_email, date_trunc('month', date)
+            ON CONFLICT (member_email, month) DO UPDATE SET total = monthly_balances.total + EXCLUDED.total
+        """, (changed_by,))
+
+        cur.execute("SELECT member_email, COUNT(*) FROM transaction_import GROUP BY member_email")
+        counts: List[Tuple[str, int]] = cur.fetchall()
+
+    for email, _ in counts:
+        Transaction.mark_ledger_changed(email)
+
+    return {"imported": sum(count for _, count in counts), "skipped": skipped}
@@ -0,0 +1,111 @@
+import os
+import threading
+from typing import Dict, List, Tuple
+from jinja2 import Template
+
+EMAIL_TEMPLATE_DIR = os.path.join("config", "emails")
+
+
+class TemplateRegistry:
+    """
+    Cache of compiled Jinja2 email templates.
+
+    Templates are addressed by name ("balance_report" -> config/emails/balance_report.html)
+    or by file path. Each file is read and compiled once and only recompiled
+    when its modification time changes, so editing a template takes effect
+    without a restart.
+    """
+
+    def __init__(self, directory: str = EMAIL_TEMPLATE_DIR):
+        """
+        Create an empty registry.
+
+        Args:
+            directory (str): Directory that holds the named templates.
+        """
+        self.directory = directory
+        self._cache: Dict[str, Tuple[int, Template]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, name: str) -> str:
+        """
+        Map a template name to its file path; paths are returned unchanged.
+
+        Args:
+            name (str): Template name (without extension) or path to a template file.
+
+        Returns:
+            str: Path of the template file.
+        """
+        if os.sep in name or "/" in name or name.endswith(".html"):
+            return name
+        return os.path.join(self.directory, f"{name}.html")
+
+    def get(self, name: str) -> Template:
+        """
+        Return the compiled template, recompiling it if the file changed.
+
+        Args:
+            name (str): Template name or path to a template file.
+
+        Returns:
+            Template: The compiled template.
+
+        Raises:
+            FileNotFoundError: If the template file doesn't exist.
+        """
+        path = self.resolve(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Email template not found at {path}")
+
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is None or cached[0] != mtime:
+                with open(path, "r", encoding="utf-8") as f:
+                    cached = (mtime, Template(f.read()))
+                self._cache[path] = cached
+        return cached[1]
+
+    def render(self, name: str, /, **context) -> str:
+        """
+        Render a template with the given context.
+
+        Args:
+            name (str): Template name or path to a template file (positional only,
+                so templates can use a "name" variable).
+            **context: Template variables.
+
+        Returns:
+            str: The rendered text.
+        """
+        return self.get(name).render(**context)
+
+    def names(self) -> List[str]:
+        """
+        List the named templates available in the template directory.
+
+        Returns:
+            List[str]: Template names without extension, sorted.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(f[:-len(".html")] for f in os.listdir(self.directory) if f.endswith(".html"))
+
+    def clear(self) -> None:
+        """Drop all compiled templates."""
+        with self._lock:
+            self._cache.clear()
+
+
+_registry = TemplateRegistry()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Return the process-wide email template registry."""
+    return _registry
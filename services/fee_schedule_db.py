@@ -0,0 +1,60 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Tuple
+
+from db import get_cursor
+from models.fee_schedule import FeeSchedule
+from services.settings_loader import get_monthly_payment_for_residents, get_monthly_payment_for_non_residents
+
+
+def load_fee_rates() -> List[Tuple[date, bool, Decimal]]:
+    """
+    Load all stored monthly fee rates.
+
+    Returns:
+        List[tuple]: (valid_from, is_resident, amount) rows ordered by valid_from.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT valid_from, is_resident, amount
+            FROM fee_schedule
+            ORDER BY valid_from, is_resident
+        """)
+        return [(valid_from, is_resident, amount) for valid_from, is_resident, amount in cur.fetchall()]
+
+
+def load_fee_schedule() -> FeeSchedule:
+    """
+    Load the fee schedule, using the configured fees for months before the first stored rate.
+
+    Returns:
+        FeeSchedule: The effective-dated fee schedule.
+    """
+    return FeeSchedule(
+        load_fee_rates(),
+        default_resident=get_monthly_payment_for_residents(),
+        default_non_resident=get_monthly_payment_for_non_residents()
+    )
+
+
+def save_fee_rate(valid_from: date, is_resident: bool, amount: Decimal) -> None:
+    """
+    Store the monthly fee that applies from the given month on, replacing an existing rate for that month.
+
+    Args:
+        valid_from (date): First month the fee applies to (the day is ignored).
+        is_resident (bool): Whether the fee is for residents.
+        amount (Decimal): The monthly fee.
+
+    Raises:
+        ValueError: If the amount is negative.
+    """
+    if amount < 0:
+        raise ValueError("Monthly fee must not be negative.")
+
+    with get_cursor() as cur:
+        cur.execute("""
+            INSERT INTO fee_schedule (valid_from, is_resident, amount)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (valid_from, is_resident) DO UPDATE SET amount = EXCLUDED.amount
+        """, (valid_from.replace(day=1), is_resident, amount))
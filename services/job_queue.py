@@ -0,0 +1,186 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+from services import jobs_db
+
+logger = logging.getLogger(__name__)
+
+_current = threading.local()
+
+
+def current_job_id() -> Optional[int]:
+    """Return the ID of the job executed by the calling worker thread, if any."""
+    return getattr(_current, "job_id", None)
+
+
+class JobQueue:
+    """
+    Runs registered job handlers on a local thread pool.
+
+    Every job is stored in the jobs table before it is scheduled, so its status
+    can be polled from any process, and queued or abandoned jobs are picked up
+    again after a restart. A job is claimed with an atomic status update, so it
+    never runs twice even if several processes recover the same queue. While a
+    job runs, a heartbeat thread refreshes it in the jobs table, so only jobs of
+    a dead worker are considered abandoned. The same thread recovers queued and
+    abandoned jobs when the queue is started and then regularly.
+    """
+
+    def __init__(self, max_workers: int = 2, stale_after: float = 600.0, max_attempts: int = 3):
+        """
+        Configure the queue; worker threads are started by start() or on first submit.
+
+        Args:
+            max_workers (int): Number of worker threads per process.
+            stale_after (float): Seconds without heartbeat after which a running job is considered abandoned.
+            max_attempts (int): Number of starts after which an abandoned job is marked failed.
+        """
+        self.max_workers = max_workers
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.heartbeat_interval = stale_after / 4
+        self.handlers: Dict[str, Callable[[dict], Optional[dict]]] = {}
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._running: Set[int] = set()
+        self._scheduled: Set[int] = set()
+        self._stop_heartbeat = threading.Event()
+
+    def register(self, job_type: str, handler: Callable[[dict], Optional[dict]]) -> None:
+        """
+        Register the handler for a job type.
+
+        Args:
+            job_type (str): Name under which jobs are submitted.
+            handler (Callable): Called with the job payload, returns a JSON-serializable result.
+                The running job's ID is available through current_job_id().
+        """
+        self.handlers[job_type] = handler
+
+    def start(self) -> None:
+        """
+        Start the worker threads of this process and recover pending jobs.
+
+        Safe to call repeatedly, e.g. on every request; only the first call in
+        a process starts anything.
+        """
+        self._get_executor()
+
+    def submit(self, job_type: str, payload: Optional[dict] = None) -> int:
+        """
+        Persist a job and schedule it for execution.
+
+        Args:
+            job_type (str): Name of a registered handler.
+            payload (dict, optional): JSON-serializable arguments for the handler.
+
+        Returns:
+            int: The ID of the new job.
+
+        Raises:
+            ValueError: If no handler is registered for the job type.
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job_id = jobs_db.create_job(job_type, payload or {})
+        self._schedule(job_id)
+        return job_id
+
+    def run(self, job_id: int) -> bool:
+        """
+        Claim and execute a single job, storing its result or error.
+
+        Args:
+            job_id (int): ID of the job.
+
+        Returns:
+            bool: True if the job was executed by this call, False if it was already claimed.
+        """
+        try:
+            claimed = jobs_db.claim_job(job_id)
+        finally:
+            with self._lock:
+                self._scheduled.discard(job_id)
+        if claimed is None:
+            return False
+
+        job_type, payload = claimed
+        with self._lock:
+            self._running.add(job_id)
+        _current.job_id = job_id
+        try:
+            handler = self.handlers[job_type]
+            result = handler(payload)
+        except Exception as e:
+            logger.exception(f"Job {job_id} ({job_type}) failed")
+            jobs_db.fail_job(job_id, str(e))
+        else:
+            jobs_db.finish_job(job_id, result)
+        finally:
+            _current.job_id = None
+            with self._lock:
+                self._running.discard(job_id)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads of this process."""
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                executor = self._executor
+            else:
+                executor = None
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        self._stop_heartbeat.set()
+
+    def _schedule(self, job_id: int) -> None:
+        executor = self._get_executor()
+        with self._lock:
+            # Recovery lists every queued job, including those still waiting for a worker here
+            if job_id in self._scheduled:
+                return
+            self._scheduled.add(job_id)
+        executor.submit(self.run, job_id)
+
+    def _recover(self) -> None:
+        try:
+            pending = jobs_db.requeue_stale_jobs(self.stale_after, self.max_attempts)
+        except Exception as e:
+            logger.error(f"Could not recover pending jobs: {e}")
+            return
+        for job_id in pending:
+            self._schedule(job_id)
+
+    def _heartbeat(self, stop: threading.Event) -> None:
+        self._recover()
+        while not stop.wait(self.heartbeat_interval):
+            with self._lock:
+                running = list(self._running)
+            try:
+                jobs_db.heartbeat_jobs(running)
+            except Exception as e:
+                logger.error(f"Could not record job heartbeat: {e}")
+            if not stop.is_set():
+                self._recover()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # A pool inherited through fork() has no threads, so start a new one for this process
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                return self._executor
+
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            self._pid = os.getpid()
+            # Jobs running or scheduled in a parent process are not ours to report
+            self._running = set()
+            self._scheduled = set()
+            self._stop_heartbeat = threading.Event()
+            threading.Thread(target=self._heartbeat, args=(self._stop_heartbeat,),
+                             name="job-heartbeat", daemon=True).start()
+            return self._executor
@@ -0,0 +1,183 @@
+from typing import Iterable, List, Optional, Set, Tuple
+from psycopg2.extras import Json
+from db import get_cursor
+
+
+def create_job(job_type: str, payload: dict) -> int:
+    """
+    Store a new queued job.
+
+    Args:
+        job_type (str): Name of the registered job handler.
+        payload (dict): JSON-serializable arguments for the handler.
+
+    Returns:
+        int: The ID of the new job.
+    """
+    with get_cursor() as cur:
+        cur.execute(
+            "INSERT INTO jobs (job_type, payload) VALUES (%s, %s) RETURNING id",
+            (job_type, Json(payload))
+        )
+        return cur.fetchone()[0]
+
+
+def claim_job(job_id: int) -> Optional[Tuple[str, dict]]:
+    """
+    Mark a queued job as running, unless another worker already claimed it.
+
+    Args:
+        job_id (int): ID of the job.
+
+    Returns:
+        tuple | None: (job_type, payload) if the job was claimed, otherwise None.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'running', started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP,
+                attempts = attempts + 1
+            WHERE id = %s AND status = 'queued'
+            RETURNING job_type, payload
+        """, (job_id,))
+        return cur.fetchone()
+
+
+def heartbeat_jobs(job_ids: Iterable[int]) -> None:
+    """
+    Record that the given running jobs are still being worked on.
+
+    Args:
+        job_ids (Iterable[int]): IDs of the jobs running in this process.
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return
+
+    with get_cursor() as cur:
+        cur.execute("""
+            UPDATE jobs
+            SET heartbeat_at = CURRENT_TIMESTAMP
+            WHERE id = ANY(%s) AND status = 'running'
+        """, (job_ids,))
+
+
+def finish_job(job_id: int, result: Optional[dict] = None) -> None:
+    """
+    Mark a job as successfully done.
+
+    Args:
+        job_id (int): ID of the job.
+        result (dict, optional): JSON-serializable result of the handler.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'done', result = %s, finished_at = CURRENT_TIMESTAMP
+            WHERE id = %s
+        """, (Json(result), job_id))
+
+
+def fail_job(job_id: int, error: str) -> None:
+    """
+    Mark a job as failed.
+
+    Args:
+        job_id (int): ID of the job.
+        error (str): Error message to store.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'failed', error = %s, finished_at = CURRENT_TIMESTAMP
+            WHERE id = %s
+        """, (error, job_id))
+
+
+def load_job(job_id: int) -> Optional[dict]:
+    """
+    Load the state of a job.
+
+    Args:
+        job_id (int): ID of the job.
+
+    Returns:
+        dict | None: Job fields, or None if no such job exists.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT id, job_type, status, result, error, attempts, created_at, started_at, finished_at
+            FROM jobs
+            WHERE id = %s
+        """, (job_id,))
+        row = cur.fetchone()
+
+    if not row:
+        return None
+
+    keys = ("id", "job_type", "status", "result", "error", "attempts", "created_at", "started_at", "finished_at")
+    return dict(zip(keys, row))
+
+
+def requeue_stale_jobs(stale_after: float, max_attempts: int = 3) -> List[int]:
+    """
+    Requeue jobs left running by a crashed worker and return all queued job IDs.
+
+    Workers refresh heartbeat_at of their running jobs regularly, so a long
+    job is only requeued once its worker has stopped (e.g. the process died).
+    A job that was already started max_attempts times is marked failed instead,
+    so a job that kills its worker is not retried forever.
+
+    Args:
+        stale_after (float): Seconds without heartbeat after which a running job is considered abandoned.
+        max_attempts (int): Number of starts after which an abandoned job is given up.
+
+    Returns:
+        List[int]: IDs of all queued jobs, oldest first.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'failed', error = 'Abandoned after ' || attempts || ' attempts',
+                finished_at = CURRENT_TIMESTAMP
+            WHERE status = 'running' AND attempts >= %s
+              AND COALESCE(heartbeat_at, started_at) < CURRENT_TIMESTAMP - make_interval(secs => %s)
+        """, (max_attempts, stale_after))
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'queued', started_at = NULL, heartbeat_at = NULL
+            WHERE status = 'running'
+              AND COALESCE(heartbeat_at, started_at) < CURRENT_TIMESTAMP - make_interval(secs => %s)
+        """, (stale_after,))
+        cur.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY id")
+        return [row[0] for row in cur.fetchall()]
+
+
+def record_job_delivery(job_id: int, email: str) -> None:
+    """
+    Remember that a job already sent its email to the recipient.
+
+    Args:
+        job_id (int): ID of the job.
+        email (str): Email address of the recipient.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            INSERT INTO job_deliveries (job_id, email) VALUES (%s, %s)
+            ON CONFLICT DO NOTHING
+        """, (job_id, email))
+
+
+def load_job_deliveries(job_id: int) -> Set[str]:
+    """
+    Load the recipients a job already sent its email to, e.g. before it is retried.
+
+    Args:
+        job_id (int): ID of the job.
+
+    Returns:
+        Set[str]: Email addresses of the recipients.
+    """
+    with get_cursor() as cur:
+        cur.execute("SELECT email FROM job_deliveries WHERE job_id = %s", (job_id,))
+        return {row[0] for row in cur.fetchall()}
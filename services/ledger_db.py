@@ -0,0 +1,110 @@
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Tuple
+from db import get_cursor
+
+UPSERT_MONTHLY_BALANCE = """
+    INSERT INTO monthly_balances (member_email, month, total)
+    VALUES {}
+    ON CONFLICT (member_email, month) DO UPDATE SET total = monthly_balances.total + EXCLUDED.total
+"""
+
+
+def apply_ledger_deltas(cur, deltas: Iterable[Tuple[str, date, Decimal]]) -> None:
+    """
+    Add transaction amounts to the per-member monthly totals in monthly_balances.
+
+    Must be called with the cursor that wrote the transactions, so the
+    snapshot is updated in the same database transaction.
+
+    Args:
+        cur: Open database cursor.
+        deltas (Iterable[tuple]): (member_email, transaction_date, amount) triples.
+            Use a negative amount to remove a transaction from the totals.
+    """
+    grouped = {}
+    for email, tx_date, amount in deltas:
+        key = (email, tx_date.replace(day=1))
+        grouped[key] = grouped.get(key, Decimal("0.00")) + Decimal(amount)
+
+    values = [(email, month, total) for (email, month), total in grouped.items() if total != 0]
+    if not values:
+        return
+
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(values))
+    cur.execute(UPSERT_MONTHLY_BALANCE.format(placeholders), [v for row in values for v in row])
+
+
+def load_balance_at(email: str, target_date: date) -> Decimal:
+    """
+    Return the sum of a member's transactions up to the given date (inclusive).
+
+    Completed months are read from monthly_balances; only the transactions
+    of the target month itself are summed from the transactions table.
+
+    Args:
+        email (str): Email of the member.
+        target_date (date): The date up to which transactions are considered.
+
+    Returns:
+        Decimal: Sum of all transaction amounts up to target_date (without start balance).
+    """
+    month_start = target_date.replace(day=1)
+
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT
+                COALESCE((SELECT SUM(total)
+                          FROM monthly_balances
+                          WHERE member_email = %s AND month < %s), 0)
+              + COALESCE((SELECT SUM(amount)
+                          FROM transactions
+                          WHERE member_email = %s AND date >= %s AND date <= %s), 0)
+        """, (email, month_start, email, month_start, target_date))
+        total = cur.fetchone()[0]
+
+    return Decimal(total)
+
+
+def rebuild_monthly_balances() -> int:
+    """
+    Recompute monthly_balances from scratch from the transactions table.
+
+    Returns:
+        int: Number of (member, month) rows written.
+    """
+    with get_cursor() as cur:
+        cur.execute("LOCK TABLE transactions IN SHARE MODE")
+        cur.execute("DELETE FROM monthly_balances")
+        cur.execute("""
+            INSERT INTO monthly_balances (member_email, month, total)
+            SELECT member_email, date_trunc('month', date)::date, SUM(amount)
+            FROM transactions
+            GROUP BY member_email, date_trunc('month', date)
+        """)
+        return cur.rowcount
+
+
+def verify_monthly_balances() -> List[Tuple[str, date, Decimal, Decimal]]:
+    """
+    Compare monthly_balances with the totals recomputed from transactions.
+
+    Returns:
+        List[tuple]: (member_email, month, stored_total, actual_total) for every mismatch.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT COALESCE(s.member_email, a.member_email),
+                   COALESCE(s.month, a.month),
+                   COALESCE(s.total, 0),
+                   COALESCE(a.total, 0)
+            FROM monthly_balances s
+            FULL OUTER JOIN (
+                SELECT member_email, date_trunc('month', date)::date AS month, SUM(amount) AS total
+                FROM transactions
+                GROUP BY member_email, date_trunc('month', date)
+            ) a ON a.member_email = s.member_email AND a.month = s.month
+            WHERE COALESCE(s.total, 0) <> COALESCE(a.total, 0)
+            ORDER BY 1, 2
+        """)
+        return cur.fetchall()
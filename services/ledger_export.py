@@ -0,0 +1,235 @@
+import csv
+import io
+import re
+import zipfile
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Iterator
+from xml.sax.saxutils import escape
+
+from models.transaction_type import TransactionType
+
+EXPORT_HEADER = ("ID", "E-Mail", "Datum", "Typ", "Beschreibung", "Betrag", "Kontostand")
+EXPORT_BATCH_ROWS = 1000
+
+# Characters that are not allowed in XML 1.0 documents
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_EXCEL_EPOCH = date(1899, 12, 30)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+_TYPE_LABELS = {t.value: t.label() for t in TransactionType}
+
+
+def _type_label(type_number: int) -> str:
+    return _TYPE_LABELS.get(type_number) or str(type_number)
+
+
+def _csv_text(value: str) -> str:
+    # Keep spreadsheet programs from running text such as "=HYPERLINK(...)" as a formula
+    if value and value[0] in _FORMULA_PREFIXES:
+        return "'" + value
+    return value
+
+
+def _german_decimal(value: Decimal) -> str:
+    return f"{value:.2f}".replace(".", ",")
+
+
+def iter_ledger_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    """
+    Convert ledger rows into CSV text chunks.
+
+    The output uses ";" as separator, German decimal commas and starts with a
+    UTF-8 byte order mark, so Excel opens it correctly with a German locale.
+    Descriptions that would start a formula are prefixed with "'".
+
+    Args:
+        rows (Iterable[tuple]): Rows from iter_ledger_rows().
+
+    Yields:
+        str: CSV text, EXPORT_BATCH_ROWS rows per chunk.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\r\n")
+
+    # Rows are ordered by date per member, so the same few dates repeat
+    dates = {}
+
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_HEADER)
+    for count, (tx_id, email, tx_date, tx_type, description, amount, balance) in enumerate(rows, 1):
+        date_text = dates.get(tx_date)
+        if date_text is None:
+            date_text = dates[tx_date] = tx_date.strftime("%d.%m.%Y")
+        writer.writerow((
+            tx_id,
+            email,
+            date_text,
+            _type_label(tx_type),
+            _csv_text(description),
+            _german_decimal(amount),
+            _german_decimal(balance)
+        ))
+        if count % EXPORT_BATCH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable stream that collects the bytes written by ZipFile."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\n'
+    '<Default Extension="xml" ContentType="application/xml"/>\n'
+    '<Override PartName="/xl/workbook.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>\n'
+    '<Override PartName="/xl/worksheets/sheet1.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>\n'
+    '<Override PartName="/xl/styles.xml"'
+    ' ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>\n'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"'
+    ' Target="xl/workbook.xml"/>\n'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">\n'
+    '<sheets><sheet name="Buchungen" sheetId="1" r:id="rId1"/></sheets>\n'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"'
+    ' Target="worksheets/sheet1.xml"/>\n'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"'
+    ' Target="styles.xml"/>\n'
+    '</Relationships>'
+)
+
+# Cell styles: 0 = default, 1 = bold header, 2 = date (dd.mm.yyyy), 3 = amount (#,##0.00)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\n'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="dd.mm.yyyy"/></numFmts>\n'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>\n'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>\n'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>\n'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>\n'
+    '<cellXfs count="4">\n'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>\n'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>\n'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\n'
+    '<xf numFmtId="4" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\n'
+    '</cellXfs>\n'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>\n'
+    '</styleSheet>'
+)
+
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\n'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews>\n'
+    '<sheetData>'
+)
+
+_SHEET_END = "</sheetData></worksheet>"
+
+
+def _text_cell(value: str, style: int = 0) -> str:
+    text = escape(_XML_INVALID.sub("", str(value)))
+    style_attr = f' s="{style}"' if style else ""
+    return f'<c t="inlineStr"{style_attr}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _sheet_row(row: tuple) -> str:
+    tx_id, email, tx_date, tx_type, description, amount, balance = row
+    return (
+        f'<row><c><v>{tx_id}</v></c>'
+        f'{_text_cell(email)}'
+        f'<c s="2"><v>{(tx_date - _EXCEL_EPOCH).days}</v></c>'
+        f'{_text_cell(_type_label(tx_type))}'
+        f'{_text_cell(description)}'
+        f'<c s="3"><v>{amount}</v></c>'
+        f'<c s="3"><v>{balance}</v></c></row>'
+    )
+
+
+def iter_ledger_xlsx(rows: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Convert ledger rows into an XLSX workbook, streamed as zip chunks.
+
+    The worksheet is written row by row into a zip stream with data
+    descriptors, so neither the rows nor the workbook are held in memory.
+    Dates and amounts are stored as numbers with date and currency formats.
+
+    Args:
+        rows (Iterable[tuple]): Rows from iter_ledger_rows().
+
+    Yields:
+        bytes: Parts of the XLSX file.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as workbook:
+        for name, content in (("[Content_Types].xml", _CONTENT_TYPES),
+                              ("_rels/.rels", _ROOT_RELS),
+                              ("xl/workbook.xml", _WORKBOOK),
+                              ("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS),
+                              ("xl/styles.xml", _STYLES)):
+            workbook.writestr(name, content)
+        yield sink.drain()
+
+        with workbook.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            header = "".join(_text_cell(title, style=1) for title in EXPORT_HEADER)
+            batch = [_SHEET_START, f"<row>{header}</row>"]
+            for row in rows:
+                batch.append(_sheet_row(row))
+                if len(batch) >= EXPORT_BATCH_ROWS:
+                    sheet.write("".join(batch).encode("utf-8"))
+                    batch = []
+                    yield sink.drain()
+            batch.append(_SHEET_END)
+            sheet.write("".join(batch).encode("utf-8"))
+    yield sink.drain()
+
+
+# Export format -> (chunk generator, MIME type)
+EXPORT_FORMATS = {
+    "csv": (iter_ledger_csv, "text/csv; charset=utf-8"),
+    "xlsx": (iter_ledger_xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Iterable, Tuple
+from psycopg2.extras import execute_values
 from db import get_cursor
 
 
@@ -130,3 +132,29 @@ def log_transaction_change(
             changed_by,
             description
         ))
+
+
+def log_transaction_changes(entries: Iterable[Tuple[int, str, str, str]]) -> None:
+    """
+    Log changes of several transactions with a single statement.
+
+    When called inside an open get_cursor() block, the log rows are written
+    in the same database transaction as the surrounding changes.
+
+    Args:
+        entries (Iterable[tuple]): (transaction_id, action, changed_by, description) tuples.
+    """
+    entries = list(entries)
+    if not entries:
+        return
+
+    with get_cursor() as cur:
+        execute_values(cur, """
+            INSERT INTO transaction_change_log (
+                transaction_id,
+                action,
+                changed_by,
+                description
+            )
+            VALUES %s
+        """, entries, page_size=len(entries))
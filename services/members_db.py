@@ -1,6 +1,31 @@
-from typing import List
+from datetime import date
+from typing import List, Optional, Sequence, Union
 from db import get_cursor
 from models.member import Member
+from models.validators import normalize_email
+
+MEMBER_COLUMNS = "email, last_name, first_name, title, is_resident, created_at, start_balance"
+
+
+def member_from_row(row) -> Member:
+    """
+    Build a Member object from a database row selected with MEMBER_COLUMNS.
+
+    Args:
+        row (tuple): Row in the column order of MEMBER_COLUMNS.
+
+    Returns:
+        Member: The corresponding Member object.
+    """
+    return Member(
+        email=row[0],
+        last_name=row[1],
+        first_name=row[2] or "",
+        title=row[3],
+        is_resident=row[4],
+        created_at=row[5],
+        start_balance=row[6]
+    )
 
 
 def load_member_by_email(email: str) -> Member:
@@ -14,43 +39,159 @@ def load_member_by_email(email: str) -> Member:
         Member: A Member object with full data.
     """
     with get_cursor() as cur:
-        cur.execute("""
-            SELECT email, last_name, first_name, title, is_resident, created_at, start_balance
+        cur.execute(f"""
+            SELECT {MEMBER_COLUMNS}
             FROM members WHERE email = %s
-        """, (email,))
+        """, (normalize_email(email),))
         row = cur.fetchone()
 
         if not row:
             raise ValueError(f"Member '{email}' not found in the database.")
 
-    return Member(
-            email=row[0],
-            last_name=row[1],
-            first_name=row[2] or "",
-            title=row[3],
-            is_resident=row[4],
-            created_at=row[5],
-            start_balance=row[6]
-        )
+    return member_from_row(row)
+
+
+def load_members(title: Union[str, Sequence[str], None] = None,
+                 is_resident: Optional[bool] = None,
+                 created_from: Optional[date] = None,
+                 created_to: Optional[date] = None) -> List[Member]:
+    """
+    Load members with a single query, optionally filtered.
+
+    Args:
+        title (str | list[str], optional): Title or list of titles to include.
+        is_resident (bool, optional): Only residents (True) or non-residents (False).
+        created_from (date, optional): Earliest creation date (inclusive).
+        created_to (date, optional): Latest creation date (inclusive).
+
+    Returns:
+        List[Member]: Matching members ordered by last name and first name.
+    """
+    conditions = []
+    params = []
+
+    if title is not None:
+        titles = [title] if isinstance(title, str) else list(title)
+        conditions.append("title = ANY(%s)")
+        params.append(titles)
+    if is_resident is not None:
+        conditions.append("is_resident = %s")
+        params.append(is_resident)
+    if created_from is not None:
+        conditions.append("created_at >= %s")
+        params.append(created_from)
+    if created_to is not None:
+        conditions.append("created_at <= %s")
+        params.append(created_to)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            SELECT {MEMBER_COLUMNS}
+            FROM members
+            {where}
+            ORDER BY last_name, first_name
+        """, params)
+        rows = cur.fetchall()
+
+    return [member_from_row(row) for row in rows]
 
 
 def load_all_members() -> List[Member]:
     """
-    Load all members from the database using load_member(email).
+    Load all members from the database in one round-trip.
 
     Returns:
         List[Member]: List of Member objects.
     """
+    return load_members()
+
+
+def load_members_with_debt() -> List[Member]:
+    """
+    Load all members whose current balance is negative.
+
+    Like Member.get_balance(), only transactions up to today are counted.
+
+    Returns:
+        List[Member]: Members in debt ordered by last name and first name.
+    """
     with get_cursor() as cur:
-        cur.execute("SELECT email FROM members ORDER BY last_name, first_name")
-        emails = [row[0] for row in cur.fetchall()]
-
-    members = []
-    for email in emails:
-        try:
-            member = load_member_by_email(email)
-            members.append(member)
-        except Exception as e:
-            print(f"[!] Failed to load {email}: {e}")
-
-    return members
+        cur.execute(f"""
+            SELECT {MEMBER_COLUMNS}
+            FROM members m
+            WHERE m.start_balance + COALESCE((
+                SELECT SUM(t.amount)
+                FROM transactions t
+                WHERE t.member_email = m.email AND t.date <= CURRENT_DATE
+            ), 0) < 0
+            ORDER BY last_name, first_name
+        """)
+        rows = cur.fetchall()
+
+    return [member_from_row(row) for row in rows]
+
+
+# Tables whose member_email column references members.email
+MEMBER_EMAIL_TABLES = (
+    "transactions",
+    "monthly_balances",
+    "title_changes",
+    "residency_changes",
+    "reimbursement_items",
+    "bank_details",
+)
+
+
+def normalize_member_emails() -> int:
+    """
+    Migrate all stored member emails to their normalized (lowercase) form.
+
+    Members with mixed-case emails are re-inserted under the lowercase email,
+    all referencing rows are moved over, and the old rows are deleted, all in
+    one database transaction. Afterwards the lowercase check constraint and the
+    (member_email, date) index on transactions are created if missing.
+
+    Returns:
+        int: Number of members whose email was changed.
+
+    Raises:
+        ValueError: If two members only differ in the case of their email.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT LOWER(email)
+            FROM members
+            GROUP BY LOWER(email)
+            HAVING COUNT(*) > 1
+        """)
+        duplicates = [row[0] for row in cur.fetchall()]
+        if duplicates:
+            raise ValueError(f"Members differ only in email case: {', '.join(duplicates)}")
+
+        cur.execute("""
+            INSERT INTO members (email, first_name, last_name, title, is_resident, created_at, start_balance)
+            SELECT LOWER(email), first_name, last_name, title, is_resident, created_at, start_balance
+            FROM members
+            WHERE email <> LOWER(email)
+        """)
+        changed = cur.rowcount
+
+        for table in MEMBER_EMAIL_TABLES:
+            cur.execute(f"""
+                UPDATE {table}
+                SET member_email = LOWER(member_email)
+                WHERE member_email <> LOWER(member_email)
+            """)
+        cur.execute("UPDATE beverage_entries SET email = LOWER(email) WHERE email <> LOWER(email)")
+        cur.execute("DELETE FROM members WHERE email <> LOWER(email)")
+
+        cur.execute("""
+            ALTER TABLE members DROP CONSTRAINT IF EXISTS members_email_lowercase;
+            ALTER TABLE members ADD CONSTRAINT members_email_lowercase CHECK (email = LOWER(email));
+            CREATE INDEX IF NOT EXISTS idx_transactions_email_date ON transactions (member_email, date);
+            DROP INDEX IF EXISTS idx_transactions_email;
+        """)
+
+    return changed
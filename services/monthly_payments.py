@@ -4,9 +4,13 @@ from decimal import Decimal
 
 from models.transaction import Transaction
 from models.transaction_type import TransactionType
-from services.members_db import load_member_by_email
-from services.settings_loader import get_monthly_payment_for_residents, get_monthly_payment_for_non_residents
-from services.transactions_db import load_transactions_by_email, load_transactions_by_type
+from services.members_db import load_member_by_email, load_all_members
+from services.fee_schedule_db import load_fee_schedule
+from services.transactions_db import (
+    load_transactions_by_email,
+    load_transactions_by_type,
+    load_transactions_by_type_for_members
+)
 
 # Mapping from English to German month names.
 GERMAN_MONTHS = {
@@ -69,6 +73,7 @@ def get_missing_monthly_payment_transactions(email: str) -> list[Transaction]:
     # Load the member object and list of transactions
     member = load_member_by_email(email)
     monthly_fees = load_transactions_by_type(email, TransactionType.MONTHLY_FEE.value)
+    fee_schedule = load_fee_schedule()
 
     # Parse creation and define time range
     first_month = member.created_at.replace(day=1)
@@ -82,22 +87,77 @@ def get_missing_monthly_payment_transactions(email: str) -> list[Transaction]:
         if month in existing_months:
             continue
 
-        # Get payment amount
-        amount = Decimal(str(
-            get_monthly_payment_for_residents() if member.is_resident
-            else get_monthly_payment_for_non_residents()
-        ))
+        # Get the fee that applied in that month
+        amount = fee_schedule.amount_for(month, member.is_resident)
         if amount == 0:
             continue
 
-        # Build transaction object
-        tx = Transaction(
-            transaction_date=month,
-            description=f"Aktivenbeitrag ({get_german_month_name(month)} {month.year})",
-            amount=-amount,
-            member_email=member.email,
-            transaction_type=TransactionType.MONTHLY_FEE
-        )
-        missing_transactions.append(tx)
+        missing_transactions.append(build_monthly_fee_transaction(member.email, month, amount))
 
     return missing_transactions
+
+
+def build_monthly_fee_transaction(email: str, month: date, amount: Decimal) -> Transaction:
+    """
+    Build an (unsaved) monthly fee transaction for the given month.
+
+    Args:
+        email (str): Email of the member.
+        month (date): First day of the month.
+        amount (Decimal): Positive fee amount; it is booked as a debit.
+
+    Returns:
+        Transaction: The monthly fee transaction.
+    """
+    return Transaction(
+        transaction_date=month,
+        description=f"Aktivenbeitrag ({get_german_month_name(month)} {month.year})",
+        amount=-amount,
+        member_email=email,
+        transaction_type=TransactionType.MONTHLY_FEE
+    )
+
+
+def get_monthly_payment_overview(members=None) -> list[dict]:
+    """
+    Return existing and missing monthly payments for all members except AH.
+
+    All monthly fee transactions and the fee schedule are loaded once; missing
+    months are computed as set differences and charged at the rate that
+    applied in that month.
+
+    Args:
+        members (list[Member], optional): Members to check (default: all members).
+
+    Returns:
+        list[dict]: One entry per member with the keys "member", "existing"
+            and "missing" (both lists of Transaction sorted by date).
+    """
+    if members is None:
+        members = load_all_members()
+    members = [member for member in members if member.title != "AH"]
+
+    fees_by_member = load_transactions_by_type_for_members(
+        [member.email for member in members],
+        TransactionType.MONTHLY_FEE.value
+    )
+    fee_schedule = load_fee_schedule()
+    current_month = date.today().replace(day=1)
+
+    overview = []
+    for member in members:
+        existing = fees_by_member.get(member.email, [])
+        due_months = set(iterate_months(member.created_at, current_month))
+        missing = []
+        for month in sorted(due_months - {tx.date for tx in existing}):
+            amount = fee_schedule.amount_for(month, member.is_resident)
+            if amount != 0:
+                missing.append(build_monthly_fee_transaction(member.email, month, amount))
+
+        overview.append({
+            "member": member,
+            "existing": existing,
+            "missing": missing
+        })
+
+    return overview
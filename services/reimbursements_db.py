@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from db import get_cursor
 
@@ -59,3 +59,19 @@ def update_bank_details(member_email: str,
                         iban.strip(),
                         datetime.now()
                     ))
+
+
+def load_bank_accounts() -> List[Tuple[str, str]]:
+    """
+    Load the stored IBAN of every member that has entered bank details.
+
+    Returns:
+        List[tuple]: (member_email, iban) pairs.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+                    SELECT member_email, iban
+                    FROM bank_details
+                    WHERE iban IS NOT NULL AND iban <> ''
+                    """)
+        return [(member_email, iban) for member_email, iban in cur.fetchall()]
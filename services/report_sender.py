@@ -1,12 +1,14 @@
-import os
 import smtplib
 import logging
 import re
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from jinja2 import Template
 from models.member import Member
+from services.email_templates import get_template_registry
 
 logger = logging.getLogger(__name__)
 EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
@@ -36,10 +38,14 @@ def format_member_email(member: Member, phone_number: str, template_path: str) -
     """
     Generates an HTML email body for the given member using a Jinja2 template.
 
+    The compiled template is taken from the template registry, so it is only
+    parsed again when the file changes.
+
     Args:
         member (Member): The member to generate the report for.
         phone_number (str): Phone number to include in the email.
-        template_path (str): Path to the Jinja2-compatible HTML template.
+        template_path (str): Template name (e.g. "balance_report") or path to the
+            Jinja2-compatible HTML template.
 
     Returns:
         str: HTML-formatted email body.
@@ -47,13 +53,8 @@ def format_member_email(member: Member, phone_number: str, template_path: str) -
     Raises:
         FileNotFoundError: If the template file doesn't exist.
     """
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(f"Email template not found at {template_path}")
-
-    with open(template_path, "r", encoding="utf-8") as f:
-        template = Template(f.read())
-
-    return template.render(
+    return get_template_registry().render(
+        template_path,
         title=member.title,
         last_name=member.last_name,
         phone_number=phone_number or "",
@@ -63,6 +64,38 @@ def format_member_email(member: Member, phone_number: str, template_path: str) -
     )
 
 
+def build_report_message(member: Member, sender_email: str, phone_number: str,
+                         template_path: str) -> MIMEMultipart:
+    """
+    Render the balance report for a member into a ready-to-send email message.
+
+    Args:
+        member (Member): The member to whom the email is sent.
+        sender_email (str): Email of the sender.
+        phone_number (str): Phone number of sender (e.g. treasurer).
+        template_path (str): Path to the email template (Jinja2 format).
+
+    Returns:
+        MIMEMultipart: The email message.
+
+    Raises:
+        ValueError: If the member email is invalid.
+        FileNotFoundError: If the template file doesn't exist.
+    """
+    if not EMAIL_REGEX.match(member.email):
+        raise ValueError(f"Invalid email address: {member.email}")
+
+    html = format_member_email(member, phone_number, template_path)
+    subject = f"Kontostand vom {datetime.today().strftime('%d.%m.%Y')}"
+
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = sender_email
+    msg["To"] = member.email
+    msg.attach(MIMEText(html, "html"))
+    return msg
+
+
 def send_report_email(
     member: Member,
     sender_email: str,
@@ -72,6 +105,7 @@ def send_report_email(
     smtp_server: str = "smtp.gmail.com",
     smtp_port: int = 465,
     dry_run: bool = False,
+    use_ssl: bool = True,
 ) -> bool:
     """
     Sends a balance report email to a member, using a rendered HTML template.
@@ -85,6 +119,7 @@ def send_report_email(
         smtp_server (str): Hostname of the SMTP server.
         smtp_port (int): Port for SSL connection.
         dry_run (bool): If True, simulate sending without actually sending email.
+        use_ssl (bool): Connect with SMTP_SSL (default) or plain SMTP, e.g. for a local test server.
 
     Returns:
         bool: True if email was sent successfully or simulated; False otherwise.
@@ -93,28 +128,238 @@ def send_report_email(
         ValueError: If the member email is invalid.
         RuntimeError: If sending the email fails.
     """
-    if not EMAIL_REGEX.match(member.email):
-        raise ValueError(f"Invalid email address: {member.email}")
-
-    html = format_member_email(member, phone_number, template_path)
-    subject = f"Kontostand vom {datetime.today().strftime('%d.%m.%Y')}"
-
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = sender_email
-    msg["To"] = member.email
-    msg.attach(MIMEText(html, "html"))
+    msg = build_report_message(member, sender_email, phone_number, template_path)
 
     if dry_run:
         logger.info(f"[DRY-RUN] Would send email to {member.email}")
         return False
 
     try:
-        with smtplib.SMTP_SSL(smtp_server, smtp_port) as server:
-            server.login(sender_email, sender_password)
+        smtp_class = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
+        with smtp_class(smtp_server, smtp_port) as server:
+            if sender_password:
+                server.login(sender_email, sender_password)
             server.sendmail(sender_email, member.email, msg.as_string())
         logger.info(f"Email successfully sent to {member.email}")
         return True
     except smtplib.SMTPException as e:
         logger.error(f"SMTP error while sending to {member.email}: {e}")
         raise RuntimeError(f"Failed to send email: {e}")
+
+
+class SMTPSession:
+    """
+    A reusable, authenticated SMTP connection for sending many messages.
+
+    The connection is opened lazily, re-established after the server drops it,
+    and every message is retried a few times before it is given up.
+    An optional rate limit spaces out consecutive messages.
+    """
+
+    def __init__(self,
+                 sender_email: str,
+                 sender_password: str,
+                 smtp_server: str = "smtp.gmail.com",
+                 smtp_port: int = 465,
+                 max_per_minute: int = 0,
+                 retries: int = 2,
+                 retry_delay: float = 2.0,
+                 use_ssl: bool = True):
+        """
+        Configure the session; the connection is opened on the first message.
+
+        Args:
+            sender_email (str): Email of the sender, also used as SMTP login.
+            sender_password (str): Password (or app-specific) for SMTP login.
+            smtp_server (str): Hostname of the SMTP server.
+            smtp_port (int): Port for SSL connection.
+            max_per_minute (int): Maximum number of messages per minute (0 = unlimited).
+            retries (int): Additional attempts per message after a failure.
+            retry_delay (float): Seconds to wait before retrying a message.
+            use_ssl (bool): Connect with SMTP_SSL (default) or plain SMTP, e.g. for a local test server.
+        """
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.min_interval = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.use_ssl = use_ssl
+        self.server: Optional[smtplib.SMTP] = None
+        self.connections = 0
+        self._last_sent = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def connect(self):
+        """Open the connection and log in, unless already connected."""
+        if self.server is None:
+            smtp_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+            server = smtp_class(self.smtp_server, self.smtp_port)
+            try:
+                if self.sender_password:
+                    server.login(self.sender_email, self.sender_password)
+            except smtplib.SMTPException:
+                server.close()
+                raise
+            self.server = server
+            self.connections += 1
+
+    def close(self):
+        """Log out and close the connection, ignoring errors of a dead connection."""
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                self.server.close()
+            self.server = None
+
+    def _throttle(self):
+        if self.min_interval and self._last_sent is not None:
+            wait = self._last_sent + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+    def send(self, msg: MIMEMultipart, recipient: str):
+        """
+        Send a message over the shared connection.
+
+        Args:
+            msg (MIMEMultipart): The message to send.
+            recipient (str): Email address of the recipient.
+
+        Raises:
+            RuntimeError: If the message could not be sent after all retries.
+        """
+        self._throttle()
+        payload = msg.as_string()
+
+        for attempt in range(self.retries + 1):
+            try:
+                self.connect()
+                self.server.sendmail(self.sender_email, recipient, payload)
+                self._last_sent = time.monotonic()
+                return
+            except smtplib.SMTPRecipientsRefused as e:
+                # Retrying will not help if the server rejects the address
+                raise RuntimeError(f"Recipient refused: {e}")
+            except (smtplib.SMTPException, OSError) as e:
+                logger.warning(f"SMTP error while sending to {recipient} (attempt {attempt + 1}): {e}")
+                self.close()
+                if attempt == self.retries:
+                    raise RuntimeError(f"Failed to send email: {e}")
+                time.sleep(self.retry_delay)
+
+
+def render_report_messages(
+    members: List[Member],
+    sender_email: str,
+    phone_number: str,
+    template_path: str,
+    max_workers: int = 4,
+) -> Iterator[Tuple[Member, Optional[MIMEMultipart], Optional[str]]]:
+    """
+    Render the balance reports of many members and yield each message as soon as it is ready.
+
+    The ledgers of all members are prefetched with one query, then the reports
+    are rendered on a thread pool, so sending the first messages overlaps with
+    rendering the rest.
+
+    Args:
+        members (List[Member]): The members to render reports for.
+        sender_email (str): Email of the sender.
+        phone_number (str): Phone number of sender (e.g. treasurer).
+        template_path (str): Template name or path to the email template (Jinja2 format).
+        max_workers (int): Number of rendering threads.
+
+    Yields:
+        tuple: (member, message, None) for every rendered report, or
+        (member, None, error) if the member's email address is invalid.
+
+    Raises:
+        FileNotFoundError: If the template file doesn't exist.
+    """
+    Member.prefetch_transactions(members)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render") as pool:
+        futures = {
+            pool.submit(build_report_message, member, sender_email, phone_number, template_path): member
+            for member in members
+        }
+        try:
+            for future in as_completed(futures):
+                member = futures[future]
+                try:
+                    yield member, future.result(), None
+                except ValueError as e:
+                    yield member, None, str(e)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def send_bulk_report_emails(
+    members: List[Member],
+    sender_email: str,
+    sender_password: str,
+    phone_number: str,
+    template_path: str,
+    smtp_server: str = "smtp.gmail.com",
+    smtp_port: int = 465,
+    max_per_minute: int = 0,
+    dry_run: bool = False,
+    use_ssl: bool = True,
+    on_sent: Optional[Callable[[str], None]] = None,
+) -> Dict[str, list]:
+    """
+    Sends balance report emails to many members over one SMTP session.
+
+    Reports are rendered concurrently (see render_report_messages) and sent
+    in the order they finish. A failure for one member is logged and recorded, the remaining members
+    are still processed.
+
+    Args:
+        members (List[Member]): The members to whom the reports are sent.
+        sender_email (str): Email of the sender.
+        sender_password (str): Password (or app-specific) for SMTP login.
+        phone_number (str): Phone number of sender (e.g. treasurer).
+        template_path (str): Path to the email template (Jinja2 format).
+        smtp_server (str): Hostname of the SMTP server.
+        smtp_port (int): Port for SSL connection.
+        max_per_minute (int): Maximum number of messages per minute (0 = unlimited).
+        dry_run (bool): If True, render all reports but do not send anything.
+        use_ssl (bool): Connect with SMTP_SSL (default) or plain SMTP, e.g. for a local test server.
+        on_sent (Callable, optional): Called with the email address right after each successful send.
+
+    Returns:
+        Dict[str, list]: {"sent": [email, ...], "failed": [(email, error), ...]}.
+    """
+    result = {"sent": [], "failed": []}
+    messages = render_report_messages(members, sender_email, phone_number, template_path)
+
+    with SMTPSession(sender_email, sender_password, smtp_server, smtp_port,
+                     max_per_minute=max_per_minute, use_ssl=use_ssl) as session:
+        for member, msg, error in messages:
+            if error is None and dry_run:
+                logger.info(f"[DRY-RUN] Would send email to {member.email}")
+                continue
+            if error is None:
+                try:
+                    session.send(msg, member.email)
+                except RuntimeError as e:
+                    error = str(e)
+            if error is not None:
+                logger.error(f"Report for {member.email} not sent: {error}")
+                result["failed"].append((member.email, error))
+                continue
+            logger.info(f"Email successfully sent to {member.email}")
+            result["sent"].append(member.email)
+            if on_sent is not None:
+                on_sent(member.email)
+
+    return result
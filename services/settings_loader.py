@@ -1,29 +1,159 @@
 import os
+import threading
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Mapping, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env
 load_dotenv()
 
 
+class Settings:
+    """
+    Validated application settings read from the environment.
+
+    Instances are immutable; call reload_settings() to pick up changed
+    environment variables.
+    """
+
+    __slots__ = ("admin_email", "monthly_payment_residents", "monthly_payment_non_residents")
+
+    def __init__(self, admin_email: str, monthly_payment_residents: Decimal,
+                 monthly_payment_non_residents: Decimal):
+        """
+        Create a settings object.
+
+        Args:
+            admin_email (str): Email address of the administrator (lowercase).
+            monthly_payment_residents (Decimal): Default monthly fee for residents.
+            monthly_payment_non_residents (Decimal): Default monthly fee for non-residents.
+        """
+        object.__setattr__(self, "admin_email", admin_email)
+        object.__setattr__(self, "monthly_payment_residents", monthly_payment_residents)
+        object.__setattr__(self, "monthly_payment_non_residents", monthly_payment_non_residents)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Settings are read-only; use reload_settings() instead")
+
+    def __repr__(self) -> str:
+        return (f"Settings(admin_email={self.admin_email!r}, "
+                f"monthly_payment_residents={self.monthly_payment_residents!r}, "
+                f"monthly_payment_non_residents={self.monthly_payment_non_residents!r})")
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Read and validate the settings from environment variables.
+
+        Args:
+            environ (Mapping, optional): Variables to read (default: os.environ).
+
+        Returns:
+            Settings: The validated settings.
+
+        Raises:
+            ValueError: If a monthly payment is missing, not a number or negative.
+        """
+        environ = os.environ if environ is None else environ
+        return cls(
+            admin_email=environ.get("EMAIL_ADDRESS", "").strip().lower(),
+            monthly_payment_residents=_parse_fee(environ, "MONTHLY_PAYMENT_RESIDENTS"),
+            monthly_payment_non_residents=_parse_fee(environ, "MONTHLY_PAYMENT_NON_RESIDENTS")
+        )
+
+
+def _parse_fee(environ: Mapping[str, str], name: str) -> Decimal:
+    value = environ.get(name, "").strip()
+    if not value:
+        raise ValueError(f"{name} is not set")
+    try:
+        amount = Decimal(value.replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"{name} is not a valid amount: {value!r}")
+    if not amount.is_finite() or amount < 0:
+        raise ValueError(f"{name} must be a non-negative amount: {value!r}")
+    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, reading them from the environment on first use.
+
+    Returns:
+        Settings: The cached settings.
+
+    Raises:
+        ValueError: If the environment contains invalid settings.
+    """
+    settings = _settings
+    if settings is None:
+        settings = reload_settings()
+    return settings
+
+
+def reload_settings() -> Settings:
+    """
+    Re-read the settings from the environment and replace the cached ones.
+
+    The cached settings are only replaced if the new values are valid.
+
+    Returns:
+        Settings: The new settings.
+
+    Raises:
+        ValueError: If the environment contains invalid settings.
+    """
+    global _settings
+    with _settings_lock:
+        _settings = Settings.from_env()
+        return _settings
+
+
+def init_settings() -> Settings:
+    """
+    Load and validate the settings once at application startup.
+
+    Returns:
+        Settings: The validated settings.
+
+    Raises:
+        RuntimeError: If the environment contains invalid settings, naming the variable.
+    """
+    try:
+        return reload_settings()
+    except ValueError as e:
+        raise RuntimeError(f"Invalid configuration (check .env): {e}") from e
+
+
 def get_admin_email() -> str:
     """
-    Returns the configured administrator email from environment.
+    Returns the configured administrator email.
+
+    The email is read from the environment if the settings have not been
+    loaded, so it does not depend on valid monthly fee settings.
 
     Returns:
         str: The admin email address.
     """
-    return os.getenv("EMAIL_ADDRESS", "").lower()
+    settings = _settings
+    if settings is not None:
+        return settings.admin_email
+    return os.getenv("EMAIL_ADDRESS", "").strip().lower()
 
 
-def get_monthly_payment_for_residents():
+def get_monthly_payment_for_residents() -> Decimal:
     """
-    Returns the configured monthly payment for residents of house.
+    Returns the configured default monthly payment for residents of house.
     """
-    return float(os.environ["MONTHLY_PAYMENT_RESIDENTS"])
+    return get_settings().monthly_payment_residents
 
 
-def get_monthly_payment_for_non_residents():
+def get_monthly_payment_for_non_residents() -> Decimal:
     """
-    Returns the configured monthly payment for non-residents of house.
+    Returns the configured default monthly payment for non-residents of house.
     """
-    return float(os.environ["MONTHLY_PAYMENT_NON_RESIDENTS"])
+    return get_settings().monthly_payment_non_residents
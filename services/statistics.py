@@ -1,11 +1,234 @@
+import hashlib
 import io
-import base64
-import matplotlib.pyplot as plt
-from datetime import date
+import json
+import threading
 from collections import OrderedDict
+import numpy as np
+from datetime import date
 from dateutil.relativedelta import relativedelta
 
-from services.members_db import load_all_members
+from db import get_cursor
+
+# Length in months and first month of a period for each supported granularity.
+# Semesters follow the German academic calendar (SoSe from April, WiSe from October).
+GRANULARITIES = {
+    "month": (1, 1),
+    "quarter": (3, 1),
+    "semester": (6, 4),
+}
+
+# Member columns the debt trend can be broken down by
+BREAKDOWNS = {
+    "title": "title",
+    "residency": "is_resident",
+}
+
+# Number of rendered debt charts kept in memory; bump CHART_VERSION when the chart layout changes
+CHART_CACHE_SIZE = 16
+CHART_VERSION = 1
+
+
+def load_daily_ledger() -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Load the whole ledger aggregated per day with a single round-trip.
+
+    Returns:
+        tuple:
+            - dates (np.ndarray of datetime64[D]): sorted transaction dates
+            - amounts (np.ndarray of int64): sum of all amounts on each date, in cents
+            - start_total (int): sum of all members' start balances, in cents
+    """
+    with get_cursor() as cur:
+        cur.execute("SELECT COALESCE(SUM(start_balance), 0) FROM members")
+        start_total = cur.fetchone()[0]
+        cur.execute("""
+            SELECT date, SUM(amount)
+            FROM transactions
+            GROUP BY date
+            ORDER BY date
+        """)
+        rows = cur.fetchall()
+
+    dates = np.array([row[0] for row in rows], dtype="datetime64[D]")
+    amounts = np.array([int(row[1] * 100) for row in rows], dtype=np.int64)
+    return dates, amounts, int(start_total * 100)
+
+
+def load_daily_ledger_by(breakdown: str) -> dict:
+    """
+    Load the ledger aggregated per day and member group with a single round-trip.
+
+    Args:
+        breakdown (str): Key of BREAKDOWNS, e.g. "title" or "residency".
+
+    Returns:
+        dict: Group value (e.g. "CB" or True) -> (dates, amounts, start_total),
+        in the format of load_daily_ledger(). Groups without transactions
+        still appear with their start balances.
+
+    Raises:
+        ValueError: If the breakdown is unknown.
+    """
+    if breakdown not in BREAKDOWNS:
+        raise ValueError(f"Unknown breakdown: {breakdown}")
+    column = BREAKDOWNS[breakdown]
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            SELECT {column}, COALESCE(SUM(start_balance), 0)
+            FROM members
+            GROUP BY {column}
+        """)
+        start_totals = dict(cur.fetchall())
+        cur.execute(f"""
+            SELECT m.{column}, t.date, SUM(t.amount)
+            FROM transactions t
+            JOIN members m ON m.email = t.member_email
+            GROUP BY m.{column}, t.date
+            ORDER BY m.{column}, t.date
+        """)
+        rows = cur.fetchall()
+
+    per_group = {group: [] for group in start_totals}
+    for group, day, amount in rows:
+        per_group.setdefault(group, []).append((day, amount))
+
+    return {
+        group: (
+            np.array([day for day, _ in days], dtype="datetime64[D]"),
+            np.array([int(amount * 100) for _, amount in days], dtype=np.int64),
+            int(start_totals.get(group, 0) * 100),
+        )
+        for group, days in per_group.items()
+    }
+
+
+def get_period_checkpoints(start: date, end: date, granularity: str = "month") -> list[date]:
+    """
+    Return the first day of every period between start and end (inclusive).
+
+    Args:
+        start (date): First date of the range; aligned down to the start of its period.
+        end (date): Last date of the range.
+        granularity (str): "month", "quarter" or "semester".
+
+    Returns:
+        list[date]: Period start dates in ascending order.
+
+    Raises:
+        ValueError: If the granularity is unknown.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    step, anchor = GRANULARITIES[granularity]
+
+    current = date(start.year, start.month, 1) - relativedelta(months=(start.month - anchor) % step)
+    checkpoints = []
+    while current <= end:
+        checkpoints.append(current)
+        current += relativedelta(months=step)
+    return checkpoints
+
+
+def format_period_label(period_start: date, granularity: str = "month") -> str:
+    """
+    Format the label of a period, e.g. "2025-03", "2025-Q1" or "WiSe 2024/25".
+
+    Args:
+        period_start (date): First day of the period.
+        granularity (str): "month", "quarter" or "semester".
+
+    Returns:
+        str: Human-readable period label.
+    """
+    if granularity == "quarter":
+        return f"{period_start.year}-Q{(period_start.month - 1) // 3 + 1}"
+    if granularity == "semester":
+        if period_start.month == 4:
+            return f"SoSe {period_start.year}"
+        return f"WiSe {period_start.year}/{(period_start.year + 1) % 100:02d}"
+    return period_start.strftime("%Y-%m")
+
+
+def calculate_debt_trend(start: date,
+                         end: date,
+                         granularity: str = "month") -> tuple[list[str], list[float], list[float]]:
+    """
+    Calculate the total community balance at the start of each period in the range.
+
+    The ledger is loaded once, aggregated per day, and balances at all
+    checkpoints are obtained from a single cumulative sum.
+
+    Args:
+        start (date): First date of the range.
+        end (date): Last date of the range.
+        granularity (str): "month", "quarter" or "semester".
+
+    Returns:
+        tuple:
+            - labels (list of str): period labels
+            - totals (list of float): total balance on each period's first day (inclusive)
+            - deltas (list of float): difference compared to the previous period
+    """
+    checkpoints = get_period_checkpoints(start, end, granularity)
+    if not checkpoints:
+        return [], [], []
+
+    totals, deltas = trend_at_checkpoints(checkpoints, *load_daily_ledger())
+    labels = [format_period_label(d, granularity) for d in checkpoints]
+    return labels, totals, deltas
+
+
+def trend_at_checkpoints(checkpoints: list[date],
+                         dates: np.ndarray,
+                         amounts: np.ndarray,
+                         start_total: int) -> tuple[list[float], list[float]]:
+    """
+    Evaluate a daily ledger at the given checkpoints with one cumulative sum.
+
+    Args:
+        checkpoints (list[date]): Dates to evaluate, ascending.
+        dates, amounts, start_total: A ledger as returned by load_daily_ledger().
+
+    Returns:
+        tuple:
+            - totals (list of float): balance on each checkpoint (inclusive)
+            - deltas (list of float): difference compared to the previous checkpoint
+    """
+    # cumulative[i] is the sum of the first i days, so index by the number of days <= checkpoint
+    cumulative = np.concatenate(([0], np.cumsum(amounts)))
+    positions = np.searchsorted(dates, np.array(checkpoints, dtype="datetime64[D]"), side="right")
+    totals = start_total + cumulative[positions]
+    deltas = np.diff(totals, prepend=totals[0])
+    return (totals / 100).round(2).tolist(), (deltas / 100).round(2).tolist()
+
+
+def calculate_debt_trend_breakdown(start: date,
+                                   end: date,
+                                   granularity: str = "month",
+                                   breakdown: str = "title") -> tuple[list[str], dict]:
+    """
+    Calculate the debt trend separately for each member group.
+
+    Args:
+        start (date): First date of the range.
+        end (date): Last date of the range.
+        granularity (str): "month", "quarter" or "semester".
+        breakdown (str): Key of BREAKDOWNS, e.g. "title" or "residency".
+
+    Returns:
+        tuple:
+            - labels (list of str): period labels
+            - series (dict): group value -> (totals, deltas) as in calculate_debt_trend()
+    """
+    checkpoints = get_period_checkpoints(start, end, granularity)
+    if not checkpoints:
+        return [], {}
+
+    ledgers = load_daily_ledger_by(breakdown)
+    labels = [format_period_label(d, granularity) for d in checkpoints]
+    series = {group: trend_at_checkpoints(checkpoints, *ledger) for group, ledger in ledgers.items()}
+    return labels, series
 
 
 def calculate_monthly_debt_trend() -> tuple[list[str], list[float], list[float]]:
@@ -19,46 +242,30 @@ def calculate_monthly_debt_trend() -> tuple[list[str], list[float], list[float]]
             - totals (list of float): total balance on each month's first day
             - deltas (list of float): difference compared to the previous month
     """
-    members = load_all_members()
-    if not members:
-        return [], [], []
-
-    # Define monthly range: from 2 years ago to now
-    first_date = (date.today().replace(day=1) - relativedelta(years=2))
     today = date.today().replace(day=1)
+    return calculate_debt_trend(today - relativedelta(years=2), today, "month")
 
-    checkpoints = OrderedDict()
-    current = first_date
-    while current <= today:
-        checkpoints[current] = 0.0
-        current_month = current.month + 1 if current.month < 12 else 1
-        current_year = current.year + 1 if current.month == 12 else current.year
-        current = date(current_year, current_month, 1)
 
-    for check_date in checkpoints:
-        total = sum(member.get_balance_at(check_date) for member in members)
-        checkpoints[check_date] = round(total, 2)
-
-    labels = [d.strftime("%Y-%m") for d in checkpoints]
-    totals = list(checkpoints.values())
-    deltas = [0.0] + [round(totals[i] - totals[i - 1], 2) for i in range(1, len(totals))]
-
-    return labels, totals, deltas
-
-
-def build_debt_chart(labels: list[str], totals: list[float], deltas: list[float]) -> str:
+def build_debt_chart(labels: list[str], totals: list[float], deltas: list[float]) -> bytes:
     """
-    Generate a line and bar chart showing the community's monthly debt trend.
+    Generate a line and bar chart showing the community's debt trend.
+
+    Uses the object-oriented Figure API instead of pyplot's global state,
+    so charts can be rendered concurrently from several threads. Matplotlib
+    is imported on the first call only, which keeps application startup fast.
 
     Args:
-        labels (list of str): Month labels in "YYYY-MM" format.
-        totals (list of float): Cumulative debt values per month.
-        deltas (list of float): Changes in debt relative to the previous month.
+        labels (list of str): Period labels (e.g. "YYYY-MM").
+        totals (list of float): Cumulative debt values per period.
+        deltas (list of float): Changes in debt relative to the previous period.
 
     Returns:
-        str: A base64-encoded PNG image suitable for embedding in HTML.
+        bytes: The chart as PNG image.
     """
-    fig, ax = plt.subplots(figsize=(10, 4))
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
 
     # Line plot for total debt
     ax.plot(labels, totals, label="Gesamtschulden", color="red", marker="o")
@@ -69,14 +276,77 @@ def build_debt_chart(labels: list[str], totals: list[float], deltas: list[float]
     ax.set_ylabel("€")
     ax.set_title("Monatliche Entwicklung der Schulden")
     ax.legend()
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.tick_params(axis="x", labelrotation=45)
+    fig.tight_layout()
 
-    # Save the figure to a buffer and encode as base64
     buffer = io.BytesIO()
-    plt.savefig(buffer, format="png")
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.read()).decode("utf-8")
-    plt.close(fig)
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def chart_data_hash(labels: list[str], totals: list[float], deltas: list[float]) -> str:
+    """
+    Return a stable hash of the chart data, used as cache key and HTTP ETag.
+
+    Args:
+        labels (list of str): Period labels.
+        totals (list of float): Cumulative debt values per period.
+        deltas (list of float): Changes in debt relative to the previous period.
+
+    Returns:
+        str: Hex digest identifying the data.
+    """
+    data = json.dumps([CHART_VERSION, labels, totals, deltas], separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+# Rendered charts keyed by chart_data_hash(), least recently used first
+_chart_cache: OrderedDict[str, bytes] = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+
+def get_debt_chart(labels: list[str], totals: list[float], deltas: list[float]) -> tuple[str, bytes]:
+    """
+    Return the debt chart for the given data, rendering it only if it is not cached yet.
+
+    Up to CHART_CACHE_SIZE charts are kept; the least recently used one is evicted first.
+
+    Args:
+        labels (list of str): Period labels.
+        totals (list of float): Cumulative debt values per period.
+        deltas (list of float): Changes in debt relative to the previous period.
+
+    Returns:
+        tuple: (data hash, PNG bytes).
+    """
+    key = chart_data_hash(labels, totals, deltas)
+    with _chart_cache_lock:
+        png = _chart_cache.get(key)
+        if png is not None:
+            _chart_cache.move_to_end(key)
+            return key, png
+
+    png = build_debt_chart(labels, totals, deltas)
+
+    with _chart_cache_lock:
+        _chart_cache[key] = png
+        _chart_cache.move_to_end(key)
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return key, png
+
+
+def warm_up_charts() -> None:
+    """
+    Import matplotlib and render a throwaway chart.
+
+    Moves the one-time cost of loading the plotting stack and its font cache
+    off the first statistics request. The chart cache is not touched.
+    """
+    build_debt_chart(["2000-01"], [0.0], [0.0])
+
 
-    return image_base64
+def clear_chart_cache() -> None:
+    """Drop all cached charts."""
+    with _chart_cache_lock:
+        _chart_cache.clear()
@@ -1,6 +1,9 @@
-from typing import List
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from db import get_cursor
 from models.transaction import Transaction
+from models.validators import normalize_email
 
 
 def load_transactions_by_email(email: str) -> List[Transaction]:
@@ -13,13 +16,15 @@ def load_transactions_by_email(email: str) -> List[Transaction]:
     Returns:
         List[Transaction]: List of Transaction objects associated with the given email.
     """
+    email = normalize_email(email)
+
     with get_cursor() as cur:
         cur.execute("""
             SELECT id, date, description, amount, transaction_type
             FROM transactions
-            WHERE LOWER(member_email) = %s
+            WHERE member_email = %s
             ORDER BY date
-            """, (email.lower(),))
+            """, (email,))
         rows = cur.fetchall()
 
     return [
@@ -45,6 +50,8 @@ def load_transactions_by_type(email: str, type_number: int) -> List[Transaction]
         Returns:
             List[Transaction]: List of transactions matching the type.
         """
+    email = normalize_email(email)
+
     with get_cursor() as cur:
         cur.execute("""
                 SELECT id, date, description, amount, transaction_type
@@ -66,6 +73,212 @@ def load_transactions_by_type(email: str, type_number: int) -> List[Transaction]
     ]
 
 
+def load_transactions_for_members(emails: Iterable[str],
+                                  type_number: Optional[int] = None) -> Dict[str, List[Transaction]]:
+    """
+    Load the transactions of several members with one query.
+
+    Args:
+        emails (Iterable[str]): Emails of the members.
+        type_number (int, optional): Only load transactions of this type.
+
+    Returns:
+        Dict[str, List[Transaction]]: Transactions per member email, ordered by date.
+            Members without matching transactions are mapped to an empty list.
+    """
+    emails = [normalize_email(email) for email in emails]
+    result = {email: [] for email in emails}
+    if not emails:
+        return result
+
+    params = [emails]
+    type_filter = ""
+    if type_number is not None:
+        type_filter = "AND transaction_type = %s"
+        params.append(type_number)
+
+    with get_cursor() as cur:
+        cur.execute(f"""
+            SELECT id, member_email, date, description, amount, transaction_type
+            FROM transactions
+            WHERE member_email = ANY(%s) {type_filter}
+            ORDER BY member_email, date
+        """, params)
+        rows = cur.fetchall()
+
+    for row in rows:
+        result[row[1]].append(Transaction(
+            transaction_date=row[2],
+            description=row[3],
+            amount=row[4],
+            transaction_type=row[5],
+            member_email=row[1],
+            transaction_id=row[0]
+        ))
+    return result
+
+
+def load_transactions_by_type_for_members(emails: Iterable[str], type_number: int) -> Dict[str, List[Transaction]]:
+    """
+    Load all transactions of a specific type for several members with one query.
+
+    Args:
+        emails (Iterable[str]): Emails of the members.
+        type_number (int): Enum value of the transaction type.
+
+    Returns:
+        Dict[str, List[Transaction]]: Transactions per member email, ordered by date.
+            Members without matching transactions are mapped to an empty list.
+    """
+    return load_transactions_for_members(emails, type_number)
+
+
+def load_transaction_keys(type_number: int, start: date, end: date) -> Set[Tuple[str, date, Decimal]]:
+    """
+    Load (member_email, date, amount) of all transactions of a type in a date range with one query.
+
+    Used to recognize bookings that were already entered, e.g. when importing a bank statement twice.
+
+    Args:
+        type_number (int): Enum value of the transaction type.
+        start (date): First date (inclusive).
+        end (date): Last date (inclusive).
+
+    Returns:
+        Set[tuple]: The keys of the matching transactions.
+    """
+    with get_cursor() as cur:
+        cur.execute("""
+            SELECT member_email, date, amount
+            FROM transactions
+            WHERE transaction_type = %s AND date BETWEEN %s AND %s
+        """, (type_number, start, end))
+        return {(email, tx_date, amount) for email, tx_date, amount in cur.fetchall()}
+
+
+def iter_transaction_rows(email: str,
+                          start: Optional[date] = None,
+                          end: Optional[date] = None,
+                          types: Optional[Sequence[int]] = None,
+                          after: Optional[Tuple[date, int]] = None,
+                          descending: bool = False,
+                          limit: Optional[int] = None) -> Iterator[tuple]:
+    """
+    Yield the transactions of a member as raw rows, ordered by (date, id).
+
+    Pages are selected by keyset: pass the (date, id) of the last row of the
+    previous page as `after`. Without a limit, rows are read through a
+    server-side cursor in batches, so the whole ledger is never held in memory.
+
+    Args:
+        email (str): Email of the member.
+        start (date, optional): Only transactions on or after this date.
+        end (date, optional): Only transactions on or before this date.
+        types (Sequence[int], optional): Only transactions of these types.
+        after (tuple, optional): (date, id) of the last row already returned.
+        descending (bool): Newest transactions first.
+        limit (int, optional): Maximum number of rows.
+
+    Yields:
+        tuple: (id, date, description, amount, transaction_type) rows.
+    """
+    conditions = ["member_email = %s"]
+    params = [normalize_email(email)]
+    if start is not None:
+        conditions.append("date >= %s")
+        params.append(start)
+    if end is not None:
+        conditions.append("date <= %s")
+        params.append(end)
+    if types:
+        conditions.append("transaction_type = ANY(%s)")
+        params.append(list(types))
+    if after is not None:
+        conditions.append(f"(date, id) {'<' if descending else '>'} (%s, %s)")
+        params.extend(after)
+
+    direction = "DESC" if descending else "ASC"
+    query = f"""
+        SELECT id, date, description, amount, transaction_type
+        FROM transactions
+        WHERE {" AND ".join(conditions)}
+        ORDER BY date {direction}, id {direction}
+    """
+
+    if limit is not None:
+        with get_cursor() as cur:
+            cur.execute(query + " LIMIT %s", params + [limit])
+            rows = cur.fetchall()
+        yield from rows
+        return
+
+    with get_cursor(name="transaction_rows") as cur:
+        cur.execute(query, params)
+        yield from cur
+
+
+def iter_ledger_rows(email: Optional[str] = None,
+                     start: Optional[date] = None,
+                     end: Optional[date] = None,
+                     types: Optional[Sequence[int]] = None) -> Iterator[tuple]:
+    """
+    Yield ledger rows with running balances for one or all members, ordered by member, date and ID.
+
+    The running balance includes the start balance and all transactions before
+    `start`, so it matches the member's account balance after each row. Rows are
+    read through a server-side cursor, so memory use does not grow with the ledger.
+
+    Args:
+        email (str, optional): Only this member (default: all members).
+        start (date, optional): Only transactions on or after this date.
+        end (date, optional): Only transactions on or before this date.
+        types (Sequence[int], optional): Only transactions of these types; the running
+            balance still includes all types.
+
+    Yields:
+        tuple: (id, member_email, date, transaction_type, description, amount, balance) rows.
+    """
+    params = {"start": start, "end": end, "types": list(types) if types else None}
+    conditions = []
+    if email is not None:
+        conditions.append("t.member_email = %(email)s")
+        params["email"] = normalize_email(email)
+    if start is not None:
+        conditions.append("t.date >= %(start)s")
+    if end is not None:
+        conditions.append("t.date <= %(end)s")
+
+    # Sum of the transactions before the range, aggregated once per member
+    opening_join = ""
+    if start is not None:
+        opening_join = """
+            LEFT JOIN (
+                SELECT member_email, SUM(amount) AS total
+                FROM transactions
+                WHERE date < %(start)s
+                GROUP BY member_email
+            ) opening ON opening.member_email = t.member_email
+        """
+
+    with get_cursor(name="ledger_rows", itersize=2000) as cur:
+        cur.execute(f"""
+            SELECT id, member_email, date, transaction_type, description, amount, balance
+            FROM (
+                SELECT t.id, t.member_email, t.date, t.transaction_type, t.description, t.amount,
+                       m.start_balance
+                         + {"COALESCE(opening.total, 0)" if start is not None else "0"}
+                         + SUM(t.amount) OVER (PARTITION BY t.member_email ORDER BY t.date, t.id) AS balance
+                FROM transactions t
+                JOIN members m ON m.email = t.member_email
+                {opening_join}
+                {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            ) ledger
+            {"WHERE transaction_type = ANY(%(types)s)" if types else ""}
+            ORDER BY member_email, date, id
+        """, params)
+        yield from cur
+
+
 def load_transaction_by_id(transaction_id: int) -> Transaction:
     """
     Load a single transaction from the database by its ID.
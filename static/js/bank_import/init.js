@@ -0,0 +1,5 @@
+import {initSubmitBankImport} from "./submit_selected.js";
+
+document.addEventListener("DOMContentLoaded", () => {
+    initSubmitBankImport();
+});
@@ -0,0 +1,42 @@
+export function initSubmitBankImport() {
+    const form = document.getElementById("bankImportForm");
+    const result = document.getElementById("bankImportResult");
+
+    if (!form) return;
+
+    form.addEventListener("submit", function (e) {
+        e.preventDefault();
+
+        const payload = [];
+        document.querySelectorAll("tr.import-row").forEach(row => {
+            if (!row.querySelector(".row-select").checked) return;
+
+            const email = row.querySelector(".member-email").value.trim();
+            if (!email) return;
+
+            payload.push({
+                email,
+                date: row.dataset.date,
+                amount: row.dataset.amount,
+                description: row.dataset.description
+            });
+        });
+
+        if (payload.length === 0) return;
+
+        fetch("/admin/bank_import/save", {
+            method: "POST",
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({transactions: payload})
+        })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    window.location.href = "/admin";
+                } else {
+                    result.textContent = data.error || "Fehler beim Speichern der Gutschriften.";
+                    result.className = "text-danger";
+                }
+            });
+    });
+}
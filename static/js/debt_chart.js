@@ -0,0 +1,59 @@
+const RESIDENCY_LABELS = { resident: "Bewohner", non_resident: "Nicht-Bewohner" };
+const SERIES_COLORS = ["#0d6efd", "#198754", "#6f42c1", "#fd7e14", "#20c997", "#d63384"];
+
+let debtChart = null;
+
+function buildDatasets(data, breakdown) {
+  if (!data.breakdown) {
+    return [
+      { type: "line", label: "Gesamtschulden", data: data.totals, borderColor: "red",
+        backgroundColor: "red", tension: 0 },
+      { type: "bar", label: "Änderung", data: data.deltas,
+        backgroundColor: "rgba(255, 165, 0, 0.3)" }
+    ];
+  }
+  return Object.entries(data.breakdown).map(([group, series], i) => ({
+    type: "line",
+    label: breakdown === "residency" ? RESIDENCY_LABELS[group] || group : group,
+    data: series.totals,
+    borderColor: SERIES_COLORS[i % SERIES_COLORS.length],
+    backgroundColor: SERIES_COLORS[i % SERIES_COLORS.length],
+    tension: 0
+  }));
+}
+
+function loadDebtTrend() {
+  const canvas = document.getElementById("debtTrendChart");
+  const breakdown = document.getElementById("trendBreakdown").value;
+  const params = new URLSearchParams({ granularity: document.getElementById("trendGranularity").value });
+  if (breakdown) {
+    params.set("breakdown", breakdown);
+  }
+
+  fetch(canvas.dataset.url + "?" + params.toString())
+  .then(response => {
+    if (!response.ok) {
+      throw new Error("HTTP " + response.status);
+    }
+    return response.json();
+  })
+  .then(data => {
+    if (debtChart) {
+      debtChart.destroy();
+    }
+    debtChart = new Chart(canvas, {
+      data: { labels: data.labels, datasets: buildDatasets(data, breakdown) },
+      options: {
+        scales: { y: { title: { display: true, text: "€" } } },
+        plugins: { legend: { position: "top" } }
+      }
+    });
+  })
+  .catch(error => console.error("Fehler beim Laden des Schuldenverlaufs:", error));
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+  document.getElementById("trendGranularity").addEventListener("change", loadDebtTrend);
+  document.getElementById("trendBreakdown").addEventListener("change", loadDebtTrend);
+  loadDebtTrend();
+});
@@ -1,3 +1,15 @@
+function waitForJob(jobId, interval = 1000) {
+  return fetch('/admin/jobs/' + jobId)
+  .then(response => response.json())
+  .then(job => {
+    if (job.status === 'done' || job.status === 'failed') {
+      return job;
+    }
+    return new Promise(resolve => setTimeout(resolve, interval))
+      .then(() => waitForJob(jobId, interval));
+  });
+}
+
 function sendEmail(email) {
   fetch('/send_report', {
     method: 'POST',
@@ -6,15 +18,55 @@ function sendEmail(email) {
     },
     body: JSON.stringify({ email: email })
   })
-  .then(response => {
-    if (response.ok) {
+  .then(response => response.json().then(data => ({ ok: response.ok, data: data })))
+  .then(({ ok, data }) => {
+    if (!ok) {
+      throw new Error(data.error);
+    }
+    return waitForJob(data.job_id);
+  })
+  .then(job => {
+    if (job.status === 'done') {
       alert("Bericht wurde erfolgreich gesendet an " + email);
     } else {
       alert("Fehler beim Senden des Berichts an " + email);
     }
   })
+  .catch(error => {
+    console.error('Fehler beim Senden:', error);
+    alert("Fehler beim Senden des Berichts an " + email);
+  });
+}
+
+function sendAllReports(button) {
+  if (!confirm("Bericht an alle Mitglieder mit negativem Kontostand senden?")) {
+    return;
+  }
+  button.disabled = true;
+
+  fetch('/admin/send_reports', { method: 'POST' })
+  .then(response => response.json().then(data => ({ ok: response.ok, data: data })))
+  .then(({ ok, data }) => {
+    if (!ok) {
+      throw new Error(data.error);
+    }
+    return waitForJob(data.job_id, 2000);
+  })
+  .then(job => {
+    if (job.status === 'failed') {
+      alert("Fehler beim Senden der Berichte.");
+    } else if (job.result.failed.length) {
+      const failed = job.result.failed.map(f => f.email).join("\n");
+      alert(job.result.sent.length + " Berichte gesendet, fehlgeschlagen:\n" + failed);
+    } else {
+      alert(job.result.sent.length + " Berichte wurden erfolgreich gesendet.");
+    }
+  })
   .catch(error => {
     console.error('Fehler beim Senden:', error);
     alert("Ein Fehler ist aufgetreten.");
+  })
+  .finally(() => {
+    button.disabled = false;
   });
 }
@@ -1,5 +1,42 @@
+import os
+
 import pytest
-import models.member
+
+# app.py validates the settings on import, before any fixture runs
+os.environ.setdefault("MONTHLY_PAYMENT_RESIDENTS", "15")
+os.environ.setdefault("MONTHLY_PAYMENT_NON_RESIDENTS", "10")
+
+import models.member  # noqa: E402
+from services import settings_loader  # noqa: E402
+
+
+class FakeCursor:
+    """Cursor stand-in that returns the given rows and records each query with normalized whitespace."""
+
+    def __init__(self, rows=None, rowcount=0):
+        self.rows = rows or []
+        self.rowcount = rowcount
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((" ".join(query.lower().split()), params))
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def __enter__(self): return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch):
+    monkeypatch.setenv("MONTHLY_PAYMENT_RESIDENTS", "15")
+    monkeypatch.setenv("MONTHLY_PAYMENT_NON_RESIDENTS", "10")
+    monkeypatch.setattr(settings_loader, "_settings", None)
 
 
 @pytest.fixture
@@ -0,0 +1,78 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import balances_db
+from tests.conftest import FakeCursor
+
+
+def test_load_debt_report_single_query():
+    cursor = FakeCursor([
+        ("a@example.com", "CB", "Albrecht", "Anna", Decimal("-250.00"), Decimal("-200.00"), date(2025, 3, 1)),
+        ("b@example.com", "F", "Berger", "", Decimal("-120.00"), Decimal("-90.00"), None),
+    ])
+
+    with patch("services.balances_db.get_cursor", return_value=cursor):
+        rows = balances_db.load_debt_report(date(2025, 1, 1), as_of=date(2025, 5, 1))
+
+    assert len(cursor.queries) == 1
+    query, params = cursor.queries[0]
+    assert "max(t.date) filter (where t.transaction_type = %(credit)s)" in query
+    assert "where current_balance < %(threshold)s" in query
+    assert params == {
+        "as_of": date(2025, 5, 1),
+        "reference_date": date(2025, 1, 1),
+        "credit": 3,
+        "threshold": Decimal("-100.00"),
+    }
+    assert rows[0]["last_name"] == "Albrecht"
+    assert rows[0]["balance_on_date"] == Decimal("-200.00")
+    assert rows[1]["last_credit_date"] is None
+
+
+def test_load_member_overview_single_query():
+    cursor = FakeCursor([
+        ("a@example.com", "CB", "Albrecht", None, True, date(2023, 1, 1), Decimal("0.00"), Decimal("-80.00"), 12)
+    ])
+
+    with patch("services.balances_db.get_cursor", return_value=cursor):
+        rows, total = balances_db.load_member_overview(
+            sort_by="name", descending=True, title="CB", is_resident=True, max_balance=Decimal("-50"),
+            page=3, per_page=5, as_of=date(2025, 5, 20)
+        )
+
+    assert total == 12
+    assert rows[0]["email"] == "a@example.com"
+    assert rows[0]["balance"] == Decimal("-80.00")
+    assert len(cursor.queries) == 1
+    query, params = cursor.queries[0]
+    assert "from monthly_balances" in query
+    assert "m.title = %(title)s and m.is_resident = %(is_resident)s" in query
+    assert "where balance <= %(max_balance)s" in query
+    assert "order by lower(last_name) desc, lower(first_name) desc, email desc" in query
+    assert params["month"] == date(2025, 5, 1)
+    assert (params["limit"], params["offset"]) == (5, 10)
+
+
+def test_load_member_overview_counts_separately_past_last_page():
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchall.return_value = []
+    cursor.fetchone.return_value = (12,)
+
+    with patch("services.balances_db.get_cursor", return_value=cursor):
+        rows, total = balances_db.load_member_overview(page=9, per_page=5)
+
+    assert rows == []
+    assert total == 12
+    count_query = " ".join(cursor.execute.call_args_list[1][0][0].lower().split())
+    assert count_query.startswith("select count(*) from")
+
+
+def test_load_member_overview_rejects_unknown_sort_key():
+    with patch("services.balances_db.get_cursor") as get_cursor:
+        with pytest.raises(ValueError):
+            balances_db.load_member_overview(sort_by="balance; DROP TABLE members")
+    get_cursor.assert_not_called()
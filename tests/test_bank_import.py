@@ -0,0 +1,182 @@
+import io
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.member import Member
+from services import bank_import, reimbursements_db, transactions_db
+from services.bank_import import BankLine, MemberMatcher
+
+SPARKASSE_CSV = (
+    "Auftragskonto;Buchungstag;Valutadatum;Buchungstext;Verwendungszweck;"
+    "Beguenstigter/Zahlungspflichtiger;Kontonummer/IBAN;BIC (SWIFT-Code);Betrag;Waehrung\n"
+    "DE001;02.05.25;02.05.25;GUTSCHRIFT;Beitrag Mai;MUSTERMANN, MAX;DE02 1203 0000 0000 2020 51;BYLADEM1001;1.015,50;EUR\n"
+    "DE001;03.05.25;03.05.25;LASTSCHRIFT;Strom;Stadtwerke;DE89370400440532013000;COBADEFFXXX;-80,00;EUR\n"
+)
+
+CAMT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02">
+<BkToCstmrStmt><Stmt>
+<Ntry>
+  <Amt Ccy="EUR">25.00</Amt><CdtDbtInd>CRDT</CdtDbtInd>
+  <BookgDt><Dt>2025-05-02</Dt></BookgDt>
+  <NtryDtls><TxDtls>
+    <RltdPties><Dbtr><Nm>Erika Musterfrau</Nm></Dbtr>
+      <DbtrAcct><Id><IBAN>DE75512108001245126199</IBAN></Id></DbtrAcct></RltdPties>
+    <RmtInf><Ustrd>Getraenke</Ustrd><Ustrd>April</Ustrd></RmtInf>
+  </TxDtls></NtryDtls>
+</Ntry>
+<Ntry>
+  <Amt Ccy="EUR">30.00</Amt><CdtDbtInd>CRDT</CdtDbtInd>
+  <BookgDt><Dt>2025-05-03</Dt></BookgDt>
+  <NtryDtls>
+    <TxDtls><Amt Ccy="EUR">10.00</Amt><RltdPties><Dbtr><Pty><Nm>A</Nm></Pty></Dbtr></RltdPties></TxDtls>
+    <TxDtls><Amt Ccy="EUR">20.00</Amt><RltdPties><Dbtr><Pty><Nm>B</Nm></Pty></Dbtr></RltdPties></TxDtls>
+  </NtryDtls>
+</Ntry>
+<Ntry>
+  <Amt Ccy="EUR">5.00</Amt><CdtDbtInd>DBIT</CdtDbtInd>
+  <BookgDt><Dt>2025-05-04</Dt></BookgDt>
+</Ntry>
+</Stmt></BkToCstmrStmt>
+</Document>"""
+
+MEMBERS = [
+    Member("max@example.com", "Mustermann", "Max"),
+    Member("erika@example.com", "Musterfrau", "Erika"),
+    Member("joerg@example.com", "Müller", "Jörg"),
+]
+
+
+def line(payer="", iban="", purpose="", amount="10.00"):
+    return BankLine(1, date(2025, 5, 1), Decimal(amount), payer, iban, purpose)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1.234,56", "1234.56"), ("-12,50", "-12.50"), ("+20.00 EUR", "20.00"), ("15", "15")
+])
+def test_parse_amount(value, expected):
+    assert bank_import.parse_amount(value) == Decimal(expected)
+
+
+def test_parse_amount_rejects_text():
+    with pytest.raises(ValueError):
+        bank_import.parse_amount("abc")
+
+
+def test_parse_bank_csv():
+    lines = list(bank_import.parse_bank_csv(io.StringIO(SPARKASSE_CSV)))
+
+    assert lines[0] == BankLine(2, date(2025, 5, 2), Decimal("1015.50"), "MUSTERMANN, MAX",
+                                "DE02120300000000202051", "Beitrag Mai")
+    assert lines[1].amount == Decimal("-80.00")
+
+
+def test_parse_bank_csv_skips_preamble_and_summary_rows():
+    text = ('"Kontonummer:";"DE001"\n\n'
+            '"Buchungsdatum","Betrag (€)","Zahlungspflichtige*r","IBAN","Verwendungszweck"\n'
+            '"2025-05-02","12.50","Max Mustermann","","Beitrag"\n'
+            '"","1.000,00","Kontostand","",""\n')
+
+    lines = list(bank_import.parse_bank_csv(io.StringIO(text)))
+
+    assert [(entry.line_no, entry.amount, entry.payer) for entry in lines] == [(4, Decimal("12.50"), "Max Mustermann")]
+
+
+def test_parse_bank_csv_reports_line_of_invalid_row():
+    text = "Buchungstag;Betrag\n01.05.2025;abc\n"
+    with pytest.raises(ValueError, match="Zeile 2"):
+        list(bank_import.parse_bank_csv(io.StringIO(text)))
+
+
+def test_parse_bank_csv_without_header():
+    with pytest.raises(ValueError, match="Kopfzeile"):
+        list(bank_import.parse_bank_csv(io.StringIO("a;b\n1;2\n")))
+
+
+def test_parse_camt():
+    lines = list(bank_import.parse_camt(io.BytesIO(CAMT)))
+
+    assert lines[0] == BankLine(1, date(2025, 5, 2), Decimal("25.00"), "Erika Musterfrau",
+                                "DE75512108001245126199", "Getraenke April")
+    # A batch booking is split into its transactions
+    assert [(entry.payer, entry.amount) for entry in lines[1:3]] == [("A", Decimal("10.00")), ("B", Decimal("20.00"))]
+    assert lines[3].amount == Decimal("-5.00")
+
+
+def test_parse_bank_statement_detects_encoding():
+    data = SPARKASSE_CSV.replace("Beitrag Mai", "Beitrag März").encode("cp1252")
+
+    lines = list(bank_import.parse_bank_statement("umsaetze.csv", io.BytesIO(data)))
+
+    assert lines[0].purpose == "Beitrag März"
+
+
+def test_name_key():
+    assert bank_import.name_key("MUSTERMANN, MAX") == bank_import.name_key("Herr Max Mustermann")
+    assert bank_import.name_key("Jörg Müller") == "joerg mueller"
+
+
+def test_matcher_prefers_iban_over_name():
+    matcher = MemberMatcher(MEMBERS, [("erika@example.com", "de75 5121 0800 1245 1261 99")])
+
+    assert matcher.match(line("Max Mustermann", "DE75512108001245126199")) == ("erika@example.com", "iban")
+
+
+@pytest.mark.parametrize("booking, expected", [
+    (line(purpose="Beitrag JOERG@example.com"), ("joerg@example.com", "email")),
+    (line("MUELLER, JOERG"), ("joerg@example.com", "name")),
+    (line("Max Mustermnn"), ("max@example.com", "fuzzy")),
+    (line("Stadtwerke"), (None, "none")),
+    (line(""), (None, "none")),
+])
+def test_matcher(booking, expected):
+    assert MemberMatcher(MEMBERS, []).match(booking) == expected
+
+
+def test_matcher_ignores_ambiguous_names():
+    members = MEMBERS + [Member("max2@example.com", "Mustermann", "Max")]
+
+    assert MemberMatcher(members, []).match(line("Max Mustermann")) == (None, "none")
+
+
+def test_build_import_preview_marks_duplicates_and_skips_debits():
+    lines = [line("Max Mustermann", amount="15.00"), line("Erika Musterfrau", amount="15.00"), line("X", amount="-3")]
+    existing = {("max@example.com", date(2025, 5, 1), Decimal("15.00"))}
+
+    ranges = []
+
+    def load_existing(start, end):
+        ranges.append((start, end))
+        return existing
+
+    preview, skipped = bank_import.build_import_preview(lines, MemberMatcher(MEMBERS, []), load_existing)
+
+    assert ranges == [(date(2025, 5, 1), date(2025, 5, 1))]
+    assert skipped == 1
+    assert [(entry["email"], entry["duplicate"]) for entry in preview] == [
+        ("max@example.com", True), ("erika@example.com", False)
+    ]
+
+
+def test_load_bank_accounts():
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchall.return_value = [("max@example.com", "DE02120300000000202051")]
+
+    with patch("services.reimbursements_db.get_cursor", return_value=cursor):
+        assert reimbursements_db.load_bank_accounts() == [("max@example.com", "DE02120300000000202051")]
+
+
+def test_load_transaction_keys():
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchall.return_value = [("max@example.com", date(2025, 5, 1), Decimal("15.00"))]
+
+    with patch("services.transactions_db.get_cursor", return_value=cursor):
+        keys = transactions_db.load_transaction_keys(3, date(2025, 5, 1), date(2025, 5, 31))
+
+    assert keys == {("max@example.com", date(2025, 5, 1), Decimal("15.00"))}
+    assert cursor.execute.call_args[0][1] == (3, date(2025, 5, 1), date(2025, 5, 31))
@@ -1,6 +1,16 @@
+import json
+import os
+import re
+from datetime import date
+from decimal import Decimal
 from unittest.mock import patch
+from werkzeug.datastructures import MultiDict
 import pytest
 from app import app
+from models.beverage import Beverage
+from models.beverage_report import BeverageReport
+from models.transaction_type import TransactionType
+from services import beverage_db, beverage_loader
 
 
 @pytest.fixture
@@ -10,6 +20,17 @@ def client():
         yield client
 
 
+def test_beverage_report_form_renders_price_objects(client):
+    beverages = (Beverage("Pils (0,5L)", Decimal("1.04")), Beverage("Wasser", Decimal("0.50")))
+    with patch("app.load_all_members", return_value=[]), \
+            patch("app.load_beverage_assortment", return_value=beverages):
+        response = client.get("/admin/beverage-report")
+
+    assert response.status_code == 200
+    prices = re.search(r"window\.beveragePrices = (.*);", response.get_data(as_text=True)).group(1)
+    assert json.loads(prices) == [{"name": "Pils (0,5L)", "price": 1.04}, {"name": "Wasser", "price": 0.5}]
+
+
 def test_submit_success_with_transaction(client):
     form_data = {
         "report_date": "15.05.2025",
@@ -18,20 +39,23 @@ def test_submit_success_with_transaction(client):
     }
 
     beverages = [
-        {"name": "Pils (0,5L)", "price": 1.04},
-        {"name": "Helles (0,5L)", "price": 1.04}
+        Beverage("Pils (0,5L)", Decimal("1.04")),
+        Beverage("Helles (0,5L)", Decimal("1.04"))
     ]
 
     with patch("app.load_beverage_assortment", return_value=beverages), \
-            patch("app.save_beverage_report", return_value=42) as mock_save_report, \
-            patch("models.transaction.Transaction.save") as mock_tx_save, \
+            patch("app.save_beverage_report", return_value=(42, [])) as mock_save_report, \
             patch("app.get_admin_email", return_value="admin@example.com"), \
             patch("app.load_all_members", return_value=[]):
         response = client.post("/submit-beverage-report", data=form_data, follow_redirects=True)
 
     assert response.status_code == 200
-    assert mock_save_report.called
-    assert mock_tx_save.call_count == 1
+    mock_save_report.assert_called_once()
+    report = mock_save_report.call_args[0][0]
+    assert mock_save_report.call_args[1]["changed_by"] == "admin@example.com"
+    transactions = report.build_transactions()
+    assert len(transactions) == 1
+    assert transactions[0].amount == Decimal("-2.08")
 
 
 def test_submit_missing_report_date(client):
@@ -43,16 +67,15 @@ def test_submit_missing_report_date(client):
 
 def test_submit_no_transactions_created(client):
     data = {"report_date": "15.05.2025", "test@example.com_Bier": "0"}
-    beverages = [{"name": "Bier", "price": 1.5}]
+    beverages = [Beverage("Bier", Decimal("1.50"))]
 
     with patch("app.load_beverage_assortment", return_value=beverages), \
-            patch("app.save_beverage_report", return_value=1), \
-            patch("models.transaction.Transaction.save") as mock_save, \
+            patch("app.save_beverage_report", return_value=(1, [])) as mock_save, \
             patch("app.get_admin_email", return_value="admin@example.com"), \
             patch("app.load_all_members", return_value=[]):
         response = client.post("/submit-beverage-report", data=data, follow_redirects=True)
 
-    assert mock_save.call_count == 0
+    assert mock_save.call_args[0][0].build_transactions() == []
     assert response.status_code == 200
 
 
@@ -61,16 +84,15 @@ def test_submit_invalid_number_format(client):
         "report_date": "15.05.2025",
         "test@example.com_Bier": "abc"
     }
-    beverages = [{"name": "Bier", "price": 1.5}]
+    beverages = [Beverage("Bier", Decimal("1.50"))]
 
     with patch("app.load_beverage_assortment", return_value=beverages), \
-            patch("app.save_beverage_report", return_value=1), \
-            patch("models.transaction.Transaction.save") as mock_save, \
+            patch("app.save_beverage_report", return_value=(1, [])) as mock_save, \
             patch("app.get_admin_email", return_value="admin@example.com"), \
             patch("app.load_all_members", return_value=[]):
         response = client.post("/submit-beverage-report", data=data, follow_redirects=True)
 
-    assert mock_save.call_count == 0
+    assert mock_save.call_args[0][0].build_transactions() == []
     assert response.status_code == 200
 
 
@@ -85,3 +107,130 @@ def test_submit_beverage_report_ignores_submission_if_event_name_empty(client):
 
         mock_save.assert_not_called()
         assert response.status_code in (200, 302)
+
+
+BEVERAGES = [
+    Beverage("Pils (0,5L)", Decimal("1.04")),
+    Beverage("Cola", Decimal("0.80")),
+]
+
+
+def test_beverage_report_from_form():
+    form = MultiDict([
+        ("report_date", "15.05.2025"),
+        ("Max@Example.com_Pils (0,5L)", "2"),
+        ("max@example.com_Cola", " 1 "),
+        ("anna@example.com_Cola", "0"),
+        ("anna@example.com_Wasser", "3"),
+        ("anna@example.com_Pils (0,5L)", "x"),
+        ("event_title[]", "Stiftungsfest"),
+        ("event_title[]", " "),
+        ("event_title[]", "Kneipe"),
+        ("event_Pils (0,5L)[]", "10"),
+        ("event_Pils (0,5L)[]", "5"),
+        ("event_Pils (0,5L)[]", "0"),
+        ("event_Cola[]", "4"),
+    ])
+
+    report = BeverageReport.from_form(form, BEVERAGES, date(2025, 5, 15))
+
+    assert report.prices == {"Pils (0,5L)": Decimal("1.04"), "Cola": Decimal("0.80")}
+    assert report.member_counts == {"max@example.com": {"Pils (0,5L)": 2, "Cola": 1}}
+    assert report.event_counts == [("Stiftungsfest", {"Pils (0,5L)": 10, "Cola": 4})]
+    assert report.member_totals() == {"max@example.com": Decimal("2.88")}
+    assert report.entries() == [
+        (False, "max@example.com", None, "Pils (0,5L)", 2),
+        (False, "max@example.com", None, "Cola", 1),
+        (True, None, "Stiftungsfest", "Pils (0,5L)", 10),
+        (True, None, "Stiftungsfest", "Cola", 4),
+    ]
+
+    transactions = report.build_transactions()
+    assert len(transactions) == 1
+    assert transactions[0].amount == Decimal("-2.88")
+    assert transactions[0].type == TransactionType.DRINKS
+    assert transactions[0].description == "Getränkeabrechnung vom 15.05.2025"
+
+
+def test_save_beverage_report_single_transaction():
+    class FakeCursor:
+        def __init__(self):
+            self.queries = []
+
+        def execute(self, query, params=None):
+            self.queries.append(query)
+
+        def fetchone(self): return (7,)
+
+        def __enter__(self): return self
+
+        def __exit__(self, *args): pass
+
+    form = MultiDict([("max@example.com_Cola", "2"), ("event_title[]", "Kneipe"), ("event_Cola[]", "3")])
+    report = BeverageReport.from_form(form, BEVERAGES, date(2025, 5, 15))
+    cursor = FakeCursor()
+
+    with patch("services.beverage_db.get_cursor", return_value=cursor) as mock_cursor, \
+            patch("services.beverage_db.execute_values") as mock_values, \
+            patch("services.beverage_db.Transaction.save_many", side_effect=lambda txs, changed_by: txs) as mock_save:
+        report_id, transactions = beverage_db.save_beverage_report(report, changed_by="admin@example.com")
+
+    assert report_id == 7
+    mock_cursor.assert_called_once()
+    assert mock_values.call_args_list[0][0][2] == [
+        (7, "Pils (0,5L)", Decimal("1.04")), (7, "Cola", Decimal("0.80"))
+    ]
+    assert mock_values.call_args_list[1][0][2] == [
+        (7, False, "max@example.com", None, "Cola", 2),
+        (7, True, None, "Kneipe", "Cola", 3),
+    ]
+    mock_save.assert_called_once()
+    assert [tx.amount for tx in transactions] == [Decimal("-1.60")]
+
+
+def test_load_beverage_assortment_parses_decimal_prices(tmp_path):
+    path = tmp_path / "beverages.json"
+    path.write_text('[{"name": "Pils (0,5L)", "price": 1.04}, {"name": "ISO", "price": 1}]', encoding="utf-8")
+
+    beverages = beverage_loader.load_beverage_assortment(str(path))
+
+    assert beverages == (Beverage("Pils (0,5L)", Decimal("1.04")), Beverage("ISO", Decimal("1.00")))
+    assert isinstance(beverages[0].price, Decimal)
+    with pytest.raises(AttributeError):
+        beverages[0].price = Decimal("2")
+
+
+def test_load_beverage_assortment_is_cached_until_file_changes(tmp_path):
+    path = tmp_path / "beverages.json"
+    path.write_text('[{"name": "Bier", "price": 1.50}]', encoding="utf-8")
+
+    with patch("services.beverage_loader.parse_beverage_assortment",
+               wraps=beverage_loader.parse_beverage_assortment) as parse:
+        first = beverage_loader.load_beverage_assortment(str(path))
+        assert beverage_loader.load_beverage_assortment(str(path)) is first
+        assert parse.call_count == 1
+
+        path.write_text('[{"name": "Bier", "price": 1.60}]', encoding="utf-8")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+        assert beverage_loader.load_beverage_assortment(str(path)) == (Beverage("Bier", Decimal("1.60")),)
+        assert parse.call_count == 2
+
+
+@pytest.mark.parametrize("content", [
+    '[{"name": "Bier", "price": "1.50"}]',
+    '[{"name": "Bier", "price": -1}]',
+    '[{"name": "", "price": 1}]',
+    '[{"name": "Bier", "price": 1}, {"name": "Bier", "price": 2}]',
+])
+def test_load_beverage_assortment_rejects_invalid_entries(tmp_path, content):
+    path = tmp_path / "beverages.json"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        beverage_loader.parse_beverage_assortment(str(path))
+
+
+def test_default_assortment_is_valid():
+    beverages = beverage_loader.parse_beverage_assortment(beverage_loader.BEVERAGES_PATH)
+    assert beverages and all(isinstance(b.price, Decimal) for b in beverages)
@@ -0,0 +1,173 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from models.transaction import Transaction
+from services import bulk_import_db
+
+MEMBERS_CSV = [
+    "email;first_name;last_name;title;is_resident;created_at;start_balance\n",
+    "Max@Example.com;Max;Mustermann;CB;0;01.10.2024;-12,50\n",
+    "\n",
+    "erika@example.com;Erika;Musterfrau;;;;\n",
+]
+
+TRANSACTIONS_CSV = [
+    "email,date,description,amount,type\n",
+    "max@example.com,2024-10-01,Altbestand,-20.00,\n",
+    "max@example.com,15.10.2024,Einzahlung,\"50,00\",credit\n",
+]
+
+
+def fake_cursor(fetchall=()):
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchall.return_value = list(fetchall)
+    cursor.copied = []
+    cursor.copy_expert.side_effect = lambda sql, stream: cursor.copied.append(stream.read().decode("utf-8"))
+    return cursor
+
+
+def test_iter_member_rows():
+    rows = list(bulk_import_db.iter_member_rows(MEMBERS_CSV))
+
+    assert rows == [
+        ("max@example.com", "Max", "Mustermann", "CB", False, date(2024, 10, 1), Decimal("-12.50")),
+        ("erika@example.com", "Erika", "Musterfrau", None, None, None, None),
+    ]
+
+
+def test_iter_member_rows_returns_none_for_missing_columns():
+    rows = list(bulk_import_db.iter_member_rows(["email;last_name\n", "max@example.com;Mustermann\n"]))
+
+    assert rows == [("max@example.com", None, "Mustermann", None, None, None, None)]
+
+
+@pytest.mark.parametrize("line, message", [
+    ("moritz@example.com;;M;XX;1;;\n", "Line 3: 'XX' is not a valid Title"),
+    ("moritz@example.com;;M;F;maybe;;\n", "Line 3: invalid yes/no value"),
+    ("MAX@example.com;;M;F;1;;\n", "Line 3: duplicate email max@example.com"),
+    (";;M;F;1;;\n", "Line 3: email and last_name are required"),
+])
+def test_iter_member_rows_rejects_invalid_rows(line, message):
+    lines = MEMBERS_CSV[:2] + [line]
+    with pytest.raises(ValueError, match=message):
+        list(bulk_import_db.iter_member_rows(lines))
+
+
+def test_iter_member_rows_requires_columns():
+    with pytest.raises(ValueError, match="Missing column.*last_name"):
+        list(bulk_import_db.iter_member_rows(["email;name\n"]))
+
+
+def test_iter_transaction_import_rows():
+    rows = list(bulk_import_db.iter_transaction_import_rows(TRANSACTIONS_CSV))
+
+    assert rows == [
+        ("max@example.com", date(2024, 10, 1), "Altbestand", Decimal("-20.00"), 1),
+        ("max@example.com", date(2024, 10, 15), "Einzahlung", Decimal("50.00"), 3),
+    ]
+
+
+def test_iter_transaction_import_rows_rejects_unknown_type():
+    with pytest.raises(ValueError, match="Line 2: unknown transaction type 'BONUS'"):
+        list(bulk_import_db.iter_transaction_import_rows(["email,date,amount,type\n", "a@b.de,2024-01-01,1,BONUS\n"]))
+
+
+def test_copy_stream_reads_in_chunks():
+    rows = [("a@example.com", 'Text with "quotes", comma', Decimal("1.50"))] * 3000
+    stream = bulk_import_db._CopyStream(rows)
+
+    chunks = iter(lambda: stream.read(8192), b"")
+    data = b"".join(chunks).decode("utf-8")
+
+    assert stream.count == 3000
+    assert data.splitlines()[0] == 'a@example.com,"Text with ""quotes"", comma",1.50'
+    assert len(data.splitlines()) == 3000
+
+
+def test_import_members():
+    cursor = fake_cursor()
+    cursor.rowcount = 1
+    rows = [("max@example.com", "Max", "Mustermann", "CB", False, date(2024, 10, 1), Decimal("-12.50")),
+            ("erika@example.com", None, "Musterfrau", None, None, None, None)]
+
+    with patch("services.bulk_import_db.get_cursor", return_value=cursor):
+        result = bulk_import_db.import_members(rows, changed_by="admin@example.com")
+
+    assert result == {"imported": 2, "created": 1, "title_changes": 1, "residency_changes": 1}
+    # Missing values are copied as NULL, so existing members keep their stored values
+    assert cursor.copied == ["max@example.com,Max,Mustermann,CB,False,2024-10-01,-12.50\n"
+                             "erika@example.com,,Musterfrau,,,,\n"]
+    statements = [call[0][0] for call in cursor.execute.call_args_list]
+    assert any("UPDATE members" in sql and "COALESCE(i.start_balance, m.start_balance)" in sql
+               for sql in statements)
+    assert any("INSERT INTO members" in sql and "NOT EXISTS" in sql for sql in statements)
+    assert any("INSERT INTO title_changes" in sql for sql in statements)
+    assert any("INSERT INTO residency_changes" in sql for sql in statements)
+
+
+def test_import_members_reraises_row_errors():
+    def failing_rows():
+        yield ("max@example.com", "Max", "Mustermann", "CB", False, date(2024, 10, 1), Decimal("0"))
+        raise ValueError("Line 3: broken")
+
+    cursor = fake_cursor()
+
+    def copy_expert(sql, stream):
+        try:
+            stream.read()
+        except ValueError:
+            raise psycopg2.errors.QueryCanceled("COPY from stdin failed")
+
+    cursor.copy_expert.side_effect = copy_expert
+
+    with patch("services.bulk_import_db.get_cursor", return_value=cursor):
+        with pytest.raises(ValueError, match="Line 3: broken"):
+            bulk_import_db.import_members(failing_rows(), changed_by="admin@example.com")
+
+
+def test_import_transactions():
+    cursor = fake_cursor()
+    cursor.fetchall.side_effect = [[], [("max@example.com", 2)]]
+    rows = list(bulk_import_db.iter_transaction_import_rows(TRANSACTIONS_CSV))
+    version = Transaction.ledger_version("max@example.com")
+
+    with patch("services.bulk_import_db.get_cursor", return_value=cursor):
+        result = bulk_import_db.import_transactions(rows, changed_by="admin@example.com")
+
+    assert result == {"imported": 2, "skipped": 0}
+    assert cursor.copied[0].splitlines() == [
+        "max@example.com,2024-10-01,Altbestand,-20.00,1",
+        "max@example.com,2024-10-15,Einzahlung,50.00,3",
+    ]
+    merge = next(call for call in cursor.execute.call_args_list if "INSERT INTO transactions" in call[0][0])
+    assert "transaction_change_log" in merge[0][0] and "monthly_balances" in merge[0][0]
+    assert merge[0][1] == ("admin@example.com",)
+    assert Transaction.ledger_version("max@example.com") == version + 1
+
+
+def test_import_transactions_skip_existing():
+    cursor = fake_cursor()
+    cursor.fetchall.side_effect = [[], []]
+    cursor.rowcount = 2
+
+    with patch("services.bulk_import_db.get_cursor", return_value=cursor):
+        result = bulk_import_db.import_transactions([], changed_by="admin@example.com", skip_existing=True)
+
+    assert result == {"imported": 0, "skipped": 2}
+    assert any("DELETE FROM transaction_import" in call[0][0] for call in cursor.execute.call_args_list)
+
+
+def test_import_transactions_rejects_unknown_members():
+    cursor = fake_cursor(fetchall=[("nobody@example.com",)])
+    rows = [("nobody@example.com", date(2024, 1, 1), "Import", Decimal("5"), 1)]
+
+    with patch("services.bulk_import_db.get_cursor", return_value=cursor):
+        with pytest.raises(ValueError, match="Unknown member.*nobody@example.com"):
+            bulk_import_db.import_transactions(rows, changed_by="admin@example.com")
+
+    assert not any("INSERT INTO transactions" in call[0][0] for call in cursor.execute.call_args_list)
@@ -0,0 +1,165 @@
+import threading
+import time
+
+import psycopg2.extensions
+import pytest
+
+import db
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def cursor(self, name=None):
+        conn = self
+
+        class FakeCursor:
+            def __init__(self):
+                self.closed_at_commit = []
+
+            def execute(self, query, params=None):
+                conn.status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+            def close(self): self.closed_at_commit.append(conn.commits)
+
+            def __enter__(self): return self
+
+            def __exit__(self, *args): pass
+
+        cursor = FakeCursor()
+        cursor.name = name
+        return cursor
+
+    def commit(self):
+        self.commits += 1
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def get_transaction_status(self):
+        return self.status
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    created = []
+
+    def fake_connect(**kwargs):
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr("db.psycopg2.connect", fake_connect)
+    db.close_pool()
+    yield created
+    db.close_pool()
+
+
+def test_get_cursor_reuses_pooled_connection(connections):
+    for _ in range(5):
+        with db.get_cursor() as cur:
+            cur.execute("SELECT 1")
+
+    assert len(connections) == 1
+    assert connections[0].commits == 5
+    stats = db.get_pool_stats()
+    assert stats["checkouts"] == 5
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+
+def test_get_cursor_nested_shares_connection(connections):
+    with db.get_cursor() as outer:
+        outer.execute("INSERT 1")
+        with db.get_cursor() as inner:
+            inner.execute("INSERT 2")
+        assert connections[0].commits == 0
+
+    assert len(connections) == 1
+    assert connections[0].commits == 1
+
+
+def test_get_cursor_rolls_back_on_error(connections):
+    with pytest.raises(RuntimeError):
+        with db.get_cursor() as cur:
+            cur.execute("INSERT 1")
+            raise RuntimeError("boom")
+
+    assert connections[0].rollbacks == 1
+    assert connections[0].commits == 0
+    assert db.get_pool_stats()["idle"] == 1
+
+
+def test_get_cursor_named_cursor_is_closed_before_commit(connections):
+    with db.get_cursor(name="rows", itersize=50) as cur:
+        cur.execute("SELECT 1")
+        assert (cur.name, cur.itersize) == ("rows", 50)
+        assert connections[0].commits == 0
+
+    assert cur.closed_at_commit[0] == 0
+    assert connections[0].commits == 1
+
+
+def test_closed_connection_is_replaced(connections):
+    with db.get_cursor():
+        pass
+    connections[0].closed = 1
+
+    with db.get_cursor():
+        pass
+
+    assert len(connections) == 2
+    assert db.get_pool_stats()["health_check_failures"] == 1
+
+
+def test_pool_times_out_when_saturated(connections):
+    pool = db.ConnectionPool(minconn=0, maxconn=1, timeout=0.05)
+    conn = pool.getconn()
+
+    with pytest.raises(db.PoolTimeout):
+        pool.getconn()
+
+    pool.putconn(conn)
+    assert pool.stats()["timeouts"] == 1
+    assert pool.stats()["saturation"] == 0
+
+
+def test_pool_waiter_gets_released_connection(connections):
+    pool = db.ConnectionPool(minconn=0, maxconn=1, timeout=2)
+    conn = pool.getconn()
+    result = {}
+
+    waiter = threading.Thread(target=lambda: result.setdefault("conn", pool.getconn()))
+    waiter.start()
+    time.sleep(0.05)
+    pool.putconn(conn)
+    waiter.join()
+
+    assert result["conn"] is conn
+    assert pool.stats()["wait_time_max"] > 0
+
+
+def test_reap_idle_keeps_minimum(connections):
+    pool = db.ConnectionPool(minconn=1, maxconn=3, idle_timeout=0)
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+
+    pool.reap_idle()
+
+    assert pool.stats()["idle"] == 1
+    assert sum(1 for c in connections if c.closed) == 2
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        db.ConnectionPool(minconn=5, maxconn=2)
@@ -0,0 +1,55 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from jinja2 import Template
+
+from services.email_templates import TemplateRegistry, get_template_registry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    (tmp_path / "reminder.html").write_text("Hallo {{ name }}", encoding="utf-8")
+    (tmp_path / "dunning.html").write_text("Mahnung: {{ amount }}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    return TemplateRegistry(str(tmp_path))
+
+
+def test_named_templates(registry):
+    assert registry.names() == ["dunning", "reminder"]
+    assert registry.render("reminder", name="Max") == "Hallo Max"
+    assert registry.render("dunning", amount="5,00 €") == "Mahnung: 5,00 €"
+
+
+def test_template_is_compiled_once(registry):
+    with patch("services.email_templates.Template", wraps=Template) as mock_compile:
+        for i in range(50):
+            registry.render("reminder", name=str(i))
+
+    assert mock_compile.call_count == 1
+
+
+def test_template_is_reloaded_when_file_changes(registry, tmp_path):
+    assert registry.render("reminder", name="Max") == "Hallo Max"
+
+    path = tmp_path / "reminder.html"
+    path.write_text("Servus {{ name }}", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert registry.render("reminder", name="Max") == "Servus Max"
+
+
+def test_template_by_path(registry, tmp_path):
+    path = tmp_path / "custom.html"
+    path.write_text("{{ x }}!", encoding="utf-8")
+    assert registry.render(str(path), x="ok") == "ok!"
+
+
+def test_missing_template(registry):
+    with pytest.raises(FileNotFoundError):
+        registry.get("receipt")
+
+
+def test_default_registry_has_balance_report():
+    assert "balance_report" in get_template_registry().names()
@@ -0,0 +1,61 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from models.fee_schedule import FeeSchedule
+from services import fee_schedule_db
+from tests.conftest import FakeCursor
+
+
+def test_amount_for_uses_rate_valid_in_month():
+    schedule = FeeSchedule([
+        (date(2025, 6, 1), True, Decimal("25.00")),
+        (date(2025, 1, 1), True, Decimal("20.00")),
+        (date(2025, 3, 1), False, Decimal("0.00")),
+    ], default_resident=Decimal("15.00"), default_non_resident=Decimal("10.00"))
+
+    assert schedule.amount_for(date(2024, 12, 1), True) == Decimal("15.00")
+    assert schedule.amount_for(date(2025, 1, 1), True) == Decimal("20.00")
+    assert schedule.amount_for(date(2025, 5, 31), True) == Decimal("20.00")
+    assert schedule.amount_for(date(2025, 6, 15), True) == Decimal("25.00")
+    assert schedule.amount_for(date(2025, 2, 1), False) == Decimal("10.00")
+    assert schedule.amount_for(date(2026, 1, 1), False) == Decimal("0.00")
+
+
+def test_empty_schedule_uses_defaults():
+    schedule = FeeSchedule([], Decimal("15.00"), Decimal("10.00"))
+    assert schedule.amount_for(date(2025, 1, 1), True) == Decimal("15.00")
+    assert schedule.amount_for(date(2025, 1, 1), False) == Decimal("10.00")
+
+
+def test_load_fee_schedule_reads_rates_once():
+    cursor = FakeCursor([(date(2025, 1, 1), True, Decimal("20.00"))])
+
+    with patch("services.fee_schedule_db.get_cursor", return_value=cursor), \
+            patch("services.fee_schedule_db.get_monthly_payment_for_residents", return_value=Decimal("15.00")), \
+            patch("services.fee_schedule_db.get_monthly_payment_for_non_residents", return_value=Decimal("10.00")):
+        schedule = fee_schedule_db.load_fee_schedule()
+
+    assert len(cursor.queries) == 1
+    assert schedule.amount_for(date(2024, 12, 1), True) == Decimal("15.00")
+    assert schedule.amount_for(date(2025, 2, 1), True) == Decimal("20.00")
+
+
+def test_save_fee_rate_upserts_first_of_month():
+    cursor = FakeCursor()
+
+    with patch("services.fee_schedule_db.get_cursor", return_value=cursor):
+        fee_schedule_db.save_fee_rate(date(2025, 7, 20), False, Decimal("12.50"))
+
+    query, params = cursor.queries[0]
+    assert "on conflict (valid_from, is_resident) do update" in query
+    assert params == (date(2025, 7, 1), False, Decimal("12.50"))
+
+
+def test_save_fee_rate_rejects_negative_amount():
+    with patch("services.fee_schedule_db.get_cursor") as get_cursor:
+        with pytest.raises(ValueError):
+            fee_schedule_db.save_fee_rate(date(2025, 7, 1), True, Decimal("-1"))
+    get_cursor.assert_not_called()
@@ -3,6 +3,7 @@ import re
 from pathlib import Path
 
 import pytest
+import app as app_module
 from app import app
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
@@ -34,6 +35,16 @@ def test_dashboard_admin_redirect(client):
         assert "/admin" in response.location
 
 
+def test_dashboard_admin_redirect_without_fee_settings(client, monkeypatch):
+    monkeypatch.setenv("EMAIL_ADDRESS", "admin@example.com")
+    monkeypatch.delenv("MONTHLY_PAYMENT_RESIDENTS")
+    monkeypatch.delenv("MONTHLY_PAYMENT_NON_RESIDENTS")
+
+    response = client.post("/dashboard", data={"email": "admin@example.com"})
+    assert response.status_code == 302
+    assert "/admin" in response.location
+
+
 def test_dashboard_member_view(client):
     with patch("app.get_admin_email", return_value="admin@example.com"), \
             patch("app.load_member_by_email") as mock_load:
@@ -220,99 +231,101 @@ def test_submit_reimbursement_without_bank_info(client):
 
 # ROUTE: GET /admin
 
+def member_row(email, last_name, balance):
+    return {
+        "email": email, "title": "CB", "last_name": last_name, "first_name": None, "is_resident": True,
+        "created_at": datetime.date(2023, 5, 1), "start_balance": Decimal("0.00"), "balance": Decimal(balance)
+    }
+
+
 def test_admin_panel_loads(client):
-    with patch("app.load_all_members", return_value=[]):
+    with patch("app.load_member_overview", return_value=([], 0)):
         response = client.get("/admin")
         assert response.status_code == 200
+        assert "0 Mitglieder" in response.get_data(as_text=True)
+
+
+def test_admin_panel_shows_precomputed_balance(client):
+    rows = [member_row("ziegler@example.com", "Ziegler", "-100.00"),
+            member_row("albrecht@example.com", "Albrecht", "0.00")]
+    with patch("app.load_member_overview", return_value=(rows, 2)):
+        response = client.get("/admin")
+
+    html = response.get_data(as_text=True)
+    assert "-100.00" in html
+    assert html.find("ziegler@example.com") < html.find("albrecht@example.com")
 
 
 def test_admin_panel_error(client):
-    with patch("app.load_all_members", side_effect=Exception("DB failure")):
+    with patch("app.load_member_overview", side_effect=Exception("DB failure")):
         response = client.get("/admin")
         assert response.status_code == 500
         assert b"error loading members" in response.data.lower()
 
 
-@pytest.fixture
-def mock_sorted_members():
-    m1 = MagicMock(spec=Member)
-    m1.last_name = "Ziegler"
-    m1.email = "ziegler@example.com"
-    m1.created_at = "2023-05-01"
-    m1.get_balance.return_value = Decimal("-100.00")
-
-    m2 = MagicMock(spec=Member)
-    m2.last_name = "Albrecht"
-    m2.email = "albrecht@example.com"
-    m2.created_at = "2023-04-01"
-    m2.get_balance.return_value = Decimal("0.00")
-
-    m3 = MagicMock(spec=Member)
-    m3.last_name = "Berger"
-    m3.email = "berger@example.com"
-    m3.created_at = "2023-06-01"
-    m3.get_balance.return_value = Decimal("-50.00")
-
-    return [m1, m2, m3]
-
-
-def test_admin_sort_by_balance_asc(client, mock_sorted_members):
-    with patch("app.load_all_members", return_value=mock_sorted_members):
-        response = client.get("/admin?sort_by=balance&order=asc")
-        assert response.status_code == 200
-        html = response.get_data(as_text=True)
-        pos_ziegler = html.find("ziegler@example.com")
-        pos_berger = html.find("berger@example.com")
-        pos_albrecht = html.find("albrecht@example.com")
-        assert pos_ziegler < pos_berger < pos_albrecht
+def test_admin_panel_default_query(client):
+    with patch("app.load_member_overview", return_value=([], 0)) as mock_load:
+        client.get("/admin")
 
+    mock_load.assert_called_once_with(sort_by="balance", descending=False, title=None, is_resident=None,
+                                      max_balance=None, page=1, per_page=50)
 
-def test_admin_sort_by_name_desc(client, mock_sorted_members):
-    with patch("app.load_all_members", return_value=mock_sorted_members):
-        response = client.get("/admin?sort_by=name&order=desc")
-        assert response.status_code == 200
-        html = response.get_data(as_text=True)
-        pos_ziegler = html.find("ziegler@example.com")
-        pos_berger = html.find("berger@example.com")
-        pos_albrecht = html.find("albrecht@example.com")
-        assert pos_ziegler < pos_berger < pos_albrecht
 
+def test_admin_panel_passes_sort_filters_and_page(client):
+    rows = [member_row("ziegler@example.com", "Ziegler", "-100.00")]
+    with patch("app.load_member_overview", return_value=(rows, 45)) as mock_load:
+        response = client.get("/admin?sort_by=name&order=desc&title=F&resident=0&min_debt=50,5&page=2&per_page=20")
 
-def test_admin_sort_by_created_at_asc(client, mock_sorted_members):
-    with patch("app.load_all_members", return_value=mock_sorted_members):
-        response = client.get("/admin?sort_by=created_at&order=asc")
-        assert response.status_code == 200
-        html = response.get_data(as_text=True)
-        pos_albrecht = html.find("albrecht@example.com")
-        pos_ziegler = html.find("ziegler@example.com")
-        pos_berger = html.find("berger@example.com")
-        assert pos_albrecht < pos_ziegler < pos_berger
+    mock_load.assert_called_once_with(sort_by="name", descending=True, title="F", is_resident=False,
+                                      max_balance=Decimal("-50.5"), page=2, per_page=20)
+    html = response.get_data(as_text=True)
+    assert "Seite 2 von 3" in html
+    # Sort and page links keep the filters
+    assert "page=3" in html and "min_debt=50,5" in html and "title=F" in html
 
 
-def test_admin_sort_default(client, mock_sorted_members):
-    with patch("app.load_all_members", return_value=mock_sorted_members):
-        response = client.get("/admin")
-        assert response.status_code == 200
-        html = response.get_data(as_text=True)
-        pos_ziegler = html.find("ziegler@example.com")
-        pos_berger = html.find("berger@example.com")
-        pos_albrecht = html.find("albrecht@example.com")
-        assert pos_ziegler < pos_berger < pos_albrecht
+def test_admin_panel_page_past_end_redirects_to_last_page(client):
+    with patch("app.load_member_overview", return_value=([], 45)):
+        response = client.get("/admin?page=9&per_page=20&title=F")
+
+    assert response.status_code == 302
+    location = response.headers["Location"]
+    assert "page=3" in location and "per_page=20" in location and "title=F" in location
+
+
+def test_admin_panel_unknown_sort_falls_back_to_balance(client):
+    with patch("app.load_member_overview", return_value=([], 0)) as mock_load:
+        client.get("/admin?sort_by=password&per_page=100000")
+
+    assert mock_load.call_args[1]["sort_by"] == "balance"
+    assert mock_load.call_args[1]["per_page"] == 200
+
+
+def test_admin_panel_invalid_page(client):
+    with patch("app.load_member_overview") as mock_load:
+        response = client.get("/admin?min_debt=abc")
+
+    assert response.status_code == 400
+    mock_load.assert_not_called()
 
 
 # ROUTE: GET /admin/statistics
 
-@patch("app.load_all_members")
-@patch("app.calculate_monthly_debt_trend", return_value=([], [], []))
-@patch("app.build_debt_chart", return_value="dummy_chart")
-def test_admin_statistics_loads(mock_chart, mock_trend, mock_load, client):
-    mock_member = MagicMock()
-    mock_member.get_balance.return_value = Decimal("-200.00")
-    mock_member.get_balance_at.return_value = Decimal("-150.00")
-    mock_member.get_last_credit_date.return_value = datetime.date(2025, 5, 1)
-    mock_member.last_name = "Schmidt"
-    mock_member.get_title.return_value = "CB"
-    mock_load.return_value = [mock_member]
+def debt_row(last_name, current, on_date, last_credit, title="CB"):
+    return {
+        "email": f"{last_name.lower()}@example.com",
+        "title": title,
+        "last_name": last_name,
+        "first_name": "",
+        "current_balance": Decimal(current),
+        "balance_on_date": Decimal(on_date),
+        "last_credit_date": last_credit,
+    }
+
+
+@patch("app.load_debt_report")
+def test_admin_statistics_loads(mock_report, client):
+    mock_report.return_value = [debt_row("Schmidt", "-200.00", "-150.00", datetime.date(2025, 5, 1))]
 
     response = client.get("/admin/statistics")
     html = response.get_data(as_text=True)
@@ -323,40 +336,27 @@ def test_admin_statistics_loads(mock_chart, mock_trend, mock_load, client):
     assert "01.05.2025" in html or "1.05.2025" in html
 
 
-def test_admin_statistics_ignores_small_debts(client):
-    mock_member = MagicMock()
-    mock_member.get_balance.return_value = Decimal("-50.00")
-    mock_member.get_balance_at.return_value = Decimal("-40.00")
-    mock_member.get_last_credit_date.return_value = datetime.datetime(2025, 4, 1)
-    mock_member.last_name = "Mild"
-    mock_member.get_title.return_value = "F"
+def test_admin_statistics_single_query(client):
+    with patch("app.load_debt_report", return_value=[]) as mock_report, \
+            patch("app.load_all_members") as mock_members:
+        response = client.get("/admin/statistics?date=01.01.2024")
 
-    with patch("services.statistics.load_all_members", return_value=[mock_member]):
-        response = client.get("/admin/statistics")
-        html = response.get_data(as_text=True)
-        assert "Mild" not in html
+    assert response.status_code == 200
+    mock_report.assert_called_once_with(datetime.date(2024, 1, 1), threshold=Decimal("-100.00"))
+    mock_members.assert_not_called()
 
 
-@patch("app.load_all_members", return_value=[])
-@patch("app.calculate_monthly_debt_trend", return_value=([], [], []))
-@patch("app.build_debt_chart", return_value="dummy_chart")
-def test_admin_statistics_handles_invalid_date(mock_chart, mock_trend, mock_load, client):
+@patch("app.load_debt_report", return_value=[])
+def test_admin_statistics_handles_invalid_date(mock_report, client):
     response = client.get("/admin/statistics?date=not-a-date")
     assert response.status_code == 200
-    assert "dummy_chart" in response.get_data(as_text=True)
+    assert mock_report.call_args[0][0] == datetime.date.today()
+    assert "/admin/statistics/debt_trend.json" in response.get_data(as_text=True)
 
 
-@patch("app.load_all_members")
-@patch("app.calculate_monthly_debt_trend", return_value=([], [], []))
-@patch("app.build_debt_chart", return_value="dummy_chart")
-def test_admin_statistics_handles_missing_last_credit(mock_chart, mock_trend, mock_load, client):
-    mock_member = MagicMock()
-    mock_member.get_balance.return_value = Decimal("-120.00")
-    mock_member.get_balance_at.return_value = Decimal("-100.00")
-    mock_member.get_last_credit_date.return_value = None
-    mock_member.last_name = "NoTopup"
-    mock_member.get_title.return_value = "CB"
-    mock_load.return_value = [mock_member]
+@patch("app.load_debt_report")
+def test_admin_statistics_handles_missing_last_credit(mock_report, client):
+    mock_report.return_value = [debt_row("NoTopup", "-120.00", "-100.00", None)]
 
     response = client.get("/admin/statistics")
     html = response.get_data(as_text=True)
@@ -366,17 +366,9 @@ def test_admin_statistics_handles_missing_last_credit(mock_chart, mock_trend, mo
     assert "–" in html or "-" in html
 
 
-@patch("app.load_all_members")
-@patch("app.calculate_monthly_debt_trend", return_value=([], [], []))
-@patch("app.build_debt_chart", return_value="dummy_chart")
-def test_admin_statistics_respects_custom_date_param(mock_chart, mock_trend, mock_load, client):
-    member = MagicMock()
-    member.get_balance.return_value = Decimal("-150.00")
-    member.get_balance_at.return_value = Decimal("-130.00")
-    member.get_last_credit_date.return_value = datetime.datetime(2025, 3, 10)
-    member.last_name = "Dated"
-    member.get_title.return_value = "CB"
-    mock_load.return_value = [member]
+@patch("app.load_debt_report")
+def test_admin_statistics_respects_custom_date_param(mock_report, client):
+    mock_report.return_value = [debt_row("Dated", "-150.00", "-130.00", datetime.date(2025, 3, 10))]
 
     response = client.get("/admin/statistics?date=01.01.2024")
     html = response.get_data(as_text=True)
@@ -387,9 +379,7 @@ def test_admin_statistics_respects_custom_date_param(mock_chart, mock_trend, moc
 
 
 def test_admin_statistics_raises_on_db_failure(client):
-    with patch("services.statistics.load_all_members", side_effect=Exception("DB error")), \
-            patch("app.calculate_monthly_debt_trend", return_value=([], [], [])), \
-            patch("app.build_debt_chart", return_value=""):
+    with patch("app.load_debt_report", side_effect=Exception("DB error")):
         response = client.get("/admin/statistics")
         html = response.get_data(as_text=True)
 
@@ -397,42 +387,92 @@ def test_admin_statistics_raises_on_db_failure(client):
         assert "Statistik" in html
 
 
-def test_admin_statistics_handles_chart_generation_error(client):
-    mock_member = MagicMock()
-    mock_member.get_balance.return_value = -200
-    mock_member.get_balance_at.return_value = -180
-    mock_member.get_last_credit_date.return_value = datetime.date(2025, 3, 10)
-    mock_member.get_title.return_value = "CB"
-    mock_member.last_name = "Test"
+# ROUTE: GET /admin/statistics/debt_trend.json
 
-    with patch("app.load_all_members", return_value=[mock_member]), \
-            patch("app.calculate_monthly_debt_trend", side_effect=Exception("Chart error")):
-        response = client.get("/admin/statistics")
-        html = response.get_data(as_text=True)
+def test_debt_trend_json_defaults(client):
+    with patch("app.calculate_debt_trend", return_value=(["2025-01"], [-5.0], [0.0])) as mock_trend:
+        response = client.get("/admin/statistics/debt_trend.json")
 
-        assert response.status_code == 200
-        assert "CB Test" in html
+    assert response.status_code == 200
+    assert response.json == {"granularity": "month", "labels": ["2025-01"], "totals": [-5.0], "deltas": [0.0]}
+    start, end, granularity = mock_trend.call_args[0]
+    assert end == datetime.date.today().replace(day=1)
+    assert start == end.replace(year=end.year - 2)
+    assert granularity == "month"
+    assert response.headers["ETag"]
+
+
+def test_debt_trend_json_residency_breakdown(client):
+    series = {True: ([-3.0], [0.0]), False: ([-2.0], [0.0])}
+    with patch("app.calculate_debt_trend", return_value=(["SoSe 2025"], [-5.0], [0.0])), \
+            patch("app.calculate_debt_trend_breakdown", return_value=(["SoSe 2025"], series)) as mock_breakdown:
+        response = client.get("/admin/statistics/debt_trend.json"
+                              "?start=01.04.2024&end=30.09.2025&granularity=semester&breakdown=residency")
+
+    assert response.status_code == 200
+    assert response.json["breakdown"] == {
+        "non_resident": {"totals": [-2.0], "deltas": [0.0]},
+        "resident": {"totals": [-3.0], "deltas": [0.0]},
+    }
+    assert mock_breakdown.call_args[0] == (datetime.date(2024, 4, 1), datetime.date(2025, 9, 30), "semester", "residency")
+
+
+def test_debt_trend_json_not_modified(client):
+    with patch("app.calculate_debt_trend", return_value=(["2025-01"], [-5.0], [0.0])):
+        etag = client.get("/admin/statistics/debt_trend.json").headers["ETag"]
+        response = client.get("/admin/statistics/debt_trend.json", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_debt_trend_json_invalid_parameters(client):
+    assert client.get("/admin/statistics/debt_trend.json?start=2025-01-01").status_code == 400
 
+    with patch("app.calculate_debt_trend", side_effect=ValueError("Unknown granularity: week")):
+        response = client.get("/admin/statistics/debt_trend.json?granularity=week")
+    assert response.status_code == 400
+    assert "week" in response.json["error"]
+
+
+# ROUTE: GET /admin/statistics/debt_chart.png
+
+def test_debt_chart_png_with_etag(client):
+    with patch("app.calculate_monthly_debt_trend", return_value=(["2025-01"], [-5.0], [0.0])), \
+            patch("app.get_debt_chart", return_value=("abc123", b"\x89PNG")) as mock_chart:
+        response = client.get("/admin/statistics/debt_chart.png")
+
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.data == b"\x89PNG"
+    assert response.headers["ETag"] == '"abc123"'
+    assert "no-cache" in response.headers["Cache-Control"]
+    mock_chart.assert_called_once_with(["2025-01"], [-5.0], [0.0])
 
-@patch("app.load_all_members")
-@patch("app.calculate_monthly_debt_trend", return_value=([], [], []))
-@patch("app.build_debt_chart", return_value="dummy_chart")
-def test_admin_statistics_equal_debt_sorting(mock_chart, mock_trend, mock_load, client):
-    m1 = MagicMock()
-    m1.last_name = "Alpha"
-    m1.get_title.return_value = "CB"
-    m1.get_balance.return_value = Decimal("-150.00")
-    m1.get_balance_at.return_value = Decimal("-140.00")
-    m1.get_last_credit_date.return_value = datetime.datetime(2025, 1, 1)
 
-    m2 = MagicMock()
-    m2.last_name = "Beta"
-    m2.get_title.return_value = "CB"
-    m2.get_balance.return_value = Decimal("-150.00")
-    m2.get_balance_at.return_value = Decimal("-140.00")
-    m2.get_last_credit_date.return_value = datetime.datetime(2025, 2, 1)
+def test_debt_chart_not_modified_skips_rendering(client):
+    with patch("app.calculate_monthly_debt_trend", return_value=(["2025-01"], [-5.0], [0.0])), \
+            patch("app.chart_data_hash", return_value="abc123"), \
+            patch("app.get_debt_chart") as mock_chart:
+        response = client.get("/admin/statistics/debt_chart.png", headers={"If-None-Match": '"abc123"'})
 
-    mock_load.return_value = [m1, m2]
+    assert response.status_code == 304
+    assert response.data == b""
+    mock_chart.assert_not_called()
+
+
+def test_debt_chart_generation_error(client):
+    with patch("app.calculate_monthly_debt_trend", side_effect=Exception("Chart error")):
+        response = client.get("/admin/statistics/debt_chart.png")
+
+    assert response.status_code == 500
+
+
+@patch("app.load_debt_report")
+def test_admin_statistics_equal_debt_sorting(mock_report, client):
+    mock_report.return_value = [
+        debt_row("Alpha", "-150.00", "-140.00", datetime.date(2025, 1, 1)),
+        debt_row("Beta", "-150.00", "-140.00", datetime.date(2025, 2, 1)),
+    ]
 
     response = client.get("/admin/statistics")
     html = response.get_data(as_text=True)
@@ -440,8 +480,7 @@ def test_admin_statistics_equal_debt_sorting(mock_chart, mock_trend, mock_load,
     assert response.status_code == 200
     assert "Alpha" in html
     assert "Beta" in html
-    assert html.find("Alpha") != -1
-    assert html.find("Beta") != -1
+    assert html.find("Alpha") < html.find("Beta")
 
 
 # ROUTE: GET, POST /admin/add_member
@@ -592,13 +631,81 @@ def test_update_member_status_exception(client):
 # ROUTE: GET /admin/check_monthly_payments
 
 def test_check_all_missing_monthly_payments(client):
-    with patch("app.load_all_members", return_value=[]), \
+    with patch("app.get_monthly_payment_overview", return_value=[]), \
             patch("app.get_monthly_payment_for_residents", return_value=Decimal("20")), \
             patch("app.get_monthly_payment_for_non_residents", return_value=Decimal("30")):
         response = client.get("/admin/check_monthly_payments")
         assert response.status_code == 200
 
 
+# ROUTE: GET/POST /admin/bank_import
+
+def test_bank_import_form(client):
+    response = client.get("/admin/bank_import")
+    assert response.status_code == 200
+    assert b'name="statement"' in response.data
+
+
+def test_bank_import_preview(client):
+    statement = "Buchungstag;Betrag;Auftraggeber;IBAN;Verwendungszweck\n02.05.2025;15,00;Max Mustermann;;Beitrag\n"
+    members = [Member("max@example.com", "Mustermann", "Max")]
+    with patch("app.load_all_members", return_value=members), \
+            patch("app.load_bank_accounts", return_value=[]), \
+            patch("app.load_transaction_keys", return_value=set()) as mock_keys:
+        response = client.post("/admin/bank_import", data={
+            "statement": (BytesIO(statement.encode("utf-8")), "umsaetze.csv")
+        }, content_type="multipart/form-data")
+
+    assert response.status_code == 200
+    assert b'value="max@example.com"' in response.data
+    assert b'data-amount="15.00"' in response.data
+    mock_keys.assert_called_once_with(3, datetime.date(2025, 5, 2), datetime.date(2025, 5, 2))
+
+
+def test_bank_import_invalid_file(client):
+    with patch("app.load_all_members", return_value=[]), \
+            patch("app.load_bank_accounts", return_value=[]):
+        response = client.post("/admin/bank_import", data={
+            "statement": (BytesIO(b"foo;bar\n1;2\n"), "umsaetze.csv")
+        }, content_type="multipart/form-data")
+    assert response.status_code == 400
+    assert "Kopfzeile".encode() in response.data
+
+
+# ROUTE: POST /admin/bank_import/save
+
+def test_save_bank_import(client):
+    with patch("app.load_all_members", return_value=[Member("max@example.com", "Mustermann", "Max")]), \
+            patch("app.Transaction") as MockTransaction, \
+            patch("app.get_admin_email", return_value="admin@example.com"):
+        response = client.post("/admin/bank_import/save", json={"transactions": [
+            {"email": "Max@Example.com", "date": "2025-05-02", "amount": "15.00", "description": "Beitrag"}
+        ]})
+
+    assert response.status_code == 200
+    assert response.json == {"success": True, "saved": 1}
+    MockTransaction.save_many.assert_called_once()
+    kwargs = MockTransaction.call_args.kwargs
+    assert kwargs["member_email"] == "max@example.com"
+    assert kwargs["amount"] == Decimal("15.00")
+    assert kwargs["transaction_type"].name == "CREDIT"
+
+
+@pytest.mark.parametrize("entry", [
+    {"email": "unknown@example.com", "date": "2025-05-02", "amount": "15.00"},
+    {"email": "max@example.com", "date": "02.05.2025", "amount": "15.00"},
+    {"email": "max@example.com", "date": "2025-05-02", "amount": "-15.00"},
+])
+def test_save_bank_import_rejects_invalid_entries(client, entry):
+    with patch("app.load_all_members", return_value=[Member("max@example.com", "Mustermann", "Max")]), \
+            patch("app.Transaction") as MockTransaction:
+        response = client.post("/admin/bank_import/save", json={"transactions": [entry]})
+
+    assert response.status_code == 400
+    assert response.json["success"] is False
+    MockTransaction.save_many.assert_not_called()
+
+
 # ROUTE: POST /admin/save_missing_payments
 
 def test_save_missing_payments_invalid_date(client):
@@ -656,7 +763,9 @@ def test_save_missing_payments(client):
         assert response.status_code == 200
         assert response.json["success"] is True
         assert response.json["saved"] == 1
-        mock_tx.save.assert_called_once()
+        MockTransaction.save_many.assert_called_once()
+        assert MockTransaction.save_many.call_args[0][0] == [mock_tx]
+        mock_tx.save.assert_not_called()
 
 
 @pytest.mark.parametrize("invalid_date", ["not-a-date", "2025/05/01", "May 1, 2025"])
@@ -709,11 +818,11 @@ def test_check_missing_payments_html_contains_expected_fields(client):
     mock_missing_tx.date = datetime.date(2025, 5, 1)
     mock_missing_tx.amount = Decimal("15.00")
 
-    with patch("app.load_all_members", return_value=[mock_member]), \
+    overview = [{"member": mock_member, "existing": [], "missing": [mock_missing_tx]}]
+
+    with patch("app.get_monthly_payment_overview", return_value=overview), \
             patch("app.get_monthly_payment_for_residents", return_value=Decimal("15.00")), \
-            patch("app.get_monthly_payment_for_non_residents", return_value=Decimal("12.50")), \
-            patch("app.get_missing_monthly_payment_transactions", return_value=[mock_missing_tx]), \
-            patch("app.load_transactions_by_type", return_value=[]):
+            patch("app.get_monthly_payment_for_non_residents", return_value=Decimal("12.50")):
         response = client.get("/admin/check_monthly_payments")
         html = response.get_data(as_text=True)
 
@@ -724,6 +833,16 @@ def test_check_missing_payments_html_contains_expected_fields(client):
         assert "Fehlende Aktivenbeiträge" in html
 
 
+def test_save_missing_payments_database_error(client):
+    with patch("app.Transaction.save_many", side_effect=Exception("DB down")), \
+            patch("app.get_admin_email", return_value="admin@example.com"):
+        response = client.post("/admin/save_missing_payments", json={
+            "transactions": [{"email": "user@example.com", "date": "2024-05-01", "amount": "25.00"}]
+        })
+        assert response.status_code == 500
+        assert response.json["success"] is False
+
+
 # ROUTE: GET /admin/add_transaction
 
 def test_admin_add_transaction_get(client):
@@ -857,12 +976,13 @@ def test_submit_fines_success(client):
         "fines[0][description]": "Beireitung für nicht erfüllen eines CC Auftrags"
     }
 
-    with patch("app.Transaction.save") as mock_save, \
+    with patch("app.Transaction.save_many") as mock_save, \
             patch("app.get_admin_email", return_value="admin@example.com"):
         response = client.post("/admin/fines", data=form_data, follow_redirects=False)
         assert response.status_code == 302
         assert "/admin/fines?success=1" in response.headers["Location"]
-        assert mock_save.call_count == 1
+        mock_save.assert_called_once()
+        assert len(mock_save.call_args[0][0]) == 1
 
 
 def test_submit_fines_missing_fields(client):
@@ -936,11 +1056,13 @@ def test_submit_multiple_fines_success(client):
         "fines[1][description]": "Zu spät"
     }
 
-    with patch("app.Transaction.save") as mock_save, \
+    with patch("app.Transaction.save_many") as mock_save, \
             patch("app.get_admin_email", return_value="admin@example.com"):
         response = client.post("/admin/fines", data=form_data, follow_redirects=False)
         assert response.status_code == 302
-        assert mock_save.call_count == 2
+        mock_save.assert_called_once()
+        fines = mock_save.call_args[0][0]
+        assert [fine.member_email for fine in fines] == ["anna@example.com", "bob@example.com"]
 
 
 def test_submit_fines_partial_success(client):
@@ -959,7 +1081,7 @@ def test_submit_fines_partial_success(client):
         "fines[1][description]": "gültig"
     }
 
-    with patch("app.Transaction.save") as mock_save, \
+    with patch("app.Transaction.save_many") as mock_save, \
             patch("app.get_admin_email", return_value="admin@example.com"):
         response = client.post("/admin/fines", data=form_data)
         assert response.status_code in (200, 302, 400)
@@ -978,7 +1100,7 @@ def test_submit_fines_invalid_protocol_number(client):
         "fines[0][description]": "Test"
     }
 
-    with patch("app.Transaction.save") as mock_save:
+    with patch("app.Transaction.save_many") as mock_save:
         response = client.post("/admin/fines", data=form_data)
         assert response.status_code == 400
         mock_save.assert_not_called()
@@ -994,7 +1116,7 @@ def test_submit_fines_no_entries(client):
         "session_date": today_str
     }
 
-    with patch("app.Transaction.save") as mock_save:
+    with patch("app.Transaction.save_many") as mock_save:
         response = client.post("/admin/fines", data=form_data)
         assert response.status_code == 400
         mock_save.assert_not_called()
@@ -1047,35 +1169,196 @@ def test_update_member_status_missing_fields(client):
 
 def test_send_report_success(client):
     with patch("app.load_member_by_email") as mock_load, \
-            patch("app.send_report_email"):
+            patch("app.job_queue.submit", return_value=17) as mock_submit:
         mock_load.return_value = MagicMock()
 
-        response = client.post("/send_report", json={"email": "user@example.com"})
-        assert response.status_code == 200
-        assert response.json["success"] is True
+        response = client.post("/send_report", json={"email": "User@Example.com"})
+        assert response.status_code == 202
+        assert response.json == {"success": True, "job_id": 17}
+        mock_submit.assert_called_once_with("send_report", {"email": "user@example.com"})
 
 
 def test_send_report_not_found(client):
-    with patch("app.load_member_by_email", side_effect=ValueError("Not found")):
+    with patch("app.load_member_by_email", side_effect=ValueError("Not found")), \
+            patch("app.job_queue.submit") as mock_submit:
         response = client.post("/send_report", json={"email": "missing@example.com"})
         assert response.status_code == 404
+        mock_submit.assert_not_called()
 
 
 def test_send_report_send_error(client):
     with patch("app.load_member_by_email", return_value=MagicMock()), \
-            patch("app.send_report_email", side_effect=Exception("SMTP error")):
+            patch("app.job_queue.submit", side_effect=Exception("DB error")):
         response = client.post("/send_report", json={"email": "user@example.com"})
         assert response.status_code == 500
         assert b"senden fehlgeschlagen" in response.data.lower()
 
 
+def test_send_report_job_sends_email():
+    member = MagicMock(email="user@example.com")
+    with patch("app.load_member_by_email", return_value=member), \
+            patch("app.send_report_email") as mock_send:
+        assert app_module.send_report_job({"email": "user@example.com"}) == {"email": "user@example.com"}
+    assert mock_send.call_args[0][0] is member
+
+
+# ROUTE: POST /admin/send_reports
+
+def test_send_reports_queues_job(client):
+    with patch("app.job_queue.submit", return_value=5) as mock_submit:
+        response = client.post("/admin/send_reports")
+
+    assert response.status_code == 202
+    assert response.json["job_id"] == 5
+    mock_submit.assert_called_once_with("send_reports")
+
+
+def test_send_reports_error(client):
+    with patch("app.job_queue.submit", side_effect=Exception("DB down")):
+        response = client.post("/admin/send_reports")
+    assert response.status_code == 500
+
+
+def test_send_reports_job_result():
+    debtor = MagicMock(email="debtor@example.com")
+    result = {"sent": ["debtor@example.com"], "failed": [("bad@example.com", "Recipient refused")]}
+
+    with patch("app.load_members_with_debt", return_value=[debtor]), \
+            patch("app.send_bulk_report_emails", return_value=result) as mock_send:
+        job_result = app_module.send_reports_job({})
+
+    assert mock_send.call_args[0][0] == [debtor]
+    assert job_result == {
+        "sent": ["debtor@example.com"],
+        "failed": [{"email": "bad@example.com", "error": "Recipient refused"}]
+    }
+
+
+def test_send_reports_job_retry_skips_delivered_members():
+    done, pending = MagicMock(email="done@example.com"), MagicMock(email="pending@example.com")
+
+    def send(members, **kwargs):
+        kwargs["on_sent"]("pending@example.com")
+        return {"sent": ["pending@example.com"], "failed": []}
+
+    with patch("app.current_job_id", return_value=7), \
+            patch("app.load_members_with_debt", return_value=[done, pending]), \
+            patch("app.load_job_deliveries", return_value={"done@example.com"}), \
+            patch("app.record_job_delivery") as mock_record, \
+            patch("app.send_bulk_report_emails", side_effect=send) as mock_send:
+        job_result = app_module.send_reports_job({})
+
+    assert mock_send.call_args[0][0] == [pending]
+    mock_record.assert_called_once_with(7, "pending@example.com")
+    assert job_result["sent"] == ["done@example.com", "pending@example.com"]
+
+
+# ROUTE: GET /admin/jobs/<job_id>
+
+def test_job_status(client):
+    job = {
+        "id": 5, "job_type": "send_reports", "status": "done", "result": {"sent": [], "failed": []},
+        "error": None, "attempts": 1, "created_at": datetime.datetime(2025, 5, 1, 12, 0),
+        "started_at": datetime.datetime(2025, 5, 1, 12, 0, 1), "finished_at": None
+    }
+    with patch("app.load_job", return_value=job):
+        response = client.get("/admin/jobs/5")
+
+    assert response.status_code == 200
+    assert response.json["status"] == "done"
+    assert response.json["created_at"] == "2025-05-01T12:00:00"
+
+
+def test_job_status_not_found(client):
+    with patch("app.load_job", return_value=None):
+        response = client.get("/admin/jobs/99")
+    assert response.status_code == 404
+
+
+# ROUTE: POST /admin/reload_settings
+
+def test_reload_settings(client):
+    settings = MagicMock(admin_email="admin@example.com",
+                         monthly_payment_residents=Decimal("15.00"),
+                         monthly_payment_non_residents=Decimal("10.00"))
+    with patch("app.reload_settings", return_value=settings):
+        response = client.post("/admin/reload_settings")
+
+    assert response.status_code == 200
+    assert response.json["monthly_payment_residents"] == "15.00"
+
+
+def test_reload_settings_invalid(client):
+    with patch("app.reload_settings", side_effect=ValueError("MONTHLY_PAYMENT_RESIDENTS is not set")):
+        response = client.post("/admin/reload_settings")
+
+    assert response.status_code == 400
+    assert "MONTHLY_PAYMENT_RESIDENTS" in response.json["error"]
+
+
 # ROUTE: GET /admin/get_transactions
 
+def transaction_rows(count):
+    return [(i, datetime.date(2025, 1, 1) + datetime.timedelta(days=i), f"Tx {i}", Decimal("-1.50"), 2)
+            for i in range(1, count + 1)]
+
+
 def test_get_transactions(client):
-    with patch("app.load_transactions_by_email", return_value=[]):
+    with patch("app.iter_transaction_rows", return_value=iter([])):
         response = client.get("/admin/get_transactions?email=user@example.com")
         assert response.status_code == 200
-        assert isinstance(response.json, list)
+        assert response.json == []
+
+
+def test_get_transactions_streams_all_rows(client):
+    with patch("app.STREAM_BATCH_ROWS", 2), \
+            patch("app.iter_transaction_rows", return_value=iter(transaction_rows(5))) as mock_rows:
+        response = client.get("/admin/get_transactions?email=User@Example.com")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert [tx["id"] for tx in response.json] == [1, 2, 3, 4, 5]
+    assert response.json[0] == {"id": 1, "date": "02.01.2025", "amount": "-1.50", "description": "Tx 1"}
+    assert mock_rows.call_args == (("user@example.com",), {"descending": False})
+
+
+def test_get_transactions_page_with_filters(client):
+    with patch("app.iter_transaction_rows", return_value=iter(transaction_rows(3))) as mock_rows:
+        response = client.get("/admin/get_transactions?email=user@example.com&limit=2&order=desc"
+                              "&start=01.01.2025&type=DRINKS&type=6&fields=id,type"
+                              "&cursor=2025-03-01_17")
+
+    assert response.status_code == 200
+    assert response.json == {
+        "transactions": [{"id": 1, "type": 2}, {"id": 2, "type": 2}],
+        "next_cursor": "2025-01-03_2"
+    }
+    assert mock_rows.call_args[1] == {
+        "limit": 3,
+        "descending": True,
+        "start": datetime.date(2025, 1, 1),
+        "types": [2, 6],
+        "after": (datetime.date(2025, 3, 1), 17)
+    }
+
+
+def test_get_transactions_last_page(client):
+    with patch("app.iter_transaction_rows", return_value=iter(transaction_rows(2))):
+        response = client.get("/admin/get_transactions?email=user@example.com&limit=2")
+
+    assert len(response.json["transactions"]) == 2
+    assert response.json["next_cursor"] is None
+
+
+@pytest.mark.parametrize("query", [
+    "limit=0", "limit=abc", "cursor=yesterday", "start=2025-01-01", "type=BEER", "fields=id,password"
+])
+def test_get_transactions_invalid_parameters(client, query):
+    with patch("app.iter_transaction_rows") as mock_rows:
+        response = client.get(f"/admin/get_transactions?email=user@example.com&{query}")
+
+    assert response.status_code == 400
+    mock_rows.assert_not_called()
 
 
 def test_get_transactions_missing_email(client):
@@ -1085,7 +1368,96 @@ def test_get_transactions_missing_email(client):
 
 
 def test_get_transactions_exception(client):
-    with patch("app.load_transactions_by_email", side_effect=Exception("DB error")):
+    with patch("app.iter_transaction_rows", side_effect=Exception("DB error")):
         response = client.get("/admin/get_transactions?email=user@example.com")
         assert response.status_code == 500
         assert b"db error" in response.data.lower()
+
+
+# ROUTE: GET /admin/export/transactions.<format>
+
+def test_export_transactions_csv(client):
+    rows = [(1, "a@example.com", datetime.date(2025, 5, 1), 2, "Pils", Decimal("-1.04"), Decimal("-1.04"))]
+    with patch("app.iter_ledger_rows", return_value=iter(rows)) as mock_rows:
+        response = client.get("/admin/export/transactions.csv?email=A@Example.com&start=01.05.2025&type=DRINKS")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert "attachment" in response.headers["Content-Disposition"]
+    assert "1;a@example.com;01.05.2025;Getränkeabrechnung;Pils;-1,04;-1,04" in response.get_data(as_text=True)
+    assert mock_rows.call_args == (("a@example.com",), {"start": datetime.date(2025, 5, 1), "types": [2]})
+
+
+def test_export_transactions_xlsx_empty(client):
+    with patch("app.iter_ledger_rows", return_value=iter([])) as mock_rows:
+        response = client.get("/admin/export/transactions.xlsx")
+
+    assert response.status_code == 200
+    assert response.data.startswith(b"PK")
+    assert mock_rows.call_args == ((None,), {})
+
+
+def test_export_transactions_unknown_format(client):
+    response = client.get("/admin/export/transactions.pdf")
+    assert response.status_code == 404
+
+
+def test_export_transactions_invalid_filter(client):
+    with patch("app.iter_ledger_rows") as mock_rows:
+        response = client.get("/admin/export/transactions.csv?end=2025-01-01")
+    assert response.status_code == 400
+    mock_rows.assert_not_called()
+
+
+def test_export_transactions_db_error(client):
+    with patch("app.iter_ledger_rows", side_effect=Exception("DB error")):
+        response = client.get("/admin/export/transactions.csv")
+    assert response.status_code == 500
+
+
+# CLI: flask send-reports
+
+def test_send_reports_command():
+    runner = app.test_cli_runner()
+    with patch("app.load_members_with_debt", return_value=[]), \
+            patch("app.send_bulk_report_emails", return_value={"sent": ["a@example.com"], "failed": []}) as mock_send:
+        result = runner.invoke(args=["send-reports", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "Sent 1 report(s), 0 failed" in result.output
+    assert mock_send.call_args[1]["dry_run"] is True
+
+
+def test_send_reports_command_failures_exit_nonzero():
+    runner = app.test_cli_runner()
+    with patch("app.load_members_with_debt", return_value=[]), \
+            patch("app.send_bulk_report_emails", return_value={"sent": [], "failed": [("a@example.com", "x")]}):
+        result = runner.invoke(args=["send-reports"])
+
+    assert result.exit_code == 1
+    assert "a@example.com" in result.output
+
+
+# CLI: flask rebuild-balances
+
+def test_rebuild_balances_command():
+    runner = app.test_cli_runner()
+    with patch("app.verify_monthly_balances", return_value=[]), \
+            patch("app.rebuild_monthly_balances", return_value=12) as mock_rebuild:
+        result = runner.invoke(args=["rebuild-balances"])
+
+    assert result.exit_code == 0
+    assert "12" in result.output
+    mock_rebuild.assert_called_once()
+
+
+def test_rebuild_balances_verify_only_reports_mismatch():
+    runner = app.test_cli_runner()
+    mismatch = [("a@example.com", datetime.date(2025, 5, 1), Decimal("-1.00"), Decimal("-2.00"))]
+    with patch("app.verify_monthly_balances", return_value=mismatch), \
+            patch("app.rebuild_monthly_balances") as mock_rebuild:
+        result = runner.invoke(args=["rebuild-balances", "--verify-only"])
+
+    assert result.exit_code == 1
+    assert "a@example.com 2025-05" in result.output
+    mock_rebuild.assert_not_called()
@@ -0,0 +1,320 @@
+import socketserver
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import jobs_db
+from services.job_queue import JobQueue, current_job_id
+from services.report_sender import send_report_email
+from tests.conftest import FakeCursor
+
+
+class InMemoryJobs:
+    """Replaces the jobs table for the queue tests."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def create_job(self, job_type, payload):
+        with self.lock:
+            job_id = len(self.jobs) + 1
+            self.jobs[job_id] = {"job_type": job_type, "payload": payload, "status": "queued", "attempts": 0}
+            return job_id
+
+    def claim_job(self, job_id):
+        with self.lock:
+            job = self.jobs[job_id]
+            if job["status"] != "queued":
+                return None
+            job["status"] = "running"
+            job["attempts"] += 1
+            return job["job_type"], job["payload"]
+
+    def finish_job(self, job_id, result=None):
+        self.jobs[job_id].update(status="done", result=result)
+
+    def fail_job(self, job_id, error):
+        self.jobs[job_id].update(status="failed", error=error)
+
+    def heartbeat_jobs(self, job_ids):
+        for job_id in job_ids:
+            self.jobs[job_id]["heartbeats"] = self.jobs[job_id].get("heartbeats", 0) + 1
+
+    def requeue_stale_jobs(self, stale_after, max_attempts=3):
+        return [job_id for job_id, job in self.jobs.items() if job["status"] == "queued"]
+
+
+@pytest.fixture
+def jobs():
+    store = InMemoryJobs()
+    with patch.multiple("services.job_queue.jobs_db",
+                        create_job=store.create_job,
+                        claim_job=store.claim_job,
+                        finish_job=store.finish_job,
+                        fail_job=store.fail_job,
+                        heartbeat_jobs=store.heartbeat_jobs,
+                        requeue_stale_jobs=store.requeue_stale_jobs):
+        yield store
+
+
+def test_submit_returns_id_and_runs_in_background(jobs):
+    queue = JobQueue(max_workers=2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_handler(payload):
+        started.set()
+        release.wait(5)
+        return {"echo": payload["value"]}
+
+    queue.register("slow", slow_handler)
+    job_id = queue.submit("slow", {"value": 3})
+
+    assert started.wait(5)
+    assert jobs.jobs[job_id]["status"] == "running"
+    release.set()
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["status"] == "done"
+    assert jobs.jobs[job_id]["result"] == {"echo": 3}
+
+
+def test_failed_job_stores_error(jobs):
+    queue = JobQueue()
+    queue.register("broken", MagicMock(side_effect=RuntimeError("SMTP down")))
+
+    job_id = queue.submit("broken")
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["status"] == "failed"
+    assert jobs.jobs[job_id]["error"] == "SMTP down"
+
+
+def test_unknown_job_type_is_rejected(jobs):
+    with pytest.raises(ValueError):
+        JobQueue().submit("missing")
+    assert jobs.jobs == {}
+
+
+def test_job_runs_only_once(jobs):
+    queue = JobQueue()
+    handler = MagicMock(return_value=None)
+    queue.register("once", handler)
+    job_id = jobs.create_job("once", {})
+
+    assert queue.run(job_id) is True
+    assert queue.run(job_id) is False
+    handler.assert_called_once()
+
+
+def wait_for_status(jobs, job_id, status):
+    deadline = time.monotonic() + 5
+    while jobs.jobs[job_id]["status"] != status and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_pending_jobs_are_recovered_on_start(jobs):
+    leftover = jobs.create_job("mail", {"n": 1})
+    handler = MagicMock(return_value=None)
+    queue = JobQueue()
+    queue.register("mail", handler)
+
+    queue.start()
+    wait_for_status(jobs, leftover, "done")
+    queue.shutdown()
+
+    assert jobs.jobs[leftover]["status"] == "done"
+    handler.assert_called_once_with({"n": 1})
+
+
+def test_jobs_queued_elsewhere_are_recovered_periodically(jobs):
+    handler = MagicMock(return_value=None)
+    queue = JobQueue(stale_after=0.2)
+    queue.register("mail", handler)
+    queue.start()
+
+    job_id = jobs.create_job("mail", {})
+    wait_for_status(jobs, job_id, "done")
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["status"] == "done"
+    handler.assert_called_once()
+
+
+def test_start_is_idempotent(jobs):
+    queue = JobQueue()
+
+    queue.start()
+    executor = queue._executor
+    queue.start()
+    started_twice = queue._executor is not executor
+    queue.shutdown()
+
+    assert executor is not None
+    assert not started_twice
+
+
+def test_handler_sees_current_job_id(jobs):
+    queue = JobQueue()
+    queue.register("mail", lambda payload: {"job_id": current_job_id()})
+
+    job_id = queue.submit("mail")
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["result"] == {"job_id": job_id}
+    assert current_job_id() is None
+
+
+def test_running_job_sends_heartbeats(jobs):
+    queue = JobQueue(stale_after=0.2)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_handler(payload):
+        started.set()
+        release.wait(5)
+
+    queue.register("slow", slow_handler)
+    job_id = queue.submit("slow")
+
+    assert started.wait(5)
+    deadline = time.monotonic() + 5
+    while jobs.jobs[job_id].get("heartbeats", 0) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["heartbeats"] >= 2
+    assert jobs.jobs[job_id]["status"] == "done"
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    """Minimal local SMTP server that records received messages."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.messages = []
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost stand-in")
+        recipients, data = [], None
+        for raw in self.rfile:
+            line = raw.decode().rstrip("\r\n")
+            if data is not None:
+                if line == ".":
+                    self.server.messages.append((recipients, "\n".join(data)))
+                    recipients, data = [], None
+                    self.reply("250 OK")
+                else:
+                    data.append(line)
+                continue
+
+            command = line[:4].upper()
+            if command == "RCPT":
+                recipients.append(line.split(":", 1)[1].strip(" <>"))
+            if command == "DATA":
+                data = []
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_report_mail_job_against_local_smtp(jobs, smtp_server, tmp_path):
+    template = tmp_path / "report.html"
+    template.write_text("<p>{{ title }} {{ last_name }}: {{ balance }}</p>", encoding="utf-8")
+
+    member = MagicMock(email="member@example.com", title="CB", last_name="Muster")
+    member.get_balance.return_value = Decimal("-12.50")
+    member.get_transactions.return_value = [
+        MagicMock(date=date(2025, 5, 1), amount=Decimal("-12.50"), description="Getränke")
+    ]
+
+    def send_report_job(payload):
+        send_report_email(member, "kasse@example.com", "", "", str(template),
+                          smtp_server="127.0.0.1", smtp_port=smtp_server.server_address[1], use_ssl=False)
+        return {"email": payload["email"]}
+
+    queue = JobQueue()
+    queue.register("send_report", send_report_job)
+    job_id = queue.submit("send_report", {"email": "member@example.com"})
+    queue.shutdown()
+
+    assert jobs.jobs[job_id]["status"] == "done"
+    assert len(smtp_server.messages) == 1
+    recipients, body = smtp_server.messages[0]
+    assert recipients == ["member@example.com"]
+    assert "Subject: Kontostand vom" in body
+
+
+def test_claim_job_is_conditional_update():
+    cursor = FakeCursor([("send_report", {"email": "a@example.com"})])
+
+    with patch("services.jobs_db.get_cursor", return_value=cursor):
+        assert jobs_db.claim_job(3) == ("send_report", {"email": "a@example.com"})
+
+    query, params = cursor.queries[0]
+    assert "set status = 'running'" in query
+    assert "where id = %s and status = 'queued'" in query
+    assert params == (3,)
+
+
+def test_requeue_only_jobs_without_recent_heartbeat():
+    cursor = FakeCursor([(4,)])
+
+    with patch("services.jobs_db.get_cursor", return_value=cursor):
+        assert jobs_db.requeue_stale_jobs(600) == [4]
+
+    query, params = cursor.queries[1]
+    assert "set status = 'queued'" in query
+    assert "coalesce(heartbeat_at, started_at) < current_timestamp - make_interval(secs => %s)" in query
+    assert params == (600,)
+
+
+def test_requeue_fails_jobs_out_of_attempts_first():
+    cursor = FakeCursor([])
+
+    with patch("services.jobs_db.get_cursor", return_value=cursor):
+        assert jobs_db.requeue_stale_jobs(600, max_attempts=2) == []
+
+    query, params = cursor.queries[0]
+    assert "set status = 'failed'" in query
+    assert "attempts >= %s" in query
+    assert params == (2, 600)
+
+
+def test_load_job_deliveries():
+    cursor = FakeCursor([("a@example.com",), ("b@example.com",)])
+
+    with patch("services.jobs_db.get_cursor", return_value=cursor):
+        assert jobs_db.load_job_deliveries(4) == {"a@example.com", "b@example.com"}
+
+    assert cursor.queries[0][1] == (4,)
+
+
+def test_load_job_not_found():
+    with patch("services.jobs_db.get_cursor", return_value=FakeCursor()):
+        assert jobs_db.load_job(1) is None
@@ -0,0 +1,60 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from services import ledger_db
+from tests.conftest import FakeCursor
+
+
+def test_apply_ledger_deltas_groups_by_month():
+    cur = FakeCursor()
+    ledger_db.apply_ledger_deltas(cur, [
+        ("a@example.com", date(2025, 5, 3), Decimal("-1.50")),
+        ("a@example.com", date(2025, 5, 20), Decimal("-2.00")),
+        ("b@example.com", date(2025, 6, 1), Decimal("4.00")),
+    ])
+
+    assert len(cur.queries) == 1
+    query, params = cur.queries[0]
+    assert "on conflict (member_email, month)" in query
+    assert params == [
+        "a@example.com", date(2025, 5, 1), Decimal("-3.50"),
+        "b@example.com", date(2025, 6, 1), Decimal("4.00"),
+    ]
+
+
+def test_apply_ledger_deltas_skips_zero_sum():
+    cur = FakeCursor()
+    ledger_db.apply_ledger_deltas(cur, [
+        ("a@example.com", date(2025, 5, 3), Decimal("-1.50")),
+        ("a@example.com", date(2025, 5, 9), Decimal("1.50")),
+    ])
+    assert cur.queries == []
+
+
+def test_load_balance_at_splits_snapshot_and_tail():
+    cur = FakeCursor([(Decimal("-42.10"),)])
+
+    with patch("services.ledger_db.get_cursor", return_value=cur):
+        result = ledger_db.load_balance_at("a@example.com", date(2025, 5, 17))
+
+    assert result == Decimal("-42.10")
+    query, params = cur.queries[0]
+    assert "from monthly_balances" in query
+    assert params == ("a@example.com", date(2025, 5, 1), "a@example.com", date(2025, 5, 1), date(2025, 5, 17))
+
+
+def test_rebuild_monthly_balances():
+    cur = FakeCursor(rowcount=3)
+
+    with patch("services.ledger_db.get_cursor", return_value=cur):
+        assert ledger_db.rebuild_monthly_balances() == 3
+
+    assert any("delete from monthly_balances" in q for q, _ in cur.queries)
+    assert any("insert into monthly_balances" in q for q, _ in cur.queries)
+
+
+def test_verify_monthly_balances_returns_mismatches():
+    mismatch = [("a@example.com", date(2025, 5, 1), Decimal("-1.00"), Decimal("-2.00"))]
+
+    with patch("services.ledger_db.get_cursor", return_value=FakeCursor(mismatch)):
+        assert ledger_db.verify_monthly_balances() == mismatch
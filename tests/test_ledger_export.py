@@ -0,0 +1,113 @@
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+from services import ledger_export, transactions_db
+
+SHEET_NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+ROWS = [
+    (1, "a@example.com", date(2025, 5, 1), 2, "Getränke; 2x Pils", Decimal("-2.08"), Decimal("-2.08")),
+    (2, "a@example.com", date(2025, 5, 3), 3, 'Überweisung "Mai" <&>', Decimal("50.00"), Decimal("47.92")),
+]
+
+
+def test_csv_export():
+    text = "".join(ledger_export.iter_ledger_csv(iter(ROWS)))
+
+    lines = text.lstrip("\ufeff").split("\r\n")
+    assert text.startswith("\ufeff")
+    assert lines[0] == "ID;E-Mail;Datum;Typ;Beschreibung;Betrag;Kontostand"
+    assert lines[1] == '1;a@example.com;01.05.2025;Getränkeabrechnung;"Getränke; 2x Pils";-2,08;-2,08'
+    assert lines[2] == '2;a@example.com;03.05.2025;Gutschrift;"Überweisung ""Mai"" <&>";50,00;47,92'
+
+
+def test_csv_export_escapes_formulas():
+    rows = [(3, "a@example.com", date(2025, 5, 4), 5, description, Decimal("1.00"), Decimal("1.00"))
+            for description in ("=HYPERLINK(\"http://x\")", "+1", "-1", "@SUM(A1)", "Pils")]
+
+    lines = "".join(ledger_export.iter_ledger_csv(iter(rows))).split("\r\n")[1:6]
+
+    assert [line.split(";")[4] for line in lines] == ['"\'=HYPERLINK(""http://x"")"', "'+1", "'-1", "'@SUM(A1)", "Pils"]
+
+
+def test_csv_export_is_chunked():
+    with patch("services.ledger_export.EXPORT_BATCH_ROWS", 1):
+        chunks = list(ledger_export.iter_ledger_csv(iter(ROWS)))
+    assert len(chunks) == 3
+
+
+def test_xlsx_export_is_valid_workbook():
+    data = b"".join(ledger_export.iter_ledger_xlsx(iter(ROWS)))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+        assert workbook.testzip() is None
+        assert "xl/styles.xml" in workbook.namelist()
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+
+    rows = sheet.findall("s:sheetData/s:row", SHEET_NS)
+    assert len(rows) == 3
+    header = [cell.findtext("s:is/s:t", namespaces=SHEET_NS) for cell in rows[0]]
+    assert header == list(ledger_export.EXPORT_HEADER)
+
+    cells = list(rows[2])
+    assert cells[0].findtext("s:v", namespaces=SHEET_NS) == "2"
+    assert cells[2].findtext("s:v", namespaces=SHEET_NS) == str((date(2025, 5, 3) - date(1899, 12, 30)).days)
+    assert cells[4].findtext("s:is/s:t", namespaces=SHEET_NS) == 'Überweisung "Mai" <&>'
+    assert cells[6].findtext("s:v", namespaces=SHEET_NS) == "47.92"
+
+
+def test_xlsx_export_streams_in_chunks():
+    rows = [(i, "a@example.com", date(2025, 1, 1), 1, "x", Decimal("1.00"), Decimal(i)) for i in range(50)]
+    with patch("services.ledger_export.EXPORT_BATCH_ROWS", 10):
+        chunks = list(ledger_export.iter_ledger_xlsx(iter(rows)))
+
+    assert len(chunks) > 3
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as workbook:
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    assert len(sheet.findall("s:sheetData/s:row", SHEET_NS)) == 51
+
+
+class LedgerCursor:
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((" ".join(query.lower().split()), params))
+
+    def __iter__(self): return iter(ROWS)
+
+    def __enter__(self): return self
+
+    def __exit__(self, *args): pass
+
+
+def test_iter_ledger_rows_with_opening_balance():
+    cursor = LedgerCursor()
+
+    with patch("services.transactions_db.get_cursor", return_value=cursor) as get_cursor:
+        rows = list(transactions_db.iter_ledger_rows("A@Example.com", start=date(2025, 1, 1), types=[2]))
+
+    assert rows == ROWS
+    assert get_cursor.call_args[1]["name"]
+    query, params = cursor.queries[0]
+    assert "where date < %(start)s group by member_email" in query
+    assert "sum(t.amount) over (partition by t.member_email order by t.date, t.id)" in query
+    assert "where transaction_type = any(%(types)s)" in query
+    assert query.endswith("order by member_email, date, id")
+    assert params["email"] == "a@example.com"
+    assert params["types"] == [2]
+
+
+def test_iter_ledger_rows_all_members():
+    cursor = LedgerCursor()
+
+    with patch("services.transactions_db.get_cursor", return_value=cursor):
+        list(transactions_db.iter_ledger_rows())
+
+    query, params = cursor.queries[0]
+    assert "opening" not in query
+    assert "t.member_email = %(email)s" not in query
@@ -1,6 +1,11 @@
 from datetime import datetime, timedelta
 from unittest.mock import patch
-from services.logging_db import log_title_change, log_residency_change, log_transaction_change
+from services.logging_db import (
+    log_title_change,
+    log_residency_change,
+    log_transaction_change,
+    log_transaction_changes
+)
 
 
 def test_log_transaction_change():
@@ -106,3 +111,28 @@ def test_log_residency_change_skips_if_same(monkeypatch):
 
     monkeypatch.setattr("services.logging_db.get_cursor", lambda: FakeCursor())
     log_residency_change("test@example.com", True, "admin@example.com")
+
+
+def test_log_transaction_changes_single_statement():
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    entries = [(1, "create", "admin@example.com", "a"), (2, "create", "admin@example.com", "b")]
+
+    with patch("services.logging_db.get_cursor", return_value=FakeCursor()), \
+            patch("services.logging_db.execute_values") as mock_values:
+        log_transaction_changes(entries)
+
+    mock_values.assert_called_once()
+    assert "insert into transaction_change_log" in mock_values.call_args[0][1].lower()
+    assert mock_values.call_args[0][2] == entries
+
+
+def test_log_transaction_changes_empty():
+    with patch("services.logging_db.get_cursor") as mock_cursor:
+        log_transaction_changes([])
+    mock_cursor.assert_not_called()
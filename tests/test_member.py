@@ -15,21 +15,34 @@ def test_create_member():
     assert m.start_balance == Decimal("10.00")
 
 
-def test_get_balance_at_excludes_future(monkeypatch, sample_member):
+def test_get_balance_at_excludes_future(sample_member):
     today = date.today()
-    monkeypatch.setattr(sample_member, "get_transactions", lambda: [
+    with patch("models.member.load_transactions_by_email", return_value=[
         type("Tx", (), {"amount": Decimal("10.0"), "date": today}),
         type("Tx", (), {"amount": Decimal("999.0"), "date": today.replace(year=today.year + 1)}),
-    ])
-    assert sample_member.get_balance_at(today) == Decimal("10.00")
+    ]):
+        sample_member.get_transactions()
+        assert sample_member.get_balance_at(today) == Decimal("10.00")
 
 
-def test_get_balance_with_transactions(monkeypatch, sample_member):
-    monkeypatch.setattr(sample_member, "get_transactions", lambda: [
+def test_get_balance_with_transactions(sample_member):
+    with patch("models.member.load_transactions_by_email", return_value=[
         type("Tx", (), {"amount": Decimal("-10.0"), "date": date.today()}),
         type("Tx", (), {"amount": Decimal("5.0"), "date": date.today()}),
-    ])
-    assert sample_member.get_balance() == Decimal("-5.00")
+    ]):
+        sample_member.get_transactions()
+        assert sample_member.get_balance() == Decimal("-5.00")
+
+
+def test_get_balance_at_uses_snapshots_without_cached_ledger(sample_member):
+    sample_member.start_balance = Decimal("2.00")
+
+    with patch("models.member.load_balance_at", return_value=Decimal("-7.50")) as mock_lookup, \
+            patch("models.member.load_transactions_by_email") as mock_load:
+        assert sample_member.get_balance_at(date(2025, 5, 1)) == Decimal("-5.50")
+
+    mock_lookup.assert_called_once_with(sample_member.email, date(2025, 5, 1))
+    mock_load.assert_not_called()
 
 
 def test_get_title_enum(sample_member):
@@ -183,3 +196,64 @@ def test_get_last_credit_date_none(monkeypatch, sample_member):
         type("Tx", (), {"type": 4, "date": date(2024, 1, 1)}),
     ])
     assert sample_member.get_last_credit_date() is None
+
+
+def test_get_transactions_is_cached(sample_member):
+    with patch("models.member.load_transactions_by_email", return_value=[]) as mock_load:
+        sample_member.get_transactions()
+        sample_member.get_balance()
+        sample_member.get_balance_at(date(2024, 1, 1))
+        sample_member.get_last_credit_date()
+
+    mock_load.assert_called_once_with(sample_member.email)
+
+
+def test_get_transactions_reloads_after_ledger_change(sample_member):
+    with patch("models.member.load_transactions_by_email", return_value=[]) as mock_load:
+        sample_member.get_transactions()
+        models.member.Transaction.mark_ledger_changed(sample_member.email.upper())
+        sample_member.get_transactions()
+
+    assert mock_load.call_count == 2
+
+
+def test_create_transaction_invalidates_cache(sample_member):
+    class FakeTransaction:
+        def __init__(self, **kwargs): pass
+
+        def save(self, changed_by): pass
+
+    with patch("models.member.load_transactions_by_email", return_value=[]) as mock_load, \
+            patch("models.member.Transaction", FakeTransaction):
+        sample_member._transactions_version = 0
+        sample_member._transactions = []
+        sample_member.create_transaction(date(2025, 5, 1), "Entry", Decimal("1.00"), "admin@example.com")
+
+    assert sample_member._transactions is None
+    mock_load.assert_not_called()
+
+
+def test_prefetch_transactions_single_query():
+    members = [
+        models.member.Member("a@example.com", "A", start_balance=Decimal("1.00")),
+        models.member.Member("b@example.com", "B")
+    ]
+    ledgers = {
+        "a@example.com": [
+            models.member.Transaction(date(2020, 1, 1), "Getränke", Decimal("-3.00"), "a@example.com")
+        ],
+        "b@example.com": [],
+    }
+
+    with patch("models.member.load_transactions_for_members", return_value=ledgers) as mock_load, \
+            patch("models.member.load_transactions_by_email") as mock_single, \
+            patch("models.member.load_balance_at") as mock_balance:
+        models.member.Member.prefetch_transactions(members)
+        balances = [m.get_balance() for m in members]
+        transactions = [m.get_transactions() for m in members]
+
+    mock_load.assert_called_once()
+    mock_single.assert_not_called()
+    mock_balance.assert_not_called()
+    assert balances == [Decimal("-2.00"), Decimal("0.00")]
+    assert len(transactions[0]) == 1 and transactions[1] == []
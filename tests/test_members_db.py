@@ -0,0 +1,100 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from services import members_db
+from tests.conftest import FakeCursor
+
+
+ROWS = [
+    ("a@example.com", "Albrecht", "Anna", "CB", True, date(2023, 1, 1), Decimal("5.00")),
+    ("b@example.com", "Berger", None, "F", False, date(2024, 2, 1), Decimal("0.00")),
+]
+
+
+def test_load_all_members_single_query():
+    cursor = FakeCursor(ROWS)
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        members = members_db.load_all_members()
+
+    assert len(cursor.queries) == 1
+    assert [m.email for m in members] == ["a@example.com", "b@example.com"]
+    assert members[0].start_balance == Decimal("5.00")
+    assert members[1].first_name == ""
+    assert "where" not in cursor.queries[0][0]
+
+
+def test_load_members_with_filters():
+    cursor = FakeCursor([])
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        members_db.load_members(
+            title=["F", "CB"],
+            is_resident=True,
+            created_from=date(2023, 1, 1),
+            created_to=date(2024, 12, 31)
+        )
+
+    query, params = cursor.queries[0]
+    assert "title = any(%s)" in query
+    assert "is_resident = %s" in query
+    assert "created_at >= %s" in query and "created_at <= %s" in query
+    assert params == [["F", "CB"], True, date(2023, 1, 1), date(2024, 12, 31)]
+
+
+def test_load_members_single_title():
+    cursor = FakeCursor([])
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        members_db.load_members(title="AH")
+
+    assert cursor.queries[0][1] == [["AH"]]
+
+
+def test_load_members_with_debt_single_query():
+    cursor = FakeCursor(ROWS[1:])
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        members = members_db.load_members_with_debt()
+
+    assert len(cursor.queries) == 1
+    assert "sum(t.amount)" in cursor.queries[0][0] and "< 0" in cursor.queries[0][0]
+    assert "t.date <= current_date" in cursor.queries[0][0]
+    assert [m.email for m in members] == ["b@example.com"]
+
+
+def test_load_member_by_email_not_found():
+    with patch("services.members_db.get_cursor", return_value=FakeCursor([])):
+        try:
+            members_db.load_member_by_email("missing@example.com")
+        except ValueError as e:
+            assert "not found" in str(e).lower()
+        else:
+            assert False, "Expected ValueError"
+
+
+def test_normalize_member_emails():
+    cursor = FakeCursor([])
+    cursor.rowcount = 2
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        assert members_db.normalize_member_emails() == 2
+
+    queries = [q for q, _ in cursor.queries]
+    assert any(q.startswith("insert into members") and "lower(email)" in q for q in queries)
+    assert any("update transactions set member_email = lower(member_email)" in q for q in queries)
+    assert any("create index if not exists idx_transactions_email_date" in q for q in queries)
+    assert queries.index(next(q for q in queries if q.startswith("delete from members"))) > \
+        queries.index(next(q for q in queries if q.startswith("update transactions")))
+
+
+def test_normalize_member_emails_rejects_case_duplicates():
+    cursor = FakeCursor([("max@example.com",)])
+
+    with patch("services.members_db.get_cursor", return_value=cursor):
+        try:
+            members_db.normalize_member_emails()
+        except ValueError as e:
+            assert "max@example.com" in str(e)
+        else:
+            assert False, "Expected ValueError"
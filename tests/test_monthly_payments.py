@@ -2,6 +2,7 @@ from datetime import date
 from decimal import Decimal
 from unittest.mock import patch
 from services import monthly_payments
+from models.fee_schedule import FeeSchedule
 from models.transaction import Transaction
 from models.transaction_type import TransactionType
 
@@ -80,8 +81,7 @@ def test_get_missing_monthly_payment_transactions(monkeypatch):
             transaction_type=TransactionType.MONTHLY_FEE
         )
     ])
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_residents", lambda: 15)
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_non_residents", lambda: 0)
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: FeeSchedule([], Decimal("15"), Decimal("0")))
 
     with patch("services.monthly_payments.date") as mock_date:
         mock_date.today.return_value = date(2025, 5, 7)
@@ -104,8 +104,7 @@ def test_missing_monthly_payments_for_non_resident(monkeypatch):
 
     monkeypatch.setattr("services.monthly_payments.load_member_by_email", lambda email: FakeMember())
     monkeypatch.setattr("services.monthly_payments.load_transactions_by_type", lambda e, t: [])
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_residents", lambda: 0)
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_non_residents", lambda: 25)
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: FeeSchedule([], Decimal("0"), Decimal("25")))
 
     with patch("services.monthly_payments.date") as mock_date:
         mock_date.today.return_value = date(2025, 5, 10)
@@ -126,8 +125,7 @@ def test_zero_amount_payment_skipped(monkeypatch):
 
     monkeypatch.setattr("services.monthly_payments.load_member_by_email", lambda email: FakeMember())
     monkeypatch.setattr("services.monthly_payments.load_transactions_by_type", lambda e, t: [])
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_residents", lambda: 0)
-    monkeypatch.setattr("services.monthly_payments.get_monthly_payment_for_non_residents", lambda: 0)
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: FeeSchedule([], Decimal("0"), Decimal("0")))
 
     with patch("services.monthly_payments.date") as mock_date:
         mock_date.today.return_value = date(2025, 5, 1)
@@ -135,3 +133,85 @@ def test_zero_amount_payment_skipped(monkeypatch):
 
         txs = monthly_payments.get_missing_monthly_payment_transactions("test@example.com")
         assert txs == []
+
+
+def test_get_monthly_payment_overview(monkeypatch):
+    class FakeMember:
+        def __init__(self, email, title, is_resident, created_at):
+            self.email = email
+            self.title = title
+            self.is_resident = is_resident
+            self.created_at = created_at
+
+    members = [
+        FakeMember("res@example.com", "CB", True, date(2025, 3, 15)),
+        FakeMember("non@example.com", "F", False, date(2025, 4, 1)),
+        FakeMember("ah@example.com", "AH", True, date(2020, 1, 1)),
+    ]
+    paid = Transaction(
+        transaction_date=date(2025, 4, 1),
+        description="Already Paid",
+        amount=Decimal("-15.00"),
+        member_email="res@example.com",
+        transaction_type=TransactionType.MONTHLY_FEE
+    )
+    calls = []
+
+    def fake_load(emails, type_number):
+        calls.append((list(emails), type_number))
+        return {"res@example.com": [paid], "non@example.com": []}
+
+    monkeypatch.setattr("services.monthly_payments.load_transactions_by_type_for_members", fake_load)
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: FeeSchedule([], Decimal("15"), Decimal("12.50")))
+
+    with patch("services.monthly_payments.date") as mock_date:
+        mock_date.today.return_value = date(2025, 5, 7)
+        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
+
+        overview = monthly_payments.get_monthly_payment_overview(members)
+
+    assert calls == [(["res@example.com", "non@example.com"], TransactionType.MONTHLY_FEE.value)]
+    assert [entry["member"].email for entry in overview] == ["res@example.com", "non@example.com"]
+
+    resident = overview[0]
+    assert resident["existing"] == [paid]
+    assert [tx.date for tx in resident["missing"]] == [date(2025, 3, 1), date(2025, 5, 1)]
+    assert all(tx.amount == Decimal("-15.00") for tx in resident["missing"])
+
+    non_resident = overview[1]
+    assert [tx.date for tx in non_resident["missing"]] == [date(2025, 4, 1), date(2025, 5, 1)]
+    assert non_resident["missing"][0].amount == Decimal("-12.50")
+    assert non_resident["missing"][0].description == "Aktivenbeitrag (April 2025)"
+
+
+def test_get_monthly_payment_overview_zero_fee(monkeypatch):
+    member = type("Member", (), {
+        "email": "a@example.com", "title": "CB", "is_resident": True, "created_at": date(2025, 1, 1)
+    })
+    monkeypatch.setattr("services.monthly_payments.load_transactions_by_type_for_members",
+                        lambda emails, t: {"a@example.com": []})
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: FeeSchedule([], Decimal("0"), Decimal("0")))
+
+    overview = monthly_payments.get_monthly_payment_overview([member])
+
+    assert overview[0]["missing"] == []
+
+
+def test_get_monthly_payment_overview_uses_historical_rates(monkeypatch):
+    member = type("Member", (), {
+        "email": "a@example.com", "title": "CB", "is_resident": True, "created_at": date(2025, 1, 1)
+    })
+    schedule = FeeSchedule([(date(2025, 3, 1), True, Decimal("20.00"))], Decimal("15.00"), Decimal("10.00"))
+    monkeypatch.setattr("services.monthly_payments.load_transactions_by_type_for_members",
+                        lambda emails, t: {"a@example.com": []})
+    monkeypatch.setattr("services.monthly_payments.load_fee_schedule", lambda: schedule)
+
+    with patch("services.monthly_payments.date") as mock_date:
+        mock_date.today.return_value = date(2025, 4, 2)
+        mock_date.side_effect = lambda *args, **kwargs: date(*args, **kwargs)
+
+        overview = monthly_payments.get_monthly_payment_overview([member])
+
+    assert [tx.amount for tx in overview[0]["missing"]] == [
+        Decimal("-15.00"), Decimal("-15.00"), Decimal("-20.00"), Decimal("-20.00")
+    ]
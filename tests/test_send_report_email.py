@@ -1,8 +1,14 @@
+import smtplib
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 from datetime import date
 from decimal import Decimal
-from services.report_sender import send_report_email, format_member_email
+from services.report_sender import (
+    send_report_email,
+    format_member_email,
+    send_bulk_report_emails,
+    SMTPSession
+)
 
 
 class DummyTransaction:
@@ -23,7 +29,22 @@ def fake_member():
     return member
 
 
-def test_format_member_email_success(fake_member):
+@pytest.fixture(autouse=True)
+def no_ledger_prefetch():
+    with patch("services.report_sender.Member.prefetch_transactions") as mock_prefetch:
+        yield mock_prefetch
+
+
+@pytest.fixture
+def write_template(tmp_path):
+    def write(source, name="template.html"):
+        path = tmp_path / name
+        path.write_text(source, encoding="utf-8")
+        return str(path)
+    return write
+
+
+def test_format_member_email_success(fake_member, write_template):
     mock_template = """
     <html>
         <body>
@@ -36,38 +57,30 @@ def test_format_member_email_success(fake_member):
     </html>
     """
 
-    with patch("builtins.open", mock_open(read_data=mock_template)), \
-         patch("os.path.exists", return_value=True):
-
-        html = format_member_email(fake_member, "+49 123 456789", "dummy_template.html")
-        assert "Test" in html
-        assert "10,00 €" in html
-        assert "<table>" in html
+    html = format_member_email(fake_member, "+49 123 456789", write_template(mock_template))
+    assert "Test" in html
+    assert "10,00 €" in html
+    assert "<table>" in html
 
 
-def test_send_email_dry_run(fake_member):
+def test_send_email_dry_run(fake_member, write_template):
     mock_template = "<html>{{title}} {{last_name}}</html>"
 
-    with patch("builtins.open", mock_open(read_data=mock_template)), \
-         patch("os.path.exists", return_value=True):
+    result = send_report_email(
+        fake_member,
+        "sender@example.com",
+        "password",
+        "+49 123 456789",
+        write_template(mock_template),
+        dry_run=True
+    )
+    assert result is False
 
-        result = send_report_email(
-            fake_member,
-            "sender@example.com",
-            "password",
-            "+49 123 456789",
-            "dummy_template.html",
-            dry_run=True
-        )
-        assert result is False
 
+def test_send_email_success(fake_member, write_template):
+    template_path = write_template("<html>{{title}} {{last_name}}</html>")
 
-def test_send_email_success(fake_member):
-    mock_template = "<html>{{title}} {{last_name}}</html>"
-
-    with patch("builtins.open", mock_open(read_data=mock_template)), \
-         patch("os.path.exists", return_value=True), \
-         patch("smtplib.SMTP_SSL") as mock_smtp:
+    with patch("smtplib.SMTP_SSL") as mock_smtp:
 
         mock_server = MagicMock()
         mock_smtp.return_value.__enter__.return_value = mock_server
@@ -77,7 +90,7 @@ def test_send_email_success(fake_member):
             "sender@example.com",
             "password",
             "+49 123 456789",
-            "dummy_template.html"
+            template_path
         )
         assert result is True
         mock_server.login.assert_called_once()
@@ -97,7 +110,131 @@ def test_invalid_email_raises_error(fake_member):
         )
 
 
-def test_missing_template_raises_error(fake_member):
-    with patch("os.path.exists", return_value=False):
+def test_missing_template_raises_error(fake_member, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        format_member_email(fake_member, "+49 123 456789", str(tmp_path / "missing.html"))
+
+
+def make_member(email):
+    member = MagicMock()
+    member.title = "CB"
+    member.last_name = email.split("@")[0]
+    member.email = email
+    member.get_balance.return_value = Decimal("-5.00")
+    member.get_transactions.return_value = [DummyTransaction()]
+    return member
+
+
+def test_send_bulk_reuses_one_login(write_template):
+    members = [make_member(f"m{i}@example.com") for i in range(5)]
+    template_path = write_template("<html>{{last_name}}</html>")
+
+    with patch("smtplib.SMTP_SSL") as mock_smtp:
+        result = send_bulk_report_emails(
+            members, "sender@example.com", "password", "+49 123", template_path
+        )
+
+    server = mock_smtp.return_value
+    assert mock_smtp.call_count == 1
+    server.login.assert_called_once_with("sender@example.com", "password")
+    assert server.sendmail.call_count == 5
+    server.quit.assert_called_once()
+    assert sorted(result["sent"]) == [m.email for m in members]
+    assert result["failed"] == []
+
+
+def test_send_bulk_reports_each_delivery(write_template):
+    members = [make_member("invalid-email"), make_member("ok@example.com")]
+    delivered = []
+
+    with patch("smtplib.SMTP_SSL"):
+        send_bulk_report_emails(
+            members, "sender@example.com", "password", "", write_template("<html></html>"),
+            on_sent=delivered.append
+        )
+
+    assert delivered == ["ok@example.com"]
+
+
+def test_send_bulk_prefetches_ledgers_once(write_template, no_ledger_prefetch):
+    members = [make_member(f"m{i}@example.com") for i in range(20)]
+
+    with patch("smtplib.SMTP_SSL") as mock_smtp:
+        result = send_bulk_report_emails(
+            members, "sender@example.com", "password", "", write_template("{{ balance }}")
+        )
+
+    no_ledger_prefetch.assert_called_once_with(members)
+    assert sorted(result["sent"]) == sorted(m.email for m in members)
+    assert mock_smtp.return_value.sendmail.call_count == 20
+
+
+def test_send_bulk_missing_template_aborts(tmp_path):
+    with patch("smtplib.SMTP_SSL"):
         with pytest.raises(FileNotFoundError):
-            format_member_email(fake_member, "+49 123 456789", "missing.html")
\ No newline at end of file
+            send_bulk_report_emails(
+                [make_member("a@example.com")], "sender@example.com", "password", "",
+                str(tmp_path / "missing.html")
+            )
+
+
+def test_send_bulk_records_invalid_email_and_continues(write_template):
+    members = [make_member("invalid-email"), make_member("ok@example.com")]
+
+    with patch("smtplib.SMTP_SSL") as mock_smtp:
+        result = send_bulk_report_emails(
+            members, "sender@example.com", "password", "", write_template("<html></html>")
+        )
+
+    assert result["sent"] == ["ok@example.com"]
+    assert result["failed"][0][0] == "invalid-email"
+    assert mock_smtp.return_value.sendmail.call_count == 1
+
+
+def test_send_bulk_dry_run_does_not_connect(write_template):
+    with patch("smtplib.SMTP_SSL") as mock_smtp:
+        result = send_bulk_report_emails(
+            [make_member("a@example.com")], "sender@example.com", "password", "",
+            write_template("<html></html>"), dry_run=True
+        )
+
+    mock_smtp.assert_not_called()
+    assert result == {"sent": [], "failed": []}
+
+
+def test_smtp_session_reconnects_after_disconnect():
+    first, second = MagicMock(), MagicMock()
+    first.sendmail.side_effect = smtplib.SMTPServerDisconnected("gone")
+    first.quit.side_effect = smtplib.SMTPServerDisconnected("gone")
+
+    with patch("smtplib.SMTP_SSL", side_effect=[first, second]), patch("time.sleep"):
+        with SMTPSession("sender@example.com", "password") as session:
+            session.send(MagicMock(as_string=lambda: "msg"), "a@example.com")
+            session.send(MagicMock(as_string=lambda: "msg"), "b@example.com")
+
+    assert session.connections == 2
+    first.close.assert_called()
+    assert second.sendmail.call_count == 2
+
+
+def test_smtp_session_gives_up_after_retries():
+    server = MagicMock()
+    server.sendmail.side_effect = smtplib.SMTPDataError(451, "try later")
+
+    with patch("smtplib.SMTP_SSL", return_value=server), patch("time.sleep"):
+        with SMTPSession("sender@example.com", "password", retries=2) as session:
+            with pytest.raises(RuntimeError):
+                session.send(MagicMock(as_string=lambda: "msg"), "a@example.com")
+
+    assert server.sendmail.call_count == 3
+
+
+def test_smtp_session_rate_limit():
+    with patch("smtplib.SMTP_SSL"), \
+         patch("time.sleep") as mock_sleep, \
+         patch("time.monotonic", side_effect=[100.0, 100.5, 100.5, 103.0]):
+        with SMTPSession("sender@example.com", "password", max_per_minute=20) as session:
+            session.send(MagicMock(as_string=lambda: "msg"), "a@example.com")
+            session.send(MagicMock(as_string=lambda: "msg"), "b@example.com")
+
+    mock_sleep.assert_called_once_with(pytest.approx(2.5))
@@ -1,20 +1,76 @@
+from decimal import Decimal
+
+import pytest
+
 from services import settings_loader
 
 
 def test_get_admin_email(monkeypatch):
     monkeypatch.setenv("EMAIL_ADDRESS", "Admin@Example.com")
+    settings_loader.reload_settings()
     assert settings_loader.get_admin_email() == "admin@example.com"
 
 
 def test_get_monthly_payment_for_residents(monkeypatch):
     monkeypatch.setenv("MONTHLY_PAYMENT_RESIDENTS", "17.50")
+    settings_loader.reload_settings()
     result = settings_loader.get_monthly_payment_for_residents()
-    assert isinstance(result, float)
-    assert result == 17.50
+    assert isinstance(result, Decimal)
+    assert result == Decimal("17.50")
 
 
 def test_get_monthly_payment_for_non_residents(monkeypatch):
-    monkeypatch.setenv("MONTHLY_PAYMENT_NON_RESIDENTS", "42.00")
+    monkeypatch.setenv("MONTHLY_PAYMENT_NON_RESIDENTS", "42,00")
+    settings_loader.reload_settings()
     result = settings_loader.get_monthly_payment_for_non_residents()
-    assert isinstance(result, float)
-    assert result == 42.00
+    assert isinstance(result, Decimal)
+    assert result == Decimal("42.00")
+
+
+def test_settings_are_cached_until_reload(monkeypatch):
+    settings = settings_loader.reload_settings()
+    monkeypatch.setenv("MONTHLY_PAYMENT_RESIDENTS", "99")
+
+    assert settings_loader.get_settings() is settings
+    assert settings_loader.get_monthly_payment_for_residents() == Decimal("15.00")
+
+    settings_loader.reload_settings()
+    assert settings_loader.get_monthly_payment_for_residents() == Decimal("99.00")
+
+
+def test_settings_are_read_only():
+    settings = settings_loader.reload_settings()
+    with pytest.raises(AttributeError):
+        settings.monthly_payment_residents = Decimal("1")
+
+
+@pytest.mark.parametrize("value", ["", "abc", "-5", "NaN"])
+def test_invalid_fee_is_rejected(value):
+    with pytest.raises(ValueError, match="MONTHLY_PAYMENT_RESIDENTS"):
+        settings_loader.Settings.from_env({"MONTHLY_PAYMENT_RESIDENTS": value, "MONTHLY_PAYMENT_NON_RESIDENTS": "10"})
+
+
+def test_failed_reload_keeps_previous_settings(monkeypatch):
+    settings = settings_loader.reload_settings()
+    monkeypatch.setenv("MONTHLY_PAYMENT_NON_RESIDENTS", "ten")
+
+    with pytest.raises(ValueError):
+        settings_loader.reload_settings()
+    assert settings_loader.get_settings() is settings
+
+
+def test_admin_email_does_not_need_fee_settings(monkeypatch):
+    monkeypatch.setenv("EMAIL_ADDRESS", "Admin@Example.com")
+    monkeypatch.delenv("MONTHLY_PAYMENT_RESIDENTS")
+    monkeypatch.delenv("MONTHLY_PAYMENT_NON_RESIDENTS")
+
+    assert settings_loader.get_admin_email() == "admin@example.com"
+
+
+def test_init_settings_reports_missing_fee(monkeypatch):
+    monkeypatch.delenv("MONTHLY_PAYMENT_RESIDENTS")
+    monkeypatch.delenv("MONTHLY_PAYMENT_NON_RESIDENTS")
+
+    with pytest.raises(RuntimeError, match="Invalid configuration.*MONTHLY_PAYMENT_RESIDENTS is not set"):
+        settings_loader.init_settings()
+    assert settings_loader._settings is None
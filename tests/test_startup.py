@@ -0,0 +1,56 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from unittest.mock import patch
+
+import pytest
+
+from services import statistics as chart_statistics
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Upper bound for "import app" in seconds; override with STARTUP_BUDGET on slow machines
+STARTUP_BUDGET = float(os.getenv("STARTUP_BUDGET", "3.0"))
+
+# The result goes to a file, so output of the imported modules cannot interfere
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import app
+with open(sys.argv[1], "w") as result:
+    json.dump([time.perf_counter() - started, "matplotlib" in sys.modules], result)
+"""
+
+
+def import_app(tmp_path: Path) -> tuple[float, bool]:
+    """Import app in a fresh interpreter and return (seconds, matplotlib loaded)."""
+    env = dict(os.environ, CHART_WARMUP="false")
+    result = tmp_path / "import_result.json"
+    subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, str(result)], cwd=ROOT, env=env,
+        capture_output=True, check=True
+    )
+    seconds, matplotlib_loaded = json.loads(result.read_text())
+    return seconds, matplotlib_loaded
+
+
+def test_import_app_does_not_load_matplotlib(tmp_path):
+    _, matplotlib_loaded = import_app(tmp_path)
+    assert not matplotlib_loaded
+
+
+# Wall-clock timings depend on the machine, so this only runs on request
+@pytest.mark.skipif(os.getenv("RUN_BENCHMARKS") != "1", reason="startup benchmark, set RUN_BENCHMARKS=1 to run")
+def test_import_app_startup_time(tmp_path):
+    timings = [import_app(tmp_path)[0] for _ in range(3)]
+    assert statistics.median(timings) < STARTUP_BUDGET
+
+
+def test_warm_up_charts_renders_once():
+    with patch("services.statistics.build_debt_chart", return_value=b"png") as mock_build:
+        chart_statistics.warm_up_charts()
+    mock_build.assert_called_once()
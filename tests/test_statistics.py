@@ -0,0 +1,191 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from services import statistics
+
+
+def make_ledger(entries, start_total=Decimal("0.00")):
+    """Build the return value of load_daily_ledger() from (date, Decimal) pairs."""
+    per_day = {}
+    for day, amount in entries:
+        per_day[day] = per_day.get(day, Decimal("0.00")) + amount
+    days = sorted(per_day)
+    return (
+        np.array(days, dtype="datetime64[D]"),
+        np.array([int(per_day[d] * 100) for d in days], dtype=np.int64),
+        int(start_total * 100),
+    )
+
+
+def test_get_period_checkpoints_month():
+    result = statistics.get_period_checkpoints(date(2024, 11, 15), date(2025, 2, 1))
+    assert result == [date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)]
+
+
+def test_get_period_checkpoints_quarter_aligns_down():
+    result = statistics.get_period_checkpoints(date(2024, 5, 20), date(2025, 1, 1), "quarter")
+    assert result == [date(2024, 4, 1), date(2024, 7, 1), date(2024, 10, 1), date(2025, 1, 1)]
+
+
+def test_get_period_checkpoints_semester():
+    result = statistics.get_period_checkpoints(date(2024, 2, 1), date(2025, 4, 1), "semester")
+    assert result == [date(2023, 10, 1), date(2024, 4, 1), date(2024, 10, 1), date(2025, 4, 1)]
+
+
+def test_get_period_checkpoints_unknown_granularity():
+    with pytest.raises(ValueError):
+        statistics.get_period_checkpoints(date(2024, 1, 1), date(2025, 1, 1), "week")
+
+
+def test_format_period_label():
+    assert statistics.format_period_label(date(2025, 3, 1)) == "2025-03"
+    assert statistics.format_period_label(date(2025, 7, 1), "quarter") == "2025-Q3"
+    assert statistics.format_period_label(date(2025, 4, 1), "semester") == "SoSe 2025"
+    assert statistics.format_period_label(date(2024, 10, 1), "semester") == "WiSe 2024/25"
+
+
+def test_calculate_debt_trend_matches_per_checkpoint_sum():
+    entries = [
+        (date(2024, 12, 31), Decimal("-10.00")),
+        (date(2025, 1, 1), Decimal("-5.50")),
+        (date(2025, 1, 15), Decimal("20.00")),
+        (date(2025, 3, 2), Decimal("-1.25")),
+    ]
+    ledger = make_ledger(entries, start_total=Decimal("3.00"))
+
+    with patch("services.statistics.load_daily_ledger", return_value=ledger):
+        labels, totals, deltas = statistics.calculate_debt_trend(date(2025, 1, 1), date(2025, 3, 1))
+
+    assert labels == ["2025-01", "2025-02", "2025-03"]
+    # A transaction dated on the checkpoint itself is included
+    assert totals == [-12.5, 7.5, 7.5]
+    assert deltas == [0.0, 20.0, 0.0]
+
+
+def test_calculate_debt_trend_empty_ledger():
+    with patch("services.statistics.load_daily_ledger", return_value=make_ledger([])):
+        labels, totals, deltas = statistics.calculate_debt_trend(date(2025, 1, 1), date(2025, 2, 1))
+
+    assert labels == ["2025-01", "2025-02"]
+    assert totals == [0.0, 0.0]
+    assert deltas == [0.0, 0.0]
+
+
+def test_calculate_debt_trend_many_transactions_is_fast():
+    first = date(2020, 1, 1)
+    entries = [(first + timedelta(days=i % 2000), Decimal("-1.10")) for i in range(50000)]
+    ledger = make_ledger(entries)
+
+    with patch("services.statistics.load_daily_ledger", return_value=ledger):
+        started = time.perf_counter()
+        _, totals, _ = statistics.calculate_debt_trend(date(2020, 1, 1), date(2026, 1, 1))
+        elapsed = time.perf_counter() - started
+
+    assert totals[-1] == -55000.0
+    assert elapsed < 0.5
+
+
+def test_load_daily_ledger_converts_to_cents():
+    class FakeCursor:
+        def __init__(self):
+            self.results = [
+                [(Decimal("12.34"),)],
+                [(date(2025, 1, 1), Decimal("-1.50")), (date(2025, 1, 2), Decimal("2.00"))],
+            ]
+
+        def execute(self, query, params=None):
+            self.current = self.results.pop(0)
+
+        def fetchone(self): return self.current[0]
+
+        def fetchall(self): return self.current
+
+        def __enter__(self): return self
+
+        def __exit__(self, *args): pass
+
+    with patch("services.statistics.get_cursor", return_value=FakeCursor()):
+        dates, amounts, start_total = statistics.load_daily_ledger()
+
+    assert dates.tolist() == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert amounts.tolist() == [-150, 200]
+    assert start_total == 1234
+
+
+def test_build_debt_chart_returns_png():
+    png = statistics.build_debt_chart(["2025-01", "2025-02"], [-10.0, -12.5], [0.0, -2.5])
+    assert png.startswith(b"\x89PNG")
+
+
+def test_get_debt_chart_caches_by_data_hash():
+    statistics.clear_chart_cache()
+    data = (["2025-01"], [-1.0], [0.0])
+
+    with patch("services.statistics.build_debt_chart", return_value=b"png") as mock_build:
+        first = statistics.get_debt_chart(*data)
+        second = statistics.get_debt_chart(*data)
+        changed = statistics.get_debt_chart(["2025-01"], [-2.0], [0.0])
+
+    assert first == second
+    assert changed[0] != first[0]
+    assert mock_build.call_count == 2
+
+
+def test_get_debt_chart_evicts_least_recently_used():
+    statistics.clear_chart_cache()
+
+    with patch("services.statistics.build_debt_chart", return_value=b"png") as mock_build, \
+            patch("services.statistics.CHART_CACHE_SIZE", 2):
+        statistics.get_debt_chart(["a"], [1.0], [0.0])
+        statistics.get_debt_chart(["b"], [1.0], [0.0])
+        statistics.get_debt_chart(["a"], [1.0], [0.0])
+        statistics.get_debt_chart(["c"], [1.0], [0.0])  # evicts "b"
+        statistics.get_debt_chart(["a"], [1.0], [0.0])
+        statistics.get_debt_chart(["b"], [1.0], [0.0])
+
+    assert mock_build.call_count == 4
+
+
+def test_calculate_debt_trend_breakdown_by_title():
+    class FakeCursor:
+        def __init__(self):
+            self.results = [
+                [("CB", Decimal("10.00")), ("F", Decimal("0.00")), ("AH", Decimal("0.00"))],
+                [
+                    ("CB", date(2025, 1, 10), Decimal("-4.00")),
+                    ("CB", date(2025, 2, 1), Decimal("-1.00")),
+                    ("F", date(2025, 1, 20), Decimal("-2.50")),
+                ],
+            ]
+            self.queries = []
+
+        def execute(self, query, params=None):
+            self.queries.append(" ".join(query.lower().split()))
+            self.current = self.results.pop(0)
+
+        def fetchall(self): return self.current
+
+        def __enter__(self): return self
+
+        def __exit__(self, *args): pass
+
+    cursor = FakeCursor()
+    with patch("services.statistics.get_cursor", return_value=cursor):
+        labels, series = statistics.calculate_debt_trend_breakdown(
+            date(2025, 1, 1), date(2025, 3, 1), "month", "title")
+
+    assert labels == ["2025-01", "2025-02", "2025-03"]
+    assert series["CB"] == ([10.0, 5.0, 5.0], [0.0, -5.0, 0.0])
+    assert series["F"] == ([0.0, -2.5, -2.5], [0.0, -2.5, 0.0])
+    assert series["AH"] == ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+    assert "group by m.title, t.date" in cursor.queries[1]
+
+
+def test_calculate_debt_trend_breakdown_unknown():
+    with pytest.raises(ValueError):
+        statistics.calculate_debt_trend_breakdown(date(2025, 1, 1), date(2025, 2, 1), "month", "color")
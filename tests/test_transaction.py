@@ -6,12 +6,12 @@ from models.transaction_type import TransactionType
 
 
 def test_transaction_save():
-    logs = {}
+    logs = {"executed": []}
     fake_id = 42
 
     class FakeCursor:
         def execute(self, query, params=None):
-            logs["executed"] = (query.strip().lower(), params)
+            logs["executed"].append((query.strip().lower(), params))
 
         def fetchone(self):
             return [fake_id]
@@ -20,6 +20,8 @@ def test_transaction_save():
 
         def __exit__(self, exc_type, exc_val, exc_tb): pass
 
+    version_before = Transaction.ledger_version("test@example.com")
+
     with patch("models.transaction.get_cursor", return_value=FakeCursor()):
         with patch("models.transaction.log_transaction_change") as mock_log:
             tx = Transaction(
@@ -32,17 +34,23 @@ def test_transaction_save():
             tx.save(changed_by="admin@example.com")
 
             assert tx.id == fake_id
-            assert "insert into transactions" in logs["executed"][0]
+            assert Transaction.ledger_version("test@example.com") > version_before
+            assert "insert into transactions" in logs["executed"][0][0]
+            assert "insert into monthly_balances" in logs["executed"][1][0]
+            assert logs["executed"][1][1] == ["test@example.com", date(2025, 5, 1), Decimal("12.34")]
             mock_log.assert_called_once()
             assert "created transaction" in mock_log.call_args[0][3].lower()
 
 
 def test_transaction_update():
-    logs = {}
+    logs = {"executed": []}
 
     class FakeCursor:
         def execute(self, query, params=None):
-            logs["executed"] = (query.strip().lower(), params)
+            logs["executed"].append((query.strip().lower(), params))
+
+        def fetchone(self):
+            return [date(2025, 5, 1), Decimal("10.00")]
 
         def __enter__(self): return self
 
@@ -68,20 +76,29 @@ def test_transaction_update():
 
             assert tx.description == "New description"
             assert tx.amount == Decimal("20.00")
-            assert "update transactions" in logs["executed"][0]
+            assert "update transactions" in logs["executed"][0][0]
+            # Old amount leaves May, new amount enters June
+            ledger_params = [params for query, params in logs["executed"] if "monthly_balances" in query][0]
+            assert ledger_params == [
+                "test@example.com", date(2025, 5, 1), Decimal("-10.00"),
+                "test@example.com", date(2025, 6, 1), Decimal("20.00"),
+            ]
             mock_log.assert_called_once()
             description = mock_log.call_args[0][3]
             assert "manual correction" in description.lower()
 
 
 def test_transaction_delete_success():
-    logs = {"deleted": False}
+    logs = {"queries": []}
 
     class FakeCursor:
         rowcount = 1
 
         def execute(self, query, params=None):
-            logs["query"] = query.strip().lower()
+            logs["queries"].append(query.strip().lower())
+
+        def fetchone(self):
+            return [date(2025, 5, 1), Decimal("5.00")]
 
         def __enter__(self): return self
 
@@ -98,7 +115,8 @@ def test_transaction_delete_success():
             )
             result = tx.delete(changed_by="admin@example.com")
             assert result is True
-            assert "delete from transactions" in logs["query"]
+            assert "delete from transactions" in logs["queries"][0]
+            assert "insert into monthly_balances" in logs["queries"][1]
             mock_log.assert_called_once()
             assert "deleted transaction" in mock_log.call_args.kwargs["description"].lower()
 
@@ -136,3 +154,45 @@ def test_transaction_delete_without_id():
     )
     result = tx.delete(changed_by="admin@example.com")
     assert result is False
+
+
+def test_transaction_save_many():
+    queries = []
+
+    class FakeCursor:
+        def execute(self, query, params=None):
+            queries.append(query.strip().lower())
+
+        def __enter__(self): return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    txs = [
+        Transaction(date(2025, 5, 1), "Drinks A", Decimal("-3.00"), "A@example.com", TransactionType.DRINKS),
+        Transaction(date(2025, 5, 1), "Drinks B", Decimal("-4.50"), "b@example.com", TransactionType.DRINKS),
+    ]
+    version_before = Transaction.ledger_version("a@example.com")
+
+    with patch("models.transaction.get_cursor", return_value=FakeCursor()), \
+            patch("models.transaction.execute_values", return_value=[(10,), (11,)]) as mock_insert, \
+            patch("models.transaction.log_transaction_changes") as mock_log:
+        saved = Transaction.save_many(txs, changed_by="admin@example.com")
+
+    assert [tx.id for tx in saved] == [10, 11]
+    assert saved[0].member_email == "a@example.com"
+    mock_insert.assert_called_once()
+    assert mock_insert.call_args[0][2][1] == ("b@example.com", date(2025, 5, 1), "Drinks B",
+                                               Decimal("-4.50"), TransactionType.DRINKS.value)
+    assert any("insert into monthly_balances" in q for q in queries)
+    mock_log.assert_called_once()
+    assert mock_log.call_args[0][0] == [
+        (10, "create", "admin@example.com", "Created transaction: Drinks A"),
+        (11, "create", "admin@example.com", "Created transaction: Drinks B"),
+    ]
+    assert Transaction.ledger_version("a@example.com") > version_before
+
+
+def test_transaction_save_many_empty():
+    with patch("models.transaction.get_cursor") as mock_cursor:
+        assert Transaction.save_many([], changed_by="admin@example.com") == []
+    mock_cursor.assert_not_called()
@@ -85,3 +85,129 @@ def test_load_transaction_by_id_not_found():
             assert "not found" in str(e).lower()
         else:
             assert False, "Expected ValueError"
+
+
+def test_load_transactions_by_email_normalizes_email():
+    executed = {}
+
+    class FakeCursor:
+        def execute(self, query, params=None):
+            executed["query"], executed["params"] = " ".join(query.lower().split()), params
+
+        def fetchall(self): return [[1, date(2025, 5, 1), "Test", Decimal("1.00"), TransactionType.CUSTOM]]
+
+        def __enter__(self): return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    with patch("services.transactions_db.get_cursor", return_value=FakeCursor()):
+        txs = transactions_db.load_transactions_by_email("  Test@Example.COM ")
+
+    assert "where member_email = %s" in executed["query"]
+    assert "lower(" not in executed["query"]
+    assert executed["params"] == ("test@example.com",)
+    assert txs[0].member_email == "test@example.com"
+
+
+def test_load_transactions_by_type_for_members_groups_rows():
+    mock_rows = [
+        [3, "a@example.com", date(2025, 4, 1), "Fee April", Decimal("-15.00"), 6],
+        [4, "a@example.com", date(2025, 5, 1), "Fee May", Decimal("-15.00"), 6],
+    ]
+    executed = {}
+
+    class FakeCursor:
+        def execute(self, query, params=None): executed["params"] = params
+
+        def fetchall(self): return mock_rows
+
+        def __enter__(self): return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    with patch("services.transactions_db.get_cursor", return_value=FakeCursor()):
+        result = transactions_db.load_transactions_by_type_for_members(
+            ["A@example.com", "b@example.com"], TransactionType.MONTHLY_FEE.value)
+
+    assert executed["params"] == [["a@example.com", "b@example.com"], 6]
+    assert [tx.id for tx in result["a@example.com"]] == [3, 4]
+    assert result["b@example.com"] == []
+
+
+def test_load_transactions_for_members_all_types():
+    executed = {}
+
+    class FakeCursor:
+        def execute(self, query, params=None):
+            executed["query"], executed["params"] = " ".join(query.lower().split()), params
+
+        def fetchall(self):
+            return [[5, "b@example.com", date(2025, 3, 1), "Getränke", Decimal("-2.50"), 2]]
+
+        def __enter__(self): return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+    with patch("services.transactions_db.get_cursor", return_value=FakeCursor()):
+        result = transactions_db.load_transactions_for_members(["a@example.com", "B@example.com"])
+
+    assert "transaction_type =" not in executed["query"]
+    assert executed["params"] == [["a@example.com", "b@example.com"]]
+    assert result["a@example.com"] == []
+    assert result["b@example.com"][0].amount == Decimal("-2.50")
+
+
+def test_load_transactions_by_type_for_members_without_members():
+    with patch("services.transactions_db.get_cursor") as mock_cursor:
+        assert transactions_db.load_transactions_by_type_for_members([], 6) == {}
+    mock_cursor.assert_not_called()
+
+
+class RowCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((" ".join(query.split()), params))
+
+    def fetchall(self): return self.rows
+
+    def __iter__(self): return iter(self.rows)
+
+    def __enter__(self): return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb): pass
+
+
+def test_iter_transaction_rows_page_uses_keyset():
+    rows = [(9, date(2025, 3, 2), "Pils", Decimal("-1.04"), 2)]
+    cursor = RowCursor(rows)
+
+    with patch("services.transactions_db.get_cursor", return_value=cursor) as get_cursor:
+        result = list(transactions_db.iter_transaction_rows(
+            "Test@Example.com", start=date(2025, 1, 1), types=[2], after=(date(2025, 3, 1), 8), limit=50
+        ))
+
+    assert result == rows
+    get_cursor.assert_called_once_with()
+    query, params = cursor.queries[0]
+    assert "(date, id) > (%s, %s)" in query
+    assert query.endswith("ORDER BY date ASC, id ASC LIMIT %s")
+    assert params == ["test@example.com", date(2025, 1, 1), [2], date(2025, 3, 1), 8, 50]
+
+
+def test_iter_transaction_rows_streams_through_named_cursor():
+    rows = [(1, date(2025, 1, 1), "A", Decimal("1.00"), 1), (2, date(2025, 1, 1), "B", Decimal("2.00"), 1)]
+    cursor = RowCursor(rows)
+
+    with patch("services.transactions_db.get_cursor", return_value=cursor) as get_cursor:
+        result = list(transactions_db.iter_transaction_rows("test@example.com", descending=True,
+                                                            after=(date(2025, 2, 1), 5)))
+
+    assert result == rows
+    assert get_cursor.call_args[1]["name"]
+    query, params = cursor.queries[0]
+    assert "(date, id) < (%s, %s)" in query
+    assert query.endswith("ORDER BY date DESC, id DESC")
+    assert params == ["test@example.com", date(2025, 2, 1), 5]
@@ -0,0 +1,136 @@
+from datetime import date
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import psycopg2
+import pytest
+
+import db
+from services import transactions_db
+
+INIT_SQL = Path(__file__).resolve().parent.parent / "init.sql"
+
+
+@pytest.fixture
+def pg_cursor():
+    """
+    Cursor on the configured PostgreSQL database with init.sql applied in a throwaway schema.
+
+    Everything runs in one transaction that is rolled back afterwards.
+    Skips if no database is configured or reachable.
+    """
+    if not db.DB_CONFIG["dbname"]:
+        pytest.skip("No test database configured (DB_NAME)")
+    try:
+        conn = psycopg2.connect(**db.DB_CONFIG, connect_timeout=3)
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"Test database not reachable: {e}")
+
+    cur = conn.cursor()
+    schema = f"test_{uuid.uuid4().hex[:8]}"
+    cur.execute(f"CREATE SCHEMA {schema}; SET LOCAL search_path TO {schema}")
+    cur.execute(INIT_SQL.read_text(encoding="utf-8"))
+
+    try:
+        yield cur
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def capture_query(func, *args):
+    """Run a transactions_db loader against a recording cursor and return its SQL and params."""
+    captured = {}
+
+    class RecordingCursor:
+        def execute(self, query, params=None):
+            captured["query"], captured["params"] = query, params
+
+        def fetchall(self): return []
+
+        def __enter__(self): return self
+
+        def __exit__(self, *args): pass
+
+    with patch("services.transactions_db.get_cursor", return_value=RecordingCursor()):
+        func(*args)
+    return captured["query"], captured["params"]
+
+
+def explain(cur, query, params) -> str:
+    cur.execute("SET LOCAL enable_seqscan = off")
+    cur.execute("EXPLAIN " + query, params)
+    return "\n".join(row[0] for row in cur.fetchall())
+
+
+def seed_ledger(cur):
+    cur.execute("""
+        INSERT INTO members (email, last_name, title, is_resident, created_at)
+        SELECT 'member' || i || '@example.com', 'Member ' || i, 'CB', TRUE, DATE '2020-01-01'
+        FROM generate_series(1, 50) AS i
+    """)
+    cur.execute("""
+        INSERT INTO transactions (member_email, date, description, amount, transaction_type)
+        SELECT 'member' || (i % 50 + 1) || '@example.com', DATE '2020-01-01' + (i % 1500),
+               'Getränke', -1.50, 2
+        FROM generate_series(1, 5000) AS i
+    """)
+    cur.execute("ANALYZE members; ANALYZE transactions")
+
+
+def test_load_transactions_by_email_uses_index(pg_cursor):
+    seed_ledger(pg_cursor)
+    query, params = capture_query(transactions_db.load_transactions_by_email, "Member7@Example.com")
+
+    plan = explain(pg_cursor, query, params)
+
+    assert "idx_transactions_email_date" in plan
+    assert "Seq Scan on transactions" not in plan
+
+
+def test_load_transactions_by_type_uses_index(pg_cursor):
+    seed_ledger(pg_cursor)
+    query, params = capture_query(transactions_db.load_transactions_by_type, "member7@example.com", 6)
+
+    plan = explain(pg_cursor, query, params)
+
+    assert "idx_transactions_email_date" in plan
+    assert "Seq Scan on transactions" not in plan
+
+
+def test_members_reject_mixed_case_email(pg_cursor):
+    with pytest.raises(psycopg2.errors.CheckViolation):
+        pg_cursor.execute("""
+            INSERT INTO members (email, last_name, title, is_resident, created_at)
+            VALUES ('Mixed@Example.com', 'Mixed', 'CB', TRUE, CURRENT_DATE)
+        """)
+
+
+def test_transaction_page_uses_index(pg_cursor):
+    seed_ledger(pg_cursor)
+    query, params = capture_query(
+        lambda *args: list(transactions_db.iter_transaction_rows(*args, after=(date(2023, 1, 1), 5), limit=50)),
+        "member7@example.com"
+    )
+
+    plan = explain(pg_cursor, query, params)
+
+    assert "idx_transactions_email_date" in plan
+    assert "Seq Scan on transactions" not in plan
+
+
+def test_init_sql_backfills_monthly_balances_once(pg_cursor):
+    pg_cursor.execute("""
+        INSERT INTO members (email, last_name, title, is_resident, created_at) VALUES ('a@example.com', 'A', 'F', TRUE, '2024-01-01');
+        INSERT INTO transactions (member_email, date, description, amount)
+        VALUES ('a@example.com', '2024-01-05', 'x', 5), ('a@example.com', '2024-01-20', 'y', -2),
+               ('a@example.com', '2024-03-01', 'z', 7);
+    """)
+
+    # An existing database without snapshots is backfilled, a second run changes nothing
+    pg_cursor.execute(INIT_SQL.read_text(encoding="utf-8"))
+    pg_cursor.execute(INIT_SQL.read_text(encoding="utf-8"))
+
+    pg_cursor.execute("SELECT month, total FROM monthly_balances ORDER BY month")
+    assert pg_cursor.fetchall() == [(date(2024, 1, 1), 3), (date(2024, 3, 1), 7)]